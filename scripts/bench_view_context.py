@@ -0,0 +1,44 @@
+"""Per-call cost of the ViewContext built for every list row and action.
+
+Usage (from the repo root):
+
+    python scripts/bench_view_context.py [number]
+
+Compares a validated ``ViewContext(view=..., object=...)``, as ``cv_get_view_context()``
+builds it, with ``CrudView.cv_get_fast_view_context()``, which the per-row paths use.
+Prints the cost per call; nothing is asserted, timings depend on the machine.
+"""
+
+import sys
+import timeit
+
+import django
+from django.conf import settings
+
+
+def main() -> int:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    settings.configure(
+        INSTALLED_APPS=["django.contrib.auth", "django.contrib.contenttypes", "crud_views"],
+        DATABASES={},
+    )
+    django.setup()
+
+    from django.contrib.auth.models import User
+
+    from crud_views.lib.view import CrudView, ViewContext
+
+    view = CrudView()
+    obj = User(pk=1, username="bench")
+    timings = {
+        "ViewContext(view, object)": lambda: ViewContext(view=view, object=obj),
+        "cv_get_fast_view_context(object)": lambda: view.cv_get_fast_view_context(obj),
+    }
+    for name, call in timings.items():
+        seconds = min(timeit.repeat(call, number=number, repeat=5))
+        print(f"{name:<34} {seconds / number * 1e6:6.2f} us per call")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -10,8 +10,6 @@ from typing import Any
 
 from django.core.checks import CheckMessage
 from django.core.checks import Warning as CheckWarning
-from django.core.exceptions import ObjectDoesNotExist
-from django.http import Http404
 from django.urls import reverse
 from pydantic import BaseModel, field_validator, model_validator
 
@@ -138,7 +136,7 @@ class CrudViewBreadcrumbMixin:
 
     def cv_breadcrumb_get(self) -> Breadcrumb:
         obj = getattr(self, "object", None)
-        context = self.cv_get_view_context(object=obj)
+        context = self.cv_get_fast_view_context(obj)
         viewset = self.cv_viewset
         items: list[BreadcrumbItem] = []
 
@@ -188,8 +186,8 @@ class CrudViewBreadcrumbMixin:
     def _cv_breadcrumb_ancestors(self, context) -> list[BreadcrumbItem]:
         """
         Items for the ancestor chain, innermost ancestor first (caller reverses).
-        Costs one scoped query per ancestor level; results are part of the per-request
-        breadcrumb cache (cv_breadcrumb).
+        The chain comes from cv_get_ancestor_object: one scoped query for the whole chain,
+        shared with the other parent lookups of this request.
         """
         viewset = self.cv_viewset
         items: list[BreadcrumbItem] = []
@@ -219,13 +217,9 @@ class CrudViewBreadcrumbMixin:
             chain_names, chain_values = arg_names[:x], arg_values[:x]
             ancestor_pk = chain_values[-1]
 
-            # scoped fetch: parent.viewset.get_queryset(view) filters by the ancestor's
-            # own parent pks from this view's url kwargs, so a tampered pk combination
-            # 404s instead of leaking a foreign object's label
-            try:
-                ancestor = parent.viewset.get_queryset(view=self).get(pk=ancestor_pk)
-            except ObjectDoesNotExist as err:
-                raise Http404(f"breadcrumb ancestor {parent.viewset.name}={ancestor_pk!r} not found") from err
+            # scoped fetch (cv_get_ancestor_object): the chain is filtered by the url's parent pks,
+            # so a tampered pk combination 404s instead of leaking a foreign object's label
+            ancestor = self.cv_get_ancestor_object(i)
 
             # chain_values is derived element-wise from chain_names (see arg_values above),
             # so both slices are equal-length by construction; strict=True asserts that.
@@ -0,0 +1,306 @@
+"""
+What deleting an object cascades to, without loading the cascade.
+
+Django's Collector (and the admin's NestedObjects) load every instance a delete reaches. For
+the delete confirmation page this is replaced by a walk over the delete relations of the
+models, one level of the cascade at a time:
+
+- the summary is counted per model, with one COUNT query per relation path on subqueries of
+  the previous level; a model reached by several paths is counted once more over all of them,
+  so an object is counted once, as in NestedObjects;
+- the display tree holds at most ``limit`` instances per model, fetched per relation for all
+  shown parents at once. A branch with more instances ends with a TruncatedRelated entry, its
+  size counted with one grouped COUNT per relation;
+- protected objects (PROTECT, RESTRICT) are listed up to ``limit`` per relation.
+
+GenericRelation fields cascade like Django's Collector follows them. RESTRICT is reported as
+protected, also where another cascade path would allow the delete.
+
+The same walk drives chunked_delete(): the cascade is deleted leaves first, in batches of
+primary keys, each batch in its own short transaction. Like Django's Collector, it allows a
+RESTRICT reference to a deleted row if the referencing row is deleted by the cascade, too.
+"""
+
+from collections import defaultdict
+from collections.abc import Callable
+from functools import reduce
+from operator import or_
+from typing import NamedTuple
+
+from django.db import models, transaction
+from django.db.models import CASCADE, PROTECT, RESTRICT, Count, Model, Q, QuerySet
+from django.db.models.deletion import ProtectedError, RestrictedError, get_candidate_relations_to_delete
+from django.utils.translation import gettext as _
+
+MAX_DEPTH = 32  # relation levels walked below the deleted object
+# DB_CASCADE (Django 6.1+) deletes in the database, but deletes all the same
+CASCADES = tuple(c for c in (CASCADE, getattr(models, "DB_CASCADE", None)) if c is not None)
+
+
+class TruncatedRelated:
+    """
+    Stands for the instances of a model left out of a capped display tree or protected list.
+    """
+
+    cv_truncated = True
+
+    def __init__(self, model: type[Model], count: int):
+        self.model = model
+        self.count = count
+
+    def __str__(self):
+        opts = self.model._meta
+        name = opts.verbose_name if self.count == 1 else opts.verbose_name_plural
+        return _("… and %(count)s more %(name)s") % {"count": self.count, "name": name}
+
+    def __repr__(self):
+        return f"TruncatedRelated({self.model.__name__}, {self.count})"
+
+
+def delete_relations(model: type[Model]) -> list[tuple]:
+    """
+    (relation, on_delete) of the relations a delete of model follows or is stopped by.
+    """
+    # SET_NULL, SET_DEFAULT, SET() and DO_NOTHING leave the related rows in place
+    return [
+        (related, related.field.remote_field.on_delete)
+        for related in get_candidate_relations_to_delete(model._meta)
+        if related.field.remote_field.on_delete in (*CASCADES, PROTECT, RESTRICT)
+    ]
+
+
+class Link(NamedTuple):
+    """
+    How the rows of related_model reference their parent rows: related_model.attname holds
+    parent.target, among the rows matching filters.
+    """
+
+    related_model: type[Model]
+    attname: str
+    target: str
+    filters: dict
+
+    @classmethod
+    def from_related(cls, related) -> "Link":
+        """A reverse foreign key (or one-to-one) relation."""
+        field = related.field
+        return cls(related.related_model, field.attname, field.target_field.attname, {})
+
+    @classmethod
+    def from_generic_relation(cls, field) -> "Link":
+        """A GenericRelation, selecting its rows as GenericRelation.bulk_related_objects() does."""
+        return cls(
+            field.related_model,
+            field.object_id_field_name,
+            field.model._meta.pk.attname,
+            {f"{field.content_type_field_name}__pk": field.get_content_type().pk},
+        )
+
+
+def generic_cascades(model: type[Model]) -> list[Link]:
+    """
+    The GenericRelation fields of model, whose rows a delete of model deletes as well.
+    """
+    # like Django's Collector: private fields with bulk_related_objects, without importing contenttypes
+    return [
+        Link.from_generic_relation(field)
+        for field in model._meta.private_fields
+        if hasattr(field, "bulk_related_objects")
+    ]
+
+
+def _related_queryset(link: Link, using: str, parents: QuerySet | list) -> QuerySet:
+    """The related rows of parents, a queryset or a list of instances."""
+    target = link.target
+    keys = parents.values(target) if isinstance(parents, QuerySet) else [getattr(p, target) for p in parents]
+    return link.related_model._base_manager.using(using).filter(**link.filters, **{f"{link.attname}__in": keys})
+
+
+class CappedCollector:
+    """
+    Counts what a delete of obj cascades to and keeps at most limit instances per model for
+    display, see the module docstring.
+    """
+
+    def __init__(self, using: str, limit: int):
+        self.using = using
+        self.limit = limit
+        self.summary: dict[str, int] = defaultdict(int)
+        self.protected: list = []
+        self._shown: dict[type[Model], int] = defaultdict(int)
+        self._children: dict[int, list] = defaultdict(list)
+        self._counted: dict[type[Model], list[tuple[QuerySet, int]]] = defaultdict(list)
+
+    def collect(self, obj: Model):
+        self.root = obj
+        queryset = type(obj)._base_manager.using(self.using).filter(pk=obj.pk)
+        self._walk(type(obj), queryset, [obj], 0)
+        self._count()
+
+    def _walk(self, model: type[Model], queryset: QuerySet, shown: list, depth: int):
+        if depth >= MAX_DEPTH:
+            return
+        links = []
+        for related, on_delete in delete_relations(model):
+            if on_delete not in CASCADES:
+                self._collect_protected(Link.from_related(related), queryset)
+                continue
+            links.append(Link.from_related(related))
+        links.extend(generic_cascades(model))
+        for link in links:
+            related_queryset = _related_queryset(link, self.using, queryset)
+            count = related_queryset.count()
+            if not count:
+                continue
+            if link.related_model is not type(self.root):
+                self._counted[link.related_model].append((related_queryset, count))
+            children = self._collect_shown(link, shown) if shown else []
+            self._walk(link.related_model, related_queryset, children, depth + 1)
+
+    def _count(self):
+        """The summary per model; a model reached by several relation paths counts its distinct rows."""
+        for model, counted in self._counted.items():
+            if len(counted) == 1:
+                count = counted[0][1]
+            else:
+                q = reduce(or_, (Q(pk__in=queryset.values("pk")) for queryset, _count in counted))
+                count = model._base_manager.using(self.using).filter(q).count()
+            self.summary[model._meta.verbose_name] += count
+
+    def _collect_shown(self, link: Link, parents: list) -> list:
+        """Fetch up to the model's remaining budget of related instances of the shown parents."""
+        related_model = link.related_model
+        queryset = _related_queryset(link, self.using, parents)
+        # keys as str: a generic object id column may hold the parent pks as text
+        counts = {str(key): n for key, n in queryset.order_by().values_list(link.attname).annotate(n=Count("pk"))}
+
+        remaining = max(self.limit - self._shown[related_model], 0)
+        children = list(queryset.order_by(link.attname, "pk")[:remaining]) if remaining else []
+        self._shown[related_model] += len(children)
+
+        by_parent = defaultdict(list)
+        for child in children:
+            by_parent[str(getattr(child, link.attname))].append(child)
+        for parent in parents:
+            key = str(getattr(parent, link.target))
+            parent_children = by_parent.get(key, [])
+            self._children[id(parent)].extend(parent_children)
+            missing = counts.get(key, 0) - len(parent_children)
+            if missing > 0:
+                self._children[id(parent)].append(TruncatedRelated(related_model, missing))
+        return children
+
+    def _collect_protected(self, link: Link, queryset: QuerySet):
+        protected_queryset = _related_queryset(link, self.using, queryset)
+        instances = list(protected_queryset.order_by("pk")[: self.limit + 1])
+        self.protected.extend(instances[: self.limit])
+        if len(instances) > self.limit:
+            count = protected_queryset.count()
+            self.protected.append(TruncatedRelated(link.related_model, count - self.limit))
+
+    def nested(self) -> list:
+        """The display tree in the format of NestedObjects.nested()."""
+
+        def _format(items):
+            result = []
+            for item in items:
+                result.append(item)
+                children = self._children.get(id(item))
+                if children:
+                    result.append(_format(children))
+            return result
+
+        return _format([self.root])
+
+
+def delete_plan(obj: Model, using: str) -> list[QuerySet]:
+    """
+    The non-empty cascade querysets of a delete of obj, leaves first (a queryset comes before
+    the querysets of the rows it references). Raises ProtectedError if a PROTECT relation has
+    rows, RestrictedError if a RESTRICT relation has rows the cascade does not delete, as
+    Django's Collector does.
+    """
+    plan, restricted = _delete_plan(obj, using, set())
+    allowed = set()
+    for related, queryset in restricted:
+        # rows deleted through a cascade path of the same delete do not restrict it
+        for planned in plan:
+            if planned.model is queryset.model:
+                queryset = queryset.exclude(pk__in=planned.values("pk"))
+        blocking = list(queryset[:1])
+        if blocking:
+            msg = f"cannot delete {obj!r}: referenced through the RESTRICT foreign key {related.field}"
+            raise RestrictedError(msg, set(blocking))
+        allowed.add(related.field)
+    if allowed:
+        # the allowed rows go before the rows they reference, with their own cascade
+        plan, _restricted = _delete_plan(obj, using, allowed)
+    return plan
+
+
+def _delete_plan(obj: Model, using: str, allowed: set) -> tuple[list[QuerySet], list[tuple]]:
+    """
+    The cascade plan of delete_plan() and the (relation, queryset) of the RESTRICT relations with
+    rows; the RESTRICT relations of the fields in allowed are followed like CASCADE ones.
+    """
+    plan = []
+    restricted = []
+
+    def _walk(model, queryset, depth):
+        if depth >= MAX_DEPTH:
+            return
+        for related, on_delete in delete_relations(model):
+            related_queryset = _related_queryset(Link.from_related(related), using, queryset)
+            if on_delete in CASCADES or related.field in allowed:
+                if related_queryset.exists():
+                    _walk(related.related_model, related_queryset, depth + 1)
+                    plan.append(related_queryset)
+                continue
+            blocking = list(related_queryset[:1])
+            if not blocking:
+                continue
+            if on_delete is RESTRICT:
+                restricted.append((related, related_queryset))
+                continue
+            msg = f"cannot delete {obj!r}: referenced through the PROTECT foreign key {related.field}"
+            raise ProtectedError(msg, set(blocking))
+
+    _walk(type(obj), type(obj)._base_manager.using(using).filter(pk=obj.pk), 0)
+    return plan, restricted
+
+
+def chunked_delete(
+    obj: Model,
+    using: str,
+    batch_size: int,
+    progress: Callable[[int, int], None] | None = None,
+) -> int:
+    """
+    Delete obj and its cascade in batches of at most batch_size rows per model, each batch in
+    its own transaction, leaves first; obj itself is deleted last. Signals are sent as by
+    QuerySet.delete(). progress(deleted, total) is called after each batch.
+
+    The delete is not atomic as a whole: a failure leaves the batches done so far deleted.
+    Returns the number of deleted rows.
+    """
+    plan = delete_plan(obj, using)
+    total = sum(queryset.count() for queryset in plan) + 1
+    deleted = 0
+    for queryset in plan:
+        manager = queryset.model._base_manager.using(using)
+        while True:
+            with transaction.atomic(using=using):
+                pks = list(queryset.order_by().values_list("pk", flat=True)[:batch_size])
+                if pks:
+                    count, _per_model = manager.filter(pk__in=pks).delete()
+            if not pks:
+                break
+            deleted += count
+            if progress is not None:
+                progress(min(deleted, total - 1), total)
+    with transaction.atomic(using=using):
+        count, _per_model = obj.delete(using=using)
+    deleted += count
+    if progress is not None:
+        progress(total, total)
+    return deleted
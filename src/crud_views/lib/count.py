@@ -0,0 +1,154 @@
+"""
+Row counts of paginated list views.
+
+Offset pagination needs the number of rows, an exact COUNT(*) over the filtered queryset by
+default. Two cheaper strategies are available:
+
+- ``"cached"``: the exact count is kept in Django's cache framework for a timeout. Entries are
+  keyed by the compiled count query, i.e. by the model, the filter, the parent and any
+  per-user restriction of the queryset.
+- ``"estimate"``: the planner's row estimate of PostgreSQL (``reltuples`` for an unfiltered
+  table, ``EXPLAIN`` otherwise). Estimates below a threshold, and all counts on other
+  databases, are counted exactly.
+
+Counts that are not exact let pages beyond the counted end through, see CountPaginator.
+"""
+
+import hashlib
+import json
+from typing import NamedTuple
+
+from django.core.cache import caches
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import EmptyPage, Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+
+from crud_views.lib.settings import crud_views_settings
+
+_PREFIX = "cv_count"
+
+
+class ListCount(NamedTuple):
+    value: int
+    estimated: bool = False  # a planner estimate, shown as "about N"
+
+
+def count_sql(queryset: QuerySet) -> tuple[str, tuple] | None:
+    """SQL and params of the unordered queryset; None if it cannot match any row."""
+    try:
+        return queryset.order_by().query.sql_with_params()
+    except EmptyResultSet:
+        return None
+
+
+def exact_count(queryset: QuerySet) -> ListCount:
+    return ListCount(queryset.count())
+
+
+def cached_count(queryset: QuerySet, timeout: int, alias: str | None = None) -> ListCount:
+    sql = count_sql(queryset)
+    if sql is None:
+        return ListCount(0)
+    digest = hashlib.sha256(f"{queryset.db}:{sql[0]}:{sql[1]!r}".encode()).hexdigest()
+    key = f"{_PREFIX}:{digest}"
+    cache = caches[alias or crud_views_settings.list_count_cache_alias]
+    value = cache.get(key)
+    if value is None:
+        value = queryset.count()
+        cache.set(key, value, timeout)
+    return ListCount(value)
+
+
+def planner_estimate(queryset: QuerySet) -> int | None:
+    """The planner's row estimate of queryset; None if there is none (not PostgreSQL, not analyzed)."""
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    query = queryset.query
+    with connection.cursor() as cursor:
+        if not query.where and not query.distinct and not query.combinator:
+            cursor.execute("SELECT reltuples FROM pg_class WHERE oid = %s::regclass", [queryset.model._meta.db_table])
+            row = cursor.fetchone()
+            # -1: never vacuumed or analyzed
+            return int(row[0]) if row and row[0] >= 0 else None
+        sql = count_sql(queryset)
+        if sql is None:
+            return 0
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql[0]}", sql[1])
+        plan = cursor.fetchone()[0]
+        plan = json.loads(plan) if isinstance(plan, str) else plan
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def estimated_count(queryset: QuerySet, threshold: int) -> ListCount:
+    estimate = planner_estimate(queryset)
+    if estimate is None or estimate < threshold:
+        return exact_count(queryset)
+    return ListCount(estimate, estimated=True)
+
+
+def count_queryset(
+    queryset: QuerySet,
+    strategy: str = "exact",
+    cache_timeout: int | None = None,
+    estimate_threshold: int | None = None,
+) -> ListCount:
+    """
+    Count queryset with strategy "exact", "cached" or "estimate"; the timeout and the threshold
+    default to the settings.
+    """
+    if strategy == "cached":
+        timeout = crud_views_settings.list_count_cache_timeout if cache_timeout is None else cache_timeout
+        return cached_count(queryset, timeout)
+    if strategy == "estimate":
+        threshold = crud_views_settings.list_count_estimate_threshold
+        return estimated_count(queryset, threshold if estimate_threshold is None else estimate_threshold)
+    return exact_count(queryset)
+
+
+class CountPaginator(Paginator):
+    """
+    Paginator that takes its count from counter(queryset) -> ListCount. A count that is not
+    exact may be short: pages beyond it are empty instead of invalid.
+    """
+
+    def __init__(self, object_list, per_page, orphans=0, allow_empty_first_page=True, counter=None, exact=True):
+        super().__init__(object_list, per_page, orphans, allow_empty_first_page)
+        self.counter = counter
+        self.exact = exact
+
+    def get_queryset(self) -> QuerySet | None:
+        return self.object_list if isinstance(self.object_list, QuerySet) else None
+
+    @cached_property
+    def list_count(self) -> ListCount:
+        queryset = self.get_queryset()
+        if queryset is None:
+            return ListCount(len(self.object_list))
+        return self.counter(queryset) if self.counter is not None else exact_count(queryset)
+
+    @cached_property
+    def count(self) -> int:
+        return self.list_count.value
+
+    @property
+    def count_estimated(self) -> bool:
+        return self.list_count.estimated
+
+    def validate_number(self, number):
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            # a stale or estimated count must not turn an existing page into a 404
+            if self.exact or int(number) < 1:
+                raise
+            return int(number)
+
+    def page(self, number):
+        if self.exact:
+            return super().page(number)
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        return self._get_page(self.object_list[bottom : bottom + self.per_page], number, self)
@@ -0,0 +1,127 @@
+"""
+Background deletes of objects with a large cascade.
+
+A DeleteView with cv_delete_strategy = "background" does not delete in the (modal) request
+of an authenticated user: it stores a DeleteJob in Django's cache framework and submits
+run_delete_job() to an executor, which deletes with crud_views.lib.cascade.chunked_delete()
+and records the progress on the job. The job is polled at the ViewSet's DeleteProgressView.
+
+The executor is any object with the submit(fn, *args) method of concurrent.futures.Executor,
+CRUD_VIEWS_DELETE_EXECUTOR is the dotted path of its class. The default is a thread pool in
+the web process: jobs are lost when the process exits. The job store must be shared by the
+processes serving the progress view, i.e. not a per-process cache like LocMemCache when
+several processes are run.
+"""
+
+import logging
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+
+from django.apps import apps
+from django.core.cache import caches
+from django.db import connections, transaction
+from django.utils.module_loading import import_string
+from pydantic import BaseModel
+
+from crud_views.lib.cascade import chunked_delete
+from crud_views.lib.settings import crud_views_settings
+
+logger = logging.getLogger(__name__)
+
+_PREFIX = "cv_delete_job"
+
+
+class DeleteJob(BaseModel):
+    id: str
+    user: str | None = None  # pk of the user the job belongs to, as str (int, UUID, ... pks)
+    state: str = "pending"  # pending, running, done, failed
+    deleted: int = 0
+    total: int | None = None
+    redirect: str | None = None  # where to go when the job is done
+    message: str | None = None  # success message, added by the progress view when the job is done
+    error: str | None = None
+
+
+def get_job(job_id: str) -> DeleteJob | None:
+    data = caches[crud_views_settings.delete_job_cache_alias].get(f"{_PREFIX}:{job_id}")
+    return DeleteJob.model_validate(data) if data is not None else None
+
+
+def save_job(job: DeleteJob):
+    cache = caches[crud_views_settings.delete_job_cache_alias]
+    cache.set(f"{_PREFIX}:{job.id}", job.model_dump(), crud_views_settings.delete_job_timeout)
+
+
+class ThreadPoolDeleteExecutor(ThreadPoolExecutor):
+    """
+    Thread pool that closes the worker's database connections after each job.
+    """
+
+    def submit(self, fn, /, *args, **kwargs):
+        def _run():
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                connections.close_all()
+
+        return super().submit(_run)
+
+
+@cache
+def get_executor(dotted: str | None = None):
+    """
+    The executor of the class at dotted, a ThreadPoolDeleteExecutor if None; one per class.
+    """
+    if dotted:
+        return import_string(dotted)()
+    return ThreadPoolDeleteExecutor(max_workers=2, thread_name_prefix="cv_delete")
+
+
+def run_delete_job(job_id: str, model_label: str, pk, using: str, batch_size: int):
+    """
+    Delete the object and record the progress on the job; the executor's entry point.
+    """
+    job = get_job(job_id)
+    if job is None:
+        logger.warning("delete job %s expired before it started", job_id)
+        return
+
+    def _progress(deleted: int, total: int):
+        job.deleted, job.total = deleted, total
+        save_job(job)
+
+    job.state = "running"
+    save_job(job)
+    try:
+        model = apps.get_model(model_label)
+        obj = model._base_manager.using(using).get(pk=pk)
+        chunked_delete(obj, using=using, batch_size=batch_size, progress=_progress)
+    except Exception as exc:
+        logger.exception("delete job %s failed", job_id)
+        job.state = "failed"
+        job.error = str(exc)
+    else:
+        job.state = "done"
+    save_job(job)
+
+
+def start_delete_job(
+    obj,
+    using: str,
+    batch_size: int,
+    user=None,
+    redirect: str | None = None,
+    message: str | None = None,
+    executor: str | None = None,
+) -> DeleteJob:
+    """
+    Store a pending job for the delete of obj and submit it to the executor once the current
+    transaction is committed.
+    """
+    pk = getattr(user, "pk", None)
+    job = DeleteJob(id=uuid.uuid4().hex, user=str(pk) if pk is not None else None, redirect=redirect, message=message)
+    save_job(job)
+    args = (run_delete_job, job.id, obj._meta.label, obj.pk, using, batch_size)
+    transaction.on_commit(lambda: get_executor(executor).submit(*args), using=using)
+    return job
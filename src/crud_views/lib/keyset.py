@@ -0,0 +1,282 @@
+"""
+Keyset (seek) pagination.
+
+A page is addressed by the sort key of its neighbour row instead of an offset: the next
+page starts after the last row of the current one, the previous page ends before its first
+row. Deep pages cost as much as the first one and no COUNT(*) is run.
+
+The sort key is the ordering of the queryset (the table's sort or the card order included),
+completed with the pk as tie-breaker. Cursors are opaque url-safe tokens; a cursor that does
+not match the current ordering, e.g. after the sort changed, selects the first page.
+"""
+
+import base64
+import binascii
+import datetime
+import decimal
+import json
+import uuid
+from collections.abc import Sequence
+from functools import reduce
+from operator import or_
+from typing import Any, NamedTuple
+
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured, ValidationError
+from django.db.models import F, Field, Model, Q, QuerySet
+from django.db.models.expressions import OrderBy
+
+from crud_views.lib.query import LOOKUP_SEP
+
+ALIAS = "cv_keyset_{}"
+
+
+class KeysetKey(NamedTuple):
+    path: str
+    descending: bool
+    field: Field | None  # None: an annotation without output field
+    nullable: bool
+    alias: str
+
+    @property
+    def signature(self) -> str:
+        return f"-{self.path}" if self.descending else self.path
+
+
+def _ordering(queryset: QuerySet) -> list[tuple[str, bool]]:
+    """(path, descending) of the queryset's ordering, expressions resolved to field paths."""
+    query = queryset.query
+    ordering = query.order_by or (query.get_meta().ordering if query.default_ordering else ())
+    result = []
+    for entry in ordering:
+        if isinstance(entry, OrderBy) and isinstance(entry.expression, F):
+            result.append((entry.expression.name, entry.descending))
+        elif isinstance(entry, F):
+            result.append((entry.name, False))
+        elif isinstance(entry, str) and entry != "?":
+            result.append((entry.lstrip("-"), entry.startswith("-")))
+        else:
+            raise ImproperlyConfigured(f"keyset pagination needs field orderings, got {entry!r}")
+    return result
+
+
+def _resolve(queryset: QuerySet, path: str, descending: bool, seen: frozenset = frozenset()) -> list:
+    """
+    [(path, descending, field, nullable)] of one ordering entry. Like Django, an ordering by
+    a relation sorts by the related model's Meta.ordering, or by its pk.
+    """
+    model = queryset.model
+    bits = path.split(LOOKUP_SEP)
+    if bits[0] in queryset.query.annotations:
+        field = getattr(queryset.query.annotations[bits[0]], "_output_field_or_none", None)
+        return [(path, descending, field, True)]
+    if bits[-1] == "pk":
+        bits[-1:] = []
+        pk_path = True
+    else:
+        pk_path = False
+    nullable = False
+    field = None
+    for bit in bits:
+        if field is not None:
+            model = field.related_model
+        if model is None:
+            raise ImproperlyConfigured(f"keyset pagination: {path!r} is no field path of {queryset.model}")
+        try:
+            field = model._meta.get_field(bit)
+        except FieldDoesNotExist as exc:
+            raise ImproperlyConfigured(f"keyset pagination: {path!r} is no field path of {queryset.model}") from exc
+        nullable = nullable or field.null or not field.concrete
+    if pk_path or field is None or field.is_relation:
+        related = field.related_model if field is not None else model
+        prefix = LOOKUP_SEP.join(bits)
+        ordering = related._meta.ordering if not pk_path else ()
+        if (related, prefix) in seen or not all(isinstance(o, str) for o in ordering):
+            ordering = ()
+        if not ordering:
+            pk_field = related._meta.pk
+            return [(LOOKUP_SEP.join([*bits, pk_field.name]), descending, pk_field, nullable)]
+        result = []
+        for entry in ordering:
+            sub = _resolve(
+                queryset,
+                f"{prefix}{LOOKUP_SEP}{entry.lstrip('-')}",
+                descending != entry.startswith("-"),
+                seen | {(related, prefix)},
+            )
+            result.extend((p, d, f, n or nullable) for p, d, f, n in sub)
+        return result
+    return [(path, descending, field, nullable)]
+
+
+def keyset_keys(queryset: QuerySet) -> list[KeysetKey]:
+    """
+    The sort key of a queryset: its ordering up to the first unique entry, completed with
+    the pk in the direction of the last entry.
+    """
+    pk = queryset.model._meta.pk
+    keys: list[KeysetKey] = []
+    for path, descending in _ordering(queryset):
+        for sub_path, sub_descending, field, nullable in _resolve(queryset, path, descending):
+            if sub_path in {k.path for k in keys}:
+                continue
+            keys.append(KeysetKey(sub_path, sub_descending, field, nullable, ALIAS.format(len(keys))))
+            if field is pk and sub_path == pk.name:
+                return keys
+    descending = keys[-1].descending if keys else False
+    keys.append(KeysetKey(pk.name, descending, pk, False, ALIAS.format(len(keys))))
+    return keys
+
+
+def _order_by(key: KeysetKey, backwards: bool):
+    descending = key.descending != backwards
+    if not key.nullable:
+        return f"-{key.alias}" if descending else key.alias
+    # nulls sort as the largest values in both directions, so a page turn just reverses
+    return F(key.alias).desc(nulls_first=True) if descending else F(key.alias).asc(nulls_last=True)
+
+
+def _beyond(key: KeysetKey, value: Any, backwards: bool) -> Q | None:
+    """Rows that come after value in the key's direction; None if none can."""
+    descending = key.descending != backwards
+    if value is None:
+        return None if not descending else Q(**{f"{key.alias}__isnull": False})
+    condition = Q(**{f"{key.alias}__{'lt' if descending else 'gt'}": value})
+    if key.nullable and not descending:
+        condition |= Q(**{f"{key.alias}__isnull": True})
+    return condition
+
+
+def seek(queryset: QuerySet, keys: list[KeysetKey], values: Sequence | None, backwards: bool = False) -> QuerySet:
+    """
+    The queryset ordered by keys (reversed if backwards), starting after the row with values.
+    The keys are annotated, the values of a row are read from the aliases.
+    """
+    queryset = queryset.annotate(**{k.alias: F(k.path) for k in keys})
+    if values is not None:
+        terms = []
+        equal = Q()
+        for key, value in zip(keys, values, strict=True):
+            beyond = _beyond(key, value, backwards)
+            if beyond is not None:
+                terms.append(equal & beyond)
+            equal &= Q(**{f"{key.alias}__isnull": True}) if value is None else Q(**{key.alias: value})
+        queryset = queryset.filter(reduce(or_, terms)) if terms else queryset.none()
+    return queryset.order_by(*(_order_by(k, backwards) for k in keys))
+
+
+def _json_value(value: Any) -> Any:
+    # full precision, unlike DjangoJSONEncoder, which cuts datetimes to milliseconds
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    return value
+
+
+def encode_cursor(keys: list[KeysetKey], record: Model, backwards: bool = False) -> str:
+    data = {
+        "k": [k.signature for k in keys],
+        "v": [_json_value(getattr(record, k.alias)) for k in keys],
+        "b": backwards,
+    }
+    token = base64.urlsafe_b64encode(json.dumps(data, separators=(",", ":")).encode())
+    return token.decode().rstrip("=")
+
+
+def decode_cursor(keys: list[KeysetKey], cursor: str | None) -> tuple[list, bool] | None:
+    """
+    (values, backwards) of a cursor; None for no cursor or one that does not match keys.
+    """
+    if not cursor:
+        return None
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if data["k"] != [k.signature for k in keys] or len(data["v"]) != len(keys):
+            return None
+        values = [
+            None if v is None or k.field is None else k.field.to_python(v) for k, v in zip(keys, data["v"], strict=True)
+        ]
+        return values, bool(data.get("b"))
+    except (ValueError, TypeError, KeyError, binascii.Error, ValidationError):
+        return None
+
+
+class KeysetPage(Sequence):
+    """
+    A page of a KeysetPaginator. Like Django's Page, without page numbers and counts.
+    """
+
+    cv_keyset = True
+
+    def __init__(
+        self,
+        object_list,
+        paginator: "KeysetPaginator",
+        next_cursor: str | None,
+        previous_cursor: str | None,
+    ):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor  # "": the first page
+
+    @property
+    def cursor_param(self) -> str:
+        return self.paginator.cursor_param
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+    def has_other_pages(self) -> bool:
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+    """
+    Paginates a queryset by cursor instead of page number. Usable where Django or
+    django-tables2 take a paginator class; the page number passed to page() is ignored.
+    """
+
+    def __init__(self, object_list, per_page: int, cursor: str | None = None, cursor_param: str = "cursor", **kwargs):
+        self.object_list = object_list
+        self.per_page = int(per_page)
+        self.cursor = cursor
+        self.cursor_param = cursor_param
+
+    def get_queryset(self) -> QuerySet:
+        if not isinstance(self.object_list, QuerySet):
+            raise ImproperlyConfigured("keyset pagination needs a queryset")
+        return self.object_list
+
+    def get_page_list(self, records: list):
+        return records
+
+    def page(self, number=None) -> KeysetPage:
+        queryset = self.get_queryset()
+        keys = keyset_keys(queryset)
+        cursor = decode_cursor(keys, self.cursor)
+        values, backwards = cursor if cursor is not None else (None, False)
+        records = list(seek(queryset, keys, values, backwards)[: self.per_page + 1])
+        more = len(records) > self.per_page
+        records = records[: self.per_page]
+        if backwards:
+            records.reverse()
+
+        has_next = more if not backwards else True
+        has_previous = more if backwards else cursor is not None
+        if records:
+            next_cursor = encode_cursor(keys, records[-1]) if has_next else None
+            previous_cursor = encode_cursor(keys, records[0], backwards=True) if has_previous else None
+        else:
+            next_cursor = None
+            previous_cursor = "" if cursor is not None else None
+        return KeysetPage(self.get_page_list(records), self, next_cursor, previous_cursor)
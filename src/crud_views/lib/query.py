@@ -0,0 +1,72 @@
+"""
+Declarative queryset shaping for ViewSets and views.
+
+ViewSet.select_related / prefetch_related / only / defer and the cv_* counterparts of a
+view are applied in ViewSet.get_queryset. The helpers below also find the relations a
+django-tables2 column accessor crosses, for the W290 check of table list views.
+"""
+
+from collections.abc import Iterable
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, QuerySet
+
+LOOKUP_SEP = "__"
+
+
+def apply_query_options(
+    queryset: QuerySet,
+    select_related: Iterable[str] | None = None,
+    prefetch_related: Iterable | None = None,
+    only: Iterable[str] | None = None,
+    defer: Iterable[str] | None = None,
+) -> QuerySet:
+    """
+    Apply the given lookups; None or empty leaves the queryset as it is.
+    """
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*prefetch_related)
+    if only:
+        queryset = queryset.only(*only)
+    if defer:
+        queryset = queryset.defer(*defer)
+    return queryset
+
+
+def accessor_relations(model: type[Model], accessor: str) -> tuple[str | None, str | None]:
+    """
+    (select_related path, prefetch_related path) a column accessor crosses on model.
+
+    The select path covers the forward foreign keys and one-to-one relations, including the
+    last bit: a column on a foreign key renders str() of the related object. The first
+    many-valued relation ends the walk as the prefetch path. Bits that are no model field
+    (properties, methods) end the walk, too.
+    """
+    separator = "." if "." in accessor and LOOKUP_SEP not in accessor else LOOKUP_SEP
+    select = []
+    for bit in accessor.split(separator):
+        try:
+            field = model._meta.get_field(bit)
+        except FieldDoesNotExist:
+            break
+        if not field.is_relation or field.related_model is None:
+            break
+        if field.many_to_many or field.one_to_many:
+            return LOOKUP_SEP.join(select) or None, LOOKUP_SEP.join([*select, bit])
+        select.append(bit)
+        model = field.related_model
+    return LOOKUP_SEP.join(select) or None, None
+
+
+def lookup_path(lookup) -> str:
+    """The path of a prefetch_related lookup, which may be a Prefetch object."""
+    return getattr(lookup, "prefetch_through", lookup)
+
+
+def is_covered(path: str, lookups: Iterable) -> bool:
+    """
+    True if one of lookups fetches path, i.e. is path or goes beyond it.
+    """
+    return any(p == path or p.startswith(path + LOOKUP_SEP) for p in map(lookup_path, lookups))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import Any, Self
 
 from django.http import Http404
@@ -108,19 +109,33 @@ class Resource(BaseModel):
         tree, call an API, ...). ``url_kwargs`` are the resolved URL kwargs of
         the requesting view — for nested ViewSets they contain the parent
         pk(s), e.g. ``publisher_pk``. Must return a plain list (Django's
-        Paginator needs len() and slicing).
+        Paginator needs len() and slicing). Default: the rows of
+        cv_iter_items(), if that is implemented.
         """
+        if cls.cv_iter_items.__func__ is not Resource.cv_iter_items.__func__:
+            return list(cls.cv_iter_items(request, **url_kwargs))
         raise NotImplementedError(f"{cls.__name__}.cv_get_items() is not implemented")
 
+    @classmethod
+    def cv_iter_items(cls, request, **url_kwargs) -> Iterator[Self]:
+        """
+        Yield all rows, in list order. Optional: implement it as a generator
+        for sources too large to hold in memory (walk a tree, page through a
+        bucket listing); streaming consumers such as ExportView read it lazily,
+        so rows reach the client before the source is done. Default: the
+        rows of cv_get_items().
+        """
+        yield from cls.cv_get_items(request, **url_kwargs)
+
     @classmethod
     def cv_get_item(cls, request, pk, **url_kwargs) -> Self:
         """
-        Return a single row by pk. Default: linear scan over cv_get_items()
-        comparing str(row.pk) == str(pk); raises Http404 when not found.
-        Deliberately simple — fine for read-all-at-once data. Override when a
-        direct lookup is cheaper (e.g. head_object on S3).
+        Return a single row by pk. Default: linear scan over cv_iter_items()
+        comparing str(row.pk) == str(pk), stopping at the first match; raises
+        Http404 when not found. Deliberately simple — fine for read-all-at-once
+        data. Override when a direct lookup is cheaper (e.g. head_object on S3).
         """
-        for item in cls.cv_get_items(request, **url_kwargs):
+        for item in cls.cv_iter_items(request, **url_kwargs):
             if str(item.pk) == str(pk):
                 return item
         raise Http404(f"{cls._meta.verbose_name} with pk={pk!r} not found")
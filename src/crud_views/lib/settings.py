@@ -16,6 +16,10 @@ def from_settings(name, default=None) -> Any:
 
 class CrudViewsSettings(BaseModel):
     MANAGE_VIEWS_ENABLED_VALUES: ClassVar[tuple[str, ...]] = ("no", "yes", "debug_only")
+    URL_BUILDER_VALUES: ClassVar[tuple[str, ...]] = ("compiled", "reverse", "parity")
+    TABLE_QUERY_PLAN_VALUES: ClassVar[tuple[str | None, ...]] = (None, "select_related", "only")
+    LIST_COUNT_VALUES: ClassVar[tuple[str, ...]] = ("exact", "cached", "estimate")
+    DELETE_STRATEGY_VALUES: ClassVar[tuple[str, ...]] = ("delete", "chunked", "background")
 
     # basic
     extends: str | None = from_settings(
@@ -26,6 +30,12 @@ class CrudViewsSettings(BaseModel):
     manage_show_users: bool = from_settings("CRUD_VIEWS_MANAGE_SHOW_USERS", default=False)
     manage_view_class: str | None = from_settings("CRUD_VIEWS_MANAGE_VIEW_CLASS", default=None)
     guardian_manage_view_class: str | None = from_settings("CRUD_VIEWS_GUARDIAN_MANAGE_VIEW_CLASS", default=None)
+    # guardian: cache the pks a user holds an object permission on (crud_views_guardian.lib.pk_cache)
+    guardian_pk_cache: bool = from_settings("CRUD_VIEWS_GUARDIAN_PK_CACHE", default=False)
+    guardian_pk_cache_alias: str = from_settings("CRUD_VIEWS_GUARDIAN_PK_CACHE_ALIAS", default="default")
+    guardian_pk_cache_timeout: int = from_settings("CRUD_VIEWS_GUARDIAN_PK_CACHE_TIMEOUT", default=300)
+    # above this many pks a set is not cached: lists fall back to guardian's subquery
+    guardian_pk_cache_max_pks: int = from_settings("CRUD_VIEWS_GUARDIAN_PK_CACHE_MAX_PKS", default=1000)
     # not a supported setting; only read to warn consumers who set it (see check_messages)
     theme: str | None = from_settings("CRUD_VIEWS_THEME", default=None)
 
@@ -38,6 +48,29 @@ class CrudViewsSettings(BaseModel):
     # breadcrumb
     breadcrumb_prefix: list[dict[str, Any]] = from_settings("CRUD_VIEWS_BREADCRUMB_PREFIX", default=[])
 
+    # views: share the object fetched by the permission check with the request handler
+    memoize_object: bool = from_settings("CRUD_VIEWS_MEMOIZE_OBJECT", default=False)
+    # urls: how sibling/child urls are built (crud_views.lib.url_builder)
+    url_builder: str = from_settings("CRUD_VIEWS_URL_BUILDER", default="compiled")
+    # tables: derive select_related (and only) from the column accessors (crud_views.lib.table.plan)
+    table_query_plan: str | None = from_settings("CRUD_VIEWS_TABLE_QUERY_PLAN", default=None)
+    # tables: how paginated lists count their rows (crud_views.lib.count)
+    list_count: str = from_settings("CRUD_VIEWS_LIST_COUNT", default="exact")
+    list_count_cache_alias: str = from_settings("CRUD_VIEWS_LIST_COUNT_CACHE_ALIAS", default="default")
+    list_count_cache_timeout: int = from_settings("CRUD_VIEWS_LIST_COUNT_CACHE_TIMEOUT", default=60)
+    list_count_estimate_threshold: int = from_settings("CRUD_VIEWS_LIST_COUNT_ESTIMATE_THRESHOLD", default=100_000)
+    # delete views: count related objects and show at most this many per model (crud_views.lib.cascade)
+    delete_related_objects_limit: int | None = from_settings("CRUD_VIEWS_DELETE_RELATED_OBJECTS_LIMIT", default=None)
+    # delete views: how the object and its cascade are deleted (crud_views.lib.delete_job)
+    delete_strategy: str = from_settings("CRUD_VIEWS_DELETE_STRATEGY", default="delete")
+    delete_batch_size: int = from_settings("CRUD_VIEWS_DELETE_BATCH_SIZE", default=1000)
+    delete_executor: str | None = from_settings("CRUD_VIEWS_DELETE_EXECUTOR", default=None)
+    delete_job_cache_alias: str = from_settings("CRUD_VIEWS_DELETE_JOB_CACHE_ALIAS", default="default")
+    delete_job_timeout: int = from_settings("CRUD_VIEWS_DELETE_JOB_TIMEOUT", default=3600)
+
+    # snippets: max. number of compiled template_code snippets kept in the LRU cache
+    snippet_cache_size: int = from_settings("CRUD_VIEWS_SNIPPET_CACHE_SIZE", default=256)
+
     # filter
     filter_persistence: bool = from_settings("CRUD_VIEWS_FILTER_PERSISTENCE", default=True)
     filter_pinned: bool = from_settings("CRUD_VIEWS_FILTER_PINNED", default=False)
@@ -103,6 +136,50 @@ class CrudViewsSettings(BaseModel):
                 )
             )
 
+        if self.url_builder not in self.URL_BUILDER_VALUES:
+            messages.append(
+                Error(
+                    id="crud_views.E103",
+                    msg=(
+                        f"setting CRUD_VIEWS_URL_BUILDER must be one of "
+                        f"{self.URL_BUILDER_VALUES}, got {self.url_builder!r}"
+                    ),
+                )
+            )
+
+        if self.table_query_plan not in self.TABLE_QUERY_PLAN_VALUES:
+            messages.append(
+                Error(
+                    id="crud_views.E104",
+                    msg=(
+                        f"setting CRUD_VIEWS_TABLE_QUERY_PLAN must be one of "
+                        f"{self.TABLE_QUERY_PLAN_VALUES}, got {self.table_query_plan!r}"
+                    ),
+                )
+            )
+
+        if self.list_count not in self.LIST_COUNT_VALUES:
+            messages.append(
+                Error(
+                    id="crud_views.E105",
+                    msg=(
+                        f"setting CRUD_VIEWS_LIST_COUNT must be one of "
+                        f"{self.LIST_COUNT_VALUES}, got {self.list_count!r}"
+                    ),
+                )
+            )
+
+        if self.delete_strategy not in self.DELETE_STRATEGY_VALUES:
+            messages.append(
+                Error(
+                    id="crud_views.E106",
+                    msg=(
+                        f"setting CRUD_VIEWS_DELETE_STRATEGY must be one of "
+                        f"{self.DELETE_STRATEGY_VALUES}, got {self.delete_strategy!r}"
+                    ),
+                )
+            )
+
         # deferred import: settings.py must not import breadcrumb.py at module level
         # (breadcrumb.py imports crud_views_settings)
         from pydantic import ValidationError as PydanticValidationError
@@ -18,11 +18,30 @@ class ActionColumn(tables.TemplateColumn):
             extra["template_name"] = "crud_views/columns/actions.html"
         if "attrs" not in extra:
             extra["attrs"] = ColAttr.action
+        extra.setdefault("exclude_from_export", True)
         super().__init__(**extra)
 
-    def render(self, table, **kwargs):
+    def render(self, table, record, **kwargs):
         self.extra_context["view"] = table.view
-        return super().render(table=table, **kwargs)
+        self.extra_context["row_actions"] = self.get_row_actions(table, record)
+        return super().render(table=table, record=record, **kwargs)
+
+    @staticmethod
+    def get_row_actions(table, record) -> list[dict]:
+        """
+        The record's row actions, read from the map the view resolves once for the whole page.
+        """
+        view = table.view
+        if not hasattr(view, "cv_get_row_actions_bulk"):
+            return view.cv_get_row_actions(record)
+        page_actions = getattr(table, "_cv_row_actions", None)
+        if page_actions is None:
+            records = [row.record for row in table.paginated_rows]
+            page_actions = table._cv_row_actions = view.cv_get_row_actions_bulk(records)
+        actions = page_actions.get(record.pk)
+        if actions is None:  # not a row of the current page
+            actions = view.cv_get_row_actions(record)
+        return actions
 
 
 class LinkChildColumn(tables.TemplateColumn):
@@ -33,12 +52,13 @@ class LinkChildColumn(tables.TemplateColumn):
             extra["orderable"] = False
         if "template_code" not in extra and "template_name" not in extra:
             extra["template_name"] = "crud_views/columns/child.html"
+        extra.setdefault("exclude_from_export", True)
         super().__init__(**extra)
 
     def render(self, table, record, **kwargs):
 
         viewset = ViewSet.get_viewset(self.name)
-        data = viewset.get_meta(table.view.cv_get_view_context())
+        data = viewset.get_meta(table.view.cv_get_fast_view_context())
         data.update({"url": table.view.cv_get_child_url(self.name, self.key, record)})
         self.extra_context.update(data)
         return super().render(table=table, record=record, **kwargs)
@@ -0,0 +1,33 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import QuerySet
+from django_tables2.rows import BoundRows
+
+from crud_views.lib.count import CountPaginator
+from crud_views.lib.keyset import KeysetPaginator
+
+
+class TableKeysetPaginator(KeysetPaginator):
+    """
+    Keyset paginator for django-tables2: pages the table's sorted queryset and
+    returns the page's records as bound rows.
+    """
+
+    def get_queryset(self) -> QuerySet:
+        queryset = getattr(self.object_list.data, "data", None)
+        if not isinstance(queryset, QuerySet):
+            raise ImproperlyConfigured("keyset pagination needs a queryset as table data")
+        return queryset
+
+    def get_page_list(self, records: list) -> BoundRows:
+        rows = self.object_list
+        return BoundRows(data=records, table=rows.table, pinned_data=rows.pinned_data)
+
+
+class TableCountPaginator(CountPaginator):
+    """
+    Count paginator for django-tables2: counts the table's queryset with the view's count strategy.
+    """
+
+    def get_queryset(self) -> QuerySet | None:
+        queryset = getattr(self.object_list.data, "data", None)
+        return queryset if isinstance(queryset, QuerySet) else None
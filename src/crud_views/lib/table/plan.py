@@ -0,0 +1,112 @@
+"""
+Query plans derived from the columns of a django-tables2 table.
+
+A plan lists the select_related joins the column accessors need and, if every column
+is transparent, the only() projection of the fields they render. Plans are computed
+once per (table class, model).
+"""
+
+from functools import cache
+from typing import NamedTuple
+
+import django_tables2 as tables
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model
+
+from crud_views.lib.query import LOOKUP_SEP, accessor_relations
+
+from .columns import (
+    ActionColumn,
+    LinkChildColumn,
+    LinkDetailColumnMixin,
+    NaturalDayColumn,
+    NaturalTimeColumn,
+    UUIDColumn,
+)
+
+# columns that read the record's pk only, not their accessor
+PK_COLUMNS = (ActionColumn, LinkChildColumn)
+
+# template columns whose templates render the column value only
+VALUE_TEMPLATE_COLUMNS = (UUIDColumn, NaturalDayColumn, NaturalTimeColumn)
+
+
+class TableQueryPlan(NamedTuple):
+    select_related: tuple[str, ...]
+    # None: a column may read fields the plan cannot see (template, render_* method, property)
+    only: tuple[str, ...] | None
+
+
+def column_accessor(name: str, column: tables.Column) -> str | None:
+    """The accessor a column renders, None for columns that read the pk only."""
+    if isinstance(column, PK_COLUMNS):
+        return None
+    return str(column.accessor or name)
+
+
+def is_transparent(table_class: type[tables.Table], name: str, column: tables.Column) -> bool:
+    """True if the column reads nothing but its accessor."""
+    if isinstance(column, PK_COLUMNS):
+        return True
+    if isinstance(column, tables.TemplateColumn) and not isinstance(column, VALUE_TEMPLATE_COLUMNS):
+        return False
+    if getattr(column, "link", None) is not None and not isinstance(column, LinkDetailColumnMixin):
+        return False  # linkify: get_absolute_url() or a callable may read anything
+    return not (hasattr(table_class, f"render_{name}") or hasattr(table_class, f"value_{name}"))
+
+
+def accessor_only(model: type[Model], accessor: str) -> tuple[str, bool] | None:
+    """
+    The only() entry of an accessor and whether it is a relation whose whole object is rendered.
+    None if a bit is no model field (a property may read any field).
+    """
+    separator = "." if "." in accessor and LOOKUP_SEP not in accessor else LOOKUP_SEP
+    path = []
+    pk_name = model._meta.pk.name
+    for bit in accessor.split(separator):
+        try:
+            field = model._meta.get_field(bit)
+        except FieldDoesNotExist:
+            return None
+        if field.many_to_many or field.one_to_many:
+            # prefetched: keep the relation leading there, nothing to project beyond
+            return LOOKUP_SEP.join(path) or pk_name, False
+        path.append(field.name)
+        if not field.is_relation or field.related_model is None:
+            return LOOKUP_SEP.join(path), False
+        model = field.related_model
+    return LOOKUP_SEP.join(path), True
+
+
+@cache
+def get_table_query_plan(table_class: type[tables.Table], model: type[Model]) -> TableQueryPlan:
+    select_related = []
+    only = {model._meta.pk.name}
+    whole = set()  # relations rendered as objects (str()), loaded with all their fields
+    complete = True
+    for name, column in table_class.base_columns.items():
+        complete = complete and is_transparent(table_class, name, column)
+        accessor = column_accessor(name, column)
+        if accessor is None:
+            continue
+        select, _prefetch = accessor_relations(model, accessor)
+        if select and select not in select_related:
+            select_related.append(select)
+        entry = accessor_only(model, accessor)
+        if entry is None:
+            complete = False
+            continue
+        only.add(entry[0])
+        if entry[1]:
+            whole.add(entry[0])
+    # models often __str__ the fields they are ordered by
+    for ordering in model._meta.ordering:
+        field_name = ordering.lstrip("-") if isinstance(ordering, str) else ""
+        if field_name and field_name != "?" and LOOKUP_SEP not in field_name:
+            only.add(field_name)
+    # a field below a whole relation would restrict that relation to the field
+    only = {f for f in only if not any(f.startswith(w + LOOKUP_SEP) for w in whole)}
+    return TableQueryPlan(
+        select_related=tuple(select_related),
+        only=tuple(sorted(only)) if complete else None,
+    )
@@ -0,0 +1,106 @@
+"""
+Compiled URL builders for ViewSet routes.
+
+``reverse()`` walks the namespaces of the resolver and scans the possibilities of a
+name on every call; a list page calls it once per row and action. The routes of a
+ViewSet have a single possibility without converters or defaults, so the format
+string and pattern reverse() would pick are looked up once per router name (and
+URLconf, language) and later calls only substitute, validate and quote.
+
+The builder is taken from the resolver, not from ViewSet.urlpatterns: only the
+resolver knows the include() prefixes and namespaces a ViewSet is mounted under.
+Names that do not have this simple shape, and kwargs that do not match, fall back
+to reverse(). CRUD_VIEWS_URL_BUILDER selects "compiled" (default), "reverse" or
+"parity", which builds both and raises CrudViewError if they differ.
+"""
+
+import re
+from typing import NamedTuple
+from urllib.parse import quote
+
+from django.urls import get_resolver, get_script_prefix, get_urlconf, reverse
+from django.urls.resolvers import get_ns_resolver
+from django.utils.http import RFC3986_SUBDELIMS, escape_leading_slashes
+from django.utils.translation import get_language
+
+from .exceptions import CrudViewError, cv_raise
+from .settings import crud_views_settings
+
+
+class UrlBuilder(NamedTuple):
+    """The format string and pattern reverse() selects for a router name."""
+
+    result: str
+    params: frozenset
+    regex: re.Pattern
+
+    def build(self, prefix: str, kwargs: dict) -> str | None:
+        if kwargs.keys() != self.params:
+            return None
+        path = self.result % {k: str(v) for k, v in kwargs.items()}
+        if not self.regex.match(path):
+            return None
+        # safe characters from `pchar` definition of RFC 3986, as reverse()
+        return escape_leading_slashes(quote(prefix + path, safe=RFC3986_SUBDELIMS + "/~:@"))
+
+
+_builders: dict[tuple, tuple] = {}
+
+
+def compile_url_builder(router_name: str, resolver=None) -> UrlBuilder | None:
+    """
+    Compile the builder of router_name, None if reverse() has to decide.
+    """
+    resolver = resolver or get_resolver(get_urlconf())
+    *path, view = router_name.split(":")
+    ns_pattern = ""
+    ns_converters = {}
+    for ns in path:
+        app_list = resolver.app_dict.get(ns)
+        if app_list and ns not in app_list:
+            ns = app_list[0]  # the default instance, as reverse() without current_app
+        if ns not in resolver.namespace_dict:
+            return None
+        extra, resolver = resolver.namespace_dict[ns]
+        ns_pattern += extra
+        ns_converters.update(resolver.pattern.converters)
+    if ns_pattern:
+        resolver = get_ns_resolver(ns_pattern, resolver, tuple(ns_converters.items()))
+
+    possibilities = resolver.reverse_dict.getlist(view)
+    if len(possibilities) != 1:
+        return None
+    possibility, pattern, defaults, converters = possibilities[0]
+    if len(possibility) != 1 or defaults or converters:
+        return None
+    result, params = possibility[0]
+    return UrlBuilder(result=result, params=frozenset(params), regex=re.compile(pattern))
+
+
+def get_url_builder(router_name: str) -> UrlBuilder | None:
+    urlconf = get_urlconf()
+    resolver = get_resolver(urlconf)
+    key = (urlconf, get_language(), router_name)
+    entry = _builders.get(key)
+    # clear_url_caches() (e.g. override_settings(ROOT_URLCONF=...)) creates a new resolver
+    if entry is None or entry[0] is not resolver:
+        entry = (resolver, compile_url_builder(router_name, resolver))
+        _builders[key] = entry
+    return entry[1]
+
+
+def cv_reverse(router_name: str, kwargs: dict) -> str:
+    """
+    Equivalent of reverse(router_name, kwargs=kwargs) for ViewSet routes.
+    """
+    mode = crud_views_settings.url_builder
+    if mode == "reverse":
+        return reverse(router_name, kwargs=kwargs)
+    builder = get_url_builder(router_name)
+    url = builder.build(get_script_prefix(), kwargs) if builder else None
+    if url is None:
+        return reverse(router_name, kwargs=kwargs)
+    if mode == "parity":
+        expected = reverse(router_name, kwargs=kwargs)
+        cv_raise(url == expected, f"url builder of {router_name} built {url!r}, reverse() {expected!r}", CrudViewError)
+    return url
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import re
 from collections.abc import Iterable
-from functools import cached_property
+from functools import cache, cached_property, lru_cache
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -12,14 +13,15 @@ if TYPE_CHECKING:
 from typing import Self
 
 from django.contrib.auth.mixins import PermissionRequiredMixin
+from django.core.exceptions import ObjectDoesNotExist
 from django.db.models import Model
-from django.shortcuts import get_object_or_404
+from django.http import Http404
 from django.template import Context as TemplateContext
 from django.template import Template
-from django.template.loader import render_to_string
-from django.urls import reverse
+from django.template.loader import get_template, render_to_string
 from django.utils.cache import patch_vary_headers
 from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
 
 from crud_views.lib import check
@@ -33,6 +35,7 @@ from crud_views.lib.check import (
     CheckUnknownAttributes,
 )
 from crud_views.lib.exceptions import CrudViewError, ParentViewSetError, ViewSetKeyFoundError, cv_raise
+from crud_views.lib.url_builder import cv_reverse
 
 from ..settings import crud_views_settings
 from .buttons import ContextButton
@@ -40,6 +43,37 @@ from .context import ViewContext
 from .meta import CrudViewMetaClass
 
 
+@lru_cache(maxsize=crud_views_settings.snippet_cache_size)
+def cv_get_snippet_template(template_code: str) -> Template:
+    """
+    Compiled Template for a snippet's template_code, cached process-wide with LRU eviction.
+
+    Snippet codes are developer-supplied class attributes, so the set of distinct keys is small
+    and fixed; compiling each once turns every further label render into a plain render.
+    Hit/miss counters: ``cv_get_snippet_template.cache_info()``.
+    """
+    return Template(template_code)
+
+
+# a snippet that names "object" - or pulls in other templates we cannot see - depends on the row
+_REG_SNIPPET_OBJECT = re.compile(r"\bobject\b|{%\s*(?:include|extends)\b")
+
+
+@cache
+def cv_snippet_references_object(template: str | None, template_code: str | None) -> bool:
+    """
+    True if the snippet may render differently per object (conservative source scan).
+    Snippets whose source is not available (non-Django template backends) count as referencing object.
+    """
+    if template_code:
+        source = template_code
+    else:
+        source = getattr(getattr(get_template(template), "template", None), "source", None)
+        if source is None:
+            return True
+    return bool(_REG_SNIPPET_OBJECT.search(source))
+
+
 def cv_is_modal_request(request) -> bool:
     """True when the client asked for the modal partial (X-CV-Modal header)."""
     return request.headers.get("X-CV-Modal") == "true"
@@ -94,6 +128,20 @@ class CrudView(metaclass=CrudViewMetaClass):
     cv_icon_action: str | None = None  # font awesome icon
     cv_icon_header: str | None = None  # font awesome icon
 
+    # action labels that do not depend on the row object are rendered once per request and language;
+    # None: detect per label snippet (a snippet referencing "object" is rendered per object)
+    cv_action_label_object_independent: bool | None = None
+
+    # reuse the object fetched by the permission check (cv_get_action_object) in the request handler
+    cv_memoize_object: bool = crud_views_settings.memoize_object
+
+    # queryset shaping on top of the ViewSet's (ViewSet.get_query_options): select_related and
+    # prefetch_related are added, only and defer replace the ViewSet's when set
+    cv_select_related: list[str] | None = None
+    cv_prefetch_related: list[Any] | None = None
+    cv_only: list[str] | None = None
+    cv_defer: list[str] | None = None
+
     # W280: custom cv_* data attributes to exempt from the unknown-attribute check
     cv_check_ignore_attributes: frozenset[str] = frozenset()
 
@@ -177,6 +225,32 @@ class CrudView(metaclass=CrudViewMetaClass):
         """
         return True
 
+    @classmethod
+    def cv_has_access_bulk(cls, user: User, objs: Iterable[Model]) -> dict[Any, bool]:
+        """
+        cv_has_access for many objects, keyed by pk. Used when a page of rows or cards is rendered;
+        the default asks cv_has_access per object, override it to answer the whole page at once.
+        """
+        return {obj.pk: bool(cls.cv_has_access(user, obj)) for obj in objs}
+
+    @classmethod
+    def cv_action_enabled_bulk(cls, user: User, objs: Iterable[Model]) -> dict[Any, bool]:
+        """
+        cv_action_enabled for many objects, keyed by pk. See cv_has_access_bulk.
+        """
+        return {obj.pk: cls.cv_action_enabled(user, obj) for obj in objs}
+
+    def get_object(self, queryset=None):
+        """
+        With cv_memoize_object, the object is fetched once per request and shared by the
+        permission check and the request handler. An explicit queryset always fetches.
+        """
+        if not self.cv_memoize_object or queryset is not None:
+            return super().get_object(queryset)
+        if "_cv_object" not in self.__dict__:
+            self._cv_object = super().get_object()
+        return self._cv_object
+
     def cv_get_action_object(self) -> Model | None:
         """The object an action concerns: the instance for object-views, the
         parent for child create-views, else None. Used by request enforcement."""
@@ -192,7 +266,8 @@ class CrudView(metaclass=CrudViewMetaClass):
         Either render the template_code or the template
         """
         if template_code:
-            template = Template(template_code)
+            # str(): lazy translations (gettext_lazy codes) must key the cache per language
+            template = cv_get_snippet_template(str(template_code))
             context = TemplateContext(data)
             result = template.render(context)
         elif template:
@@ -241,20 +316,65 @@ class CrudView(metaclass=CrudViewMetaClass):
 
     @classmethod
     def cv_get_action_label(cls, context: ViewContext) -> str:
-        return cls.render_snippet(
-            cls.cv_viewset.get_meta(context),
+        return cls.cv_render_action_label(
+            context,
             cls.cv_action_label_template,
             cls.cv_action_label_template_code,
         )
 
     @classmethod
     def cv_get_action_short_label(cls, context: ViewContext) -> str:
-        return cls.render_snippet(
-            cls.cv_viewset.get_meta(context),
+        return cls.cv_render_action_label(
+            context,
             cls.cv_action_short_label_template,
             cls.cv_action_short_label_template_code,
         )
 
+    @classmethod
+    def cv_is_action_label_object_independent(cls, template: str | None, template_code: str | None) -> bool:
+        """
+        Whether a label snippet renders the same for every object; cv_action_label_object_independent
+        overrides the detection.
+        """
+        if cls.cv_action_label_object_independent is not None:
+            return cls.cv_action_label_object_independent
+        code = str(template_code) if template_code else None
+        return not cv_snippet_references_object(template, code)
+
+    @classmethod
+    def cv_is_dict_object_independent(cls) -> bool:
+        """
+        Whether cv_get_dict returns the same for every object: neither it nor the label methods are
+        overridden (an override may read context.object) and both label snippets are object-independent.
+        """
+        for name in ("cv_get_dict", "cv_get_action_label", "cv_get_action_short_label", "cv_render_action_label"):
+            if getattr(cls, name).__func__ is not getattr(CrudView, name).__func__:
+                return False
+        return cls.cv_is_action_label_object_independent(
+            cls.cv_action_label_template, cls.cv_action_label_template_code
+        ) and cls.cv_is_action_label_object_independent(
+            cls.cv_action_short_label_template, cls.cv_action_short_label_template_code
+        )
+
+    @classmethod
+    def cv_render_action_label(cls, context: ViewContext, template: str | None, template_code: str | None) -> str:
+        """
+        Render an action label snippet.
+        Object-independent labels are rendered once per request per (view class, snippet, active language)
+        and memoized on the requesting view, so every row, context button and breadcrumb item reuses them.
+        """
+        if not cls.cv_is_action_label_object_independent(template, template_code):
+            return cls.render_snippet(cls.cv_viewset.get_meta(context), template, template_code)
+
+        view = context.view
+        cache = getattr(view, "_cv_action_label_cache", None)
+        if cache is None:
+            cache = view._cv_action_label_cache = {}
+        key = (cls, template, str(template_code) if template_code else None, get_language())
+        if key not in cache:
+            cache[key] = cls.render_snippet(cls.cv_viewset.get_meta(context), template, template_code)
+        return cache[key]
+
     @classmethod
     def cv_get_dict(cls, context: ViewContext, **extra) -> dict[str, Any]:
         """
@@ -348,7 +468,7 @@ class CrudView(metaclass=CrudViewMetaClass):
         Get the url for a sibling defined by key
         """
         router_name, _args, kwargs = self.cv_get_router_and_args(key=key, obj=obj, extra_kwargs=extra_kwargs)
-        url_path = reverse(router_name, kwargs=kwargs)
+        url_path = cv_reverse(router_name, kwargs)
         return url_path
 
     def cv_get_view_context(self, **kwargs) -> ViewContext:
@@ -363,6 +483,17 @@ class CrudView(metaclass=CrudViewMetaClass):
 
         return ViewContext(**kwargs)
 
+    def cv_get_fast_view_context(self, *args: Model | None) -> ViewContext:
+        """
+        Unvalidated cv_get_view_context() / cv_get_view_context(object=obj) for internal per-row
+        paths. Views overriding cv_get_view_context keep getting their own context.
+        """
+        if type(self).cv_get_view_context is not CrudView.cv_get_view_context:
+            return self.cv_get_view_context(**({"object": args[0]} if args else {}))
+        if args:
+            return ViewContext.model_construct(view=self, object=args[0])
+        return ViewContext.model_construct(view=self, object=self.object if self.cv_object else None)
+
     def cv_get_context_button(self, key: str) -> ContextButton | None:
         # view-level buttons take precedence over ViewSet-level buttons (issue #27)
         for cb in self.cv_context_buttons or []:
@@ -389,6 +520,78 @@ class CrudView(metaclass=CrudViewMetaClass):
             result.append(ctx)
         return result
 
+    def cv_get_row_actions(self, obj: Model | None = None, keys: list[str] | None = None) -> list[dict]:
+        """
+        Template contexts of the list actions for one row, one cv_get_context per key.
+        keys defaults to this view's cv_list_actions. The result feeds both the hidden POST forms
+        and the button group of the action column, so each action is resolved only once per row.
+        """
+        keys = keys if keys is not None else (self.cv_list_actions or [])
+        return [self.cv_get_context(key=key, obj=obj, user=self.request.user, request=self.request) for key in keys]
+
+    def cv_get_action_contexts_bulk(self, key: str, objects: Iterable[Model]) -> list[dict]:
+        """
+        cv_get_context for one key over many objects, in the objects' order.
+        Context buttons are resolved per object, an unregistered key yields {} for every object.
+        """
+        objects = list(objects)
+        user = self.request.user
+        if self.cv_get_context_button(key):
+            return [self.cv_get_context(key=key, obj=obj, user=user, request=self.request) for obj in objects]
+        try:
+            cls = self.cv_get_cls(key)
+        except ViewSetKeyFoundError:
+            return [{} for _ in objects]
+        return self.cv_get_view_contexts_bulk(cls, key, objects)
+
+    def cv_get_access_bulk(self, cls: type[Self], objects: list[Model]) -> dict[Any, bool]:
+        """
+        cls.cv_has_access_bulk for objects rendered by this view.
+        Views override it to hand request-scoped state (e.g. a permission cache) to the target class.
+        """
+        return cls.cv_has_access_bulk(self.request.user, objects)
+
+    def cv_get_view_contexts_bulk(self, cls: type[Self], key: str, objects: list[Model]) -> list[dict]:
+        """
+        The view branch of cv_get_context for many objects of a sibling view class.
+        Router name, parent and extra url kwargs are resolved once, and so is cls.cv_get_dict if it is
+        object-independent (cv_is_dict_object_independent); per object only the pk is put into the
+        url kwargs. Access and state come from cls.cv_has_access_bulk (via cv_get_access_bulk) and
+        cls.cv_action_enabled_bulk.
+        """
+        if not objects:
+            return []
+        user = self.request.user
+        router_name, _args, base_kwargs = self.cv_get_router_and_args(key=key, obj=objects[0])
+        pk_name = self.cv_viewset.pk_name
+
+        shared = None
+        if cls.cv_is_dict_object_independent():
+            shared = cls.cv_get_dict(context=self.cv_get_fast_view_context(objects[0]))
+
+        access = self.cv_get_access_bulk(cls, objects)
+        action_enabled = cls.cv_action_enabled_bulk(user, objects)
+
+        result = []
+        for obj in objects:
+            kwargs = base_kwargs
+            if cls.cv_object:
+                cv_raise(obj, f"view {cls} requires object")
+                kwargs = {**base_kwargs, pk_name: obj.pk}
+            dict_kwargs = {
+                "cv_access": access[obj.pk],
+                "cv_oid": self.cv_get_oid(key=key, obj=obj),
+                "cv_url": cv_reverse(router_name, kwargs),
+                "cv_template": crud_views_settings.context_button_template,
+                "cv_action_enabled": action_enabled[obj.pk],
+            }
+            if shared is None:
+                data = cls.cv_get_dict(context=self.cv_get_fast_view_context(obj), **dict_kwargs)
+            else:
+                data = {**shared, **dict_kwargs}
+            result.append(data)
+        return result
+
     def cv_get_oid(self, key: str, obj: Model | None = None) -> str | None:
         """
         get unique object id
@@ -406,7 +609,7 @@ class CrudView(metaclass=CrudViewMetaClass):
         """
 
         # first get the view context
-        context = self.cv_get_view_context(object=obj)
+        context = self.cv_get_fast_view_context(obj)
 
         # is the key a context button?
         context_button = self.cv_get_context_button(key)
@@ -428,9 +631,6 @@ class CrudView(metaclass=CrudViewMetaClass):
             "cv_template": crud_views_settings.context_button_template,
         }
 
-        # set up the view context
-        context = self.cv_get_view_context(object=obj)
-
         # button visibility — independent of access/permission
         dict_kwargs["cv_action_enabled"] = cls.cv_action_enabled(user, obj)
 
@@ -471,14 +671,14 @@ class CrudView(metaclass=CrudViewMetaClass):
                 kw[arg] = obj.pk  # it's me, because I'm linking to the child
             else:
                 kw[arg] = self.kwargs[arg]  # get value from the view's kwargs
-        url = reverse(name, kwargs=kw)
+        url = cv_reverse(name, kw)
         return url
 
     def cv_get_meta(self) -> dict:
         """
         Metadata from ViewSet plus ViewContext
         """
-        context = self.cv_get_view_context()
+        context = self.cv_get_fast_view_context()
         data = self.cv_viewset.get_meta(context=context)
 
         # add view specific data
@@ -495,14 +695,71 @@ class CrudView(metaclass=CrudViewMetaClass):
         Get parent object based on the view's kwargs
         """
         self.cv_assert_parent()
+        return self.cv_get_ancestor_object(0)
+
+    def cv_get_ancestor_object(self, level: int = 0) -> Model:
+        """
+        Ancestor object at level of the parent chain (0 is the immediate parent), from the view's kwargs.
+        The chain is resolved at most once per request, see cv_resolve_ancestors.
+        """
+        cache = getattr(self, "_cv_ancestor_cache", None)
+        if cache is None:
+            cache = self._cv_ancestor_cache = {}
+        if level not in cache:
+            self.cv_resolve_ancestors(cache)
+            cv_raise(level in cache, f"ViewSet {self.cv_viewset.name} has no ancestor at level {level}")
+        return cache[level]
+
+    def cv_resolve_ancestors(self, cache: dict[int, Model]):
+        """
+        Fill cache with the ancestor chain, {level: object}.
+        The innermost unresolved ancestor is fetched through its ViewSet's queryset, which is scoped by
+        all its own ancestors' pks from the view's kwargs (a tampered pk combination raises Http404),
+        with select_related along the chain's forward foreign keys, so all levels above come from the
+        same query. A level not reachable by a foreign key, or whose ViewSet overrides get_queryset
+        (ViewSet.scopes_queryset), starts the next query.
+        """
+        parents = []
+        parent = self.cv_viewset.parent
+        while parent is not None:
+            parents.append(parent)
+            parent = parent.viewset.parent
+
+        start = 0
+        while start < len(parents):
+            if start in cache:
+                start += 1
+                continue
 
-        assert self.cv_viewset.has_parent, "this ViewSet has no parent"
-
-        # get the parent object
-        parent_model = self.cv_viewset.get_parent_model()
-        arg = self.cv_viewset.get_parent_url_args(first_only=True)
-        pk = self.kwargs[arg]
-        return get_object_or_404(parent_model, pk=pk)
+            # follow the forward foreign keys up from the innermost unresolved ancestor
+            model = parents[start].viewset.model
+            attrs = []
+            for parent in parents[start + 1 :]:
+                field = model._meta.get_field(parent.get_attribute())
+                if not (field.concrete and (field.many_to_one or field.one_to_one)):
+                    break
+                if parent.viewset.scopes_queryset:
+                    break
+                attrs.append(field.name)
+                model = field.related_model
+
+            pk = self.kwargs[parents[start].get_pk_name()]
+            # ancestors are loaded in full: only() / defer() of their ViewSet may exclude the chain's keys;
+            # the relations their ViewSet prefetches are not read here
+            queryset = parents[start].viewset.get_queryset(view=self).defer(None).prefetch_related(None)
+            if attrs:
+                queryset = queryset.select_related("__".join(attrs))
+            try:
+                obj = queryset.get(pk=pk)
+            except ObjectDoesNotExist as err:
+                raise Http404(f"ancestor {parents[start].viewset.name}={pk!r} not found") from err
+
+            cache[start] = obj
+            for attr in attrs:
+                start += 1
+                obj = getattr(obj, attr)
+                cache.setdefault(start, obj)
+            start += 1
 
     def cv_get_parent_object_attribute(self) -> str:
         """
@@ -540,10 +797,10 @@ class CrudViewPermissionRequiredMixin(PermissionRequiredMixin):
         if not super().has_permission():
             return False
         # Secondary state gate — a disabled action is denied even with permission.
-        # Note: cv_get_action_object() re-fetches the object (object views call
-        # get_object() again in the body — a deliberate extra read), and a missing
-        # pk raises Http404 here, so a bad-pk request 404s during the permission
-        # phase rather than reaching the view. Returning False yields 403 for an
+        # Note: cv_get_action_object() fetches the object (object views call
+        # get_object() again in the body — an extra read unless cv_memoize_object
+        # is set), and a missing pk raises Http404 here, so a bad-pk request 404s
+        # during the permission phase rather than reaching the view. Returning False yields 403 for an
         # authenticated user (login redirect for anonymous — the pre-existing contract).
         obj = self.cv_get_action_object()
         return self.cv_action_enabled(self.request.user, obj)
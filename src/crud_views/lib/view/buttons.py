@@ -1,8 +1,8 @@
 from django.http import Http404
-from django.urls import reverse
 from pydantic import BaseModel, Field
 
 from ..settings import crud_views_settings
+from ..url_builder import cv_reverse
 from .context import ViewContext
 
 
@@ -106,7 +106,7 @@ class ParentContextButton(ContextButton):
 
         # parent url
         router_name = parent.viewset.get_router_name(key_target)
-        cv_url = reverse(router_name, kwargs=kwargs)
+        cv_url = cv_reverse(router_name, kwargs)
 
         # get the url for the target key
         dict_kwargs.update(cv_url=cv_url)
@@ -199,7 +199,7 @@ class SiblingContextButton(ContextButton):
 
         # the sibling shares the current view's parent chain, so reuse its URL args
         kwargs = {arg: context.view.kwargs[arg] for arg in sibling_vs.get_parent_url_args()}
-        cv_url = reverse(sibling_vs.get_router_name(sibling_key), kwargs=kwargs)
+        cv_url = cv_reverse(sibling_vs.get_router_name(sibling_key), kwargs)
 
         dict_kwargs = {
             "cv_access": False,
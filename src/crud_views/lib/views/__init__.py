@@ -8,8 +8,14 @@ from .action_ordered import (
 from .card import CardListView, CardListViewPermissionRequired
 from .child import RedirectChildView
 from .create import CreateView, CreateViewParentMixin, CreateViewPermissionRequired
-from .delete import DeleteView, DeleteViewPermissionRequired
+from .delete import (
+    DeleteProgressView,
+    DeleteProgressViewPermissionRequired,
+    DeleteView,
+    DeleteViewPermissionRequired,
+)
 from .detail import DetailView, DetailViewPermissionRequired
+from .export import ExportView, ExportViewPermissionRequired
 from .list import ListView, ListViewPermissionRequired
 from .mixins import ListViewTableFilterMixin, ListViewTableMixin, MessageMixin
 from .update import UpdateView, UpdateViewPermissionRequired
@@ -22,10 +28,14 @@ __all__ = [
     "CreateView",
     "CreateViewParentMixin",
     "CreateViewPermissionRequired",
+    "DeleteProgressView",
+    "DeleteProgressViewPermissionRequired",
     "DeleteView",
     "DeleteViewPermissionRequired",
     "DetailView",
     "DetailViewPermissionRequired",
+    "ExportView",
+    "ExportViewPermissionRequired",
     "ListView",
     "ListViewPermissionRequired",
     "ListViewTableFilterMixin",
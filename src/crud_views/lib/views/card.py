@@ -5,10 +5,10 @@ from django.views import generic
 from crud_views.lib.settings import crud_views_settings
 from crud_views.lib.view import CrudView, CrudViewPermissionRequiredMixin
 from crud_views.lib.view.card import CardAction
-from crud_views.lib.views.mixins import CardOrderMixin
+from crud_views.lib.views.mixins import CardOrderMixin, KeysetPaginationMixin
 
 
-class CardListView(CardOrderMixin, CrudView, generic.ListView):
+class CardListView(KeysetPaginationMixin, CardOrderMixin, CrudView, generic.ListView):
     template_name = "crud_views/view_card.html"
     cv_content_template = "crud_views/view_card.content.html"
 
@@ -33,6 +33,67 @@ class CardListView(CardOrderMixin, CrudView, generic.ListView):
     # icons
     cv_icon_action = "fa-solid fa-rectangle-list"
 
+    def cv_get_card_action_contexts(self, action: CardAction, objects: list) -> list[dict]:
+        """
+        Template contexts of one card action for many objects, in the objects' order.
+        """
+        user = self.request.user
+
+        if action.child_name:
+            child_viewset = self.cv_viewset.get_viewset(action.child_name)
+            child_cls = child_viewset.get_view_class(action.child_key)
+            action_enabled = child_cls.cv_action_enabled_bulk(user, objects)
+            return [
+                {
+                    "cv_access": True,
+                    "cv_action_enabled": action_enabled[obj.pk],
+                    "cv_url": self.cv_get_child_url(action.child_name, action.child_key, obj),
+                    "cv_label": action.label,
+                    "cv_icon_action": child_cls.cv_icon_action,
+                    "cv_variant": action.variant,
+                    "cv_flex": action.flex,
+                    "cv_no_label": action.no_label,
+                    "cv_list_action_method": "get",
+                }
+                for obj in objects
+            ]
+
+        cls = self.cv_viewset.get_view_class(action.key)
+        result = []
+        for data in self.cv_get_view_contexts_bulk(cls, action.key, objects):
+            if not data["cv_access"]:
+                result.append({"cv_access": False, "cv_action_enabled": data["cv_action_enabled"]})
+                continue
+            data.update(
+                cv_label=action.label or data["cv_action_short_label"],
+                cv_variant=action.variant,
+                cv_flex=action.flex,
+                cv_no_label=action.no_label,
+            )
+            result.append(data)
+        return result
+
+    def cv_get_row_actions_bulk(self, object_list) -> dict:
+        """
+        Card actions of a whole page, resolved action by action: {pk: [context per cv_card_actions entry]}.
+        """
+        objects = list(object_list)
+        columns = [self.cv_get_card_action_contexts(action, objects) for action in self.cv_card_actions]
+        return {obj.pk: [column[idx] for column in columns] for idx, obj in enumerate(objects)}
+
+    def cv_get_card_actions(self, obj, object_list=None) -> list[dict]:
+        """
+        Card action contexts of one object. With object_list, the page being rendered, the actions
+        of all its cards are resolved on first use and the following cards read them from that map.
+        """
+        page_actions = getattr(self, "_cv_card_actions", None)
+        if page_actions is None and object_list is not None:
+            page_actions = self._cv_card_actions = self.cv_get_row_actions_bulk(object_list)
+        actions = page_actions.get(obj.pk) if page_actions else None
+        if actions is None:  # not a card of the page
+            actions = [self.cv_get_card_action_contexts(action, [obj])[0] for action in self.cv_card_actions]
+        return actions
+
     @staticmethod
     def cv_get_filter_icon() -> str:
         return crud_views_settings.filter_icon
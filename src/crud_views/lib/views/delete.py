@@ -1,16 +1,24 @@
 import logging
 from collections import defaultdict
-from typing import NamedTuple
+from collections.abc import Iterable
+from typing import Any, NamedTuple
 
+from django.contrib import messages
 from django.contrib.admin.utils import NestedObjects
+from django.core.exceptions import FieldDoesNotExist
 from django.db import router
-from django.urls import NoReverseMatch, reverse
+from django.http import Http404, HttpResponse, JsonResponse
+from django.urls import NoReverseMatch
 from django.views import generic
 
+from crud_views.lib.cascade import CappedCollector, chunked_delete
+from crud_views.lib.check import Check, CheckExpression
+from crud_views.lib.delete_job import get_job, save_job, start_delete_job
 from crud_views.lib.settings import crud_views_settings
+from crud_views.lib.url_builder import cv_reverse
 from crud_views.lib.view import CrudView, CrudViewPermissionRequiredMixin
 from crud_views.lib.view.base import cv_is_modal_request
-from crud_views.lib.views.mixins import CrudViewProcessFormMixin
+from crud_views.lib.views.mixins import CrudViewProcessFormMixin, MessageMixin
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +42,15 @@ class DeleteView(CrudViewProcessFormMixin, CrudView, generic.DeleteView):
     # related objects
     cv_show_related_objects: bool = False
     cv_link_related_objects: bool = False
+    # None: collect all related objects; N: count them and show at most N per model (crud_views.lib.cascade)
+    cv_related_objects_limit: int | None = crud_views_settings.delete_related_objects_limit
+
+    # delete: "delete" (Model.delete()), "chunked" (in batches, crud_views.lib.cascade) or
+    # "background" (chunked, by an executor, polled at cv_delete_progress_key; crud_views.lib.delete_job)
+    cv_delete_strategy: str = crud_views_settings.delete_strategy
+    cv_delete_batch_size: int = crud_views_settings.delete_batch_size
+    cv_delete_executor: str | None = crud_views_settings.delete_executor
+    cv_delete_progress_key: str = "delete_progress"
 
     # texts and labels
     cv_header_template: str | None = "crud_views/snippets/header/delete.html"
@@ -47,8 +64,32 @@ class DeleteView(CrudViewProcessFormMixin, CrudView, generic.DeleteView):
     # messages
     cv_message_template: str | None = "crud_views/snippets/message/delete.html"
 
+    @classmethod
+    def checks(cls) -> Iterable[Check]:
+        yield from super().checks()
+        yield CheckExpression(
+            context=cls,
+            id="E280",
+            expression=cls.cv_delete_strategy in crud_views_settings.DELETE_STRATEGY_VALUES,
+            msg=f"cv_delete_strategy must be one of {crud_views_settings.DELETE_STRATEGY_VALUES}, "
+            f"got {cls.cv_delete_strategy!r}",
+        )
+        yield CheckExpression(
+            context=cls,
+            id="E281",
+            expression=cls.cv_delete_strategy != "background"
+            or (cls.cv_viewset is not None and cls.cv_viewset.is_view_registered(cls.cv_delete_progress_key)),
+            msg=f"cv_delete_strategy 'background' requires a view {cls.cv_delete_progress_key!r} "
+            f"(DeleteProgressView) at {cls.cv_viewset}",
+        )
+
     def cv_get_related_objects(self) -> RelatedObjects:
         using = router.db_for_write(self.object._meta.model)
+        if self.cv_related_objects_limit is not None:
+            capped = CappedCollector(using=using, limit=self.cv_related_objects_limit)
+            capped.collect(self.object)
+            return RelatedObjects(tree=capped.nested(), summary=dict(capped.summary), protected=capped.protected)
+
         collector = NestedObjects(using=using)
         collector.collect([self.object])
 
@@ -62,25 +103,76 @@ class DeleteView(CrudViewProcessFormMixin, CrudView, generic.DeleteView):
 
         return RelatedObjects(tree=tree, summary=dict(summary), protected=list(collector.protected))
 
-    def cv_get_related_object_url(self, obj) -> str | None:
-        from crud_views.lib.viewset import _REGISTRY
+    def cv_get_related_viewset(self, model):
+        """
+        The first registered ViewSet of model with a detail view, None if there is none.
+        """
+        from crud_views.lib.viewset import ViewSet
+
+        for viewset in ViewSet.get_viewsets_for_model(model):
+            if viewset.is_view_registered("detail"):
+                return viewset
+        return None
 
-        model = type(obj)
-        for viewset in _REGISTRY.values():
-            if viewset.model == model and viewset.is_view_registered("detail"):
+    def cv_get_related_object_url(self, obj) -> str | None:
+        return self.cv_get_related_object_urls([obj]).get(id(obj))
+
+    def cv_get_related_object_urls(self, objs: Iterable) -> dict[int, str]:
+        """
+        Detail URLs of objs by id(obj). The ViewSet and the parent pks are resolved once
+        per model, not per object.
+        """
+        by_model = defaultdict(list)
+        for obj in objs:
+            by_model[type(obj)].append(obj)
+
+        urls = {}
+        for model, instances in by_model.items():
+            viewset = self.cv_get_related_viewset(model)
+            if viewset is None:
+                continue
+            router_name = viewset.get_router_name("detail")
+            parent_pks = self._get_related_parent_pks(viewset, model, instances) if viewset.parent else {}
+            for obj in instances:
+                kwargs = {viewset.pk_name: obj.pk}
+                parent_pk = parent_pks.get(id(obj))
+                if parent_pk is not None:
+                    kwargs[viewset.parent.get_pk_name()] = parent_pk
                 try:
-                    router_name = viewset.get_router_name("detail")
-                    kwargs = {viewset.pk_name: obj.pk}
-                    if viewset.parent:
-                        parent_attr = viewset.parent.get_attribute()
-                        parent_obj = getattr(obj, parent_attr, None)
-                        if parent_obj:
-                            kwargs[viewset.parent.get_pk_name()] = parent_obj.pk
-                    return reverse(router_name, kwargs=kwargs)
+                    urls[id(obj)] = cv_reverse(router_name, kwargs)
                 except NoReverseMatch:
                     logger.debug("cannot reverse detail url for %r at %s", obj, viewset, exc_info=True)
-                    return None
-        return None
+        return urls
+
+    @staticmethod
+    def _get_related_parent_pks(viewset, model, objs: list) -> dict[int, Any]:
+        """
+        Parent pks of objs by id(obj): read from the foreign key column, else with one query.
+        """
+        attribute = viewset.parent.get_attribute()
+        try:
+            field = model._meta.get_field(attribute)
+        except FieldDoesNotExist:
+            field = None
+
+        if field is not None and field.many_to_one and field.target_field.primary_key:
+            return {id(obj): getattr(obj, field.attname) for obj in objs}
+
+        if field is not None and field.is_relation:
+            rows = (
+                model._base_manager.using(objs[0]._state.db)
+                .filter(pk__in=[obj.pk for obj in objs])
+                .values_list("pk", f"{attribute}__pk")
+            )
+            parent_pks = dict(rows)
+            return {id(obj): parent_pks.get(obj.pk) for obj in objs}
+
+        # not a model field, e.g. a property
+        result = {}
+        for obj in objs:
+            parent_obj = getattr(obj, attribute, None)
+            result[id(obj)] = parent_obj.pk if parent_obj else None
+        return result
 
     @staticmethod
     def _walk_nested(items):
@@ -151,10 +243,7 @@ class DeleteView(CrudViewProcessFormMixin, CrudView, generic.DeleteView):
 
             urls = {}
             if self.cv_link_related_objects:
-                for obj in self._walk_nested(related.tree):
-                    url = self.cv_get_related_object_url(obj)
-                    if url:
-                        urls[id(obj)] = url
+                urls = self.cv_get_related_object_urls(self._walk_nested(related.tree))
 
             context["related_objects"] = self._build_display_tree(related.tree, urls)
         return context
@@ -185,9 +274,90 @@ class DeleteView(CrudViewProcessFormMixin, CrudView, generic.DeleteView):
             self.cv_form_invalid_hook(context)
             return self.cv_form_invalid(context)
 
+    def cv_get_delete_strategy(self) -> str:
+        """
+        The delete strategy of this request. Only the modal of an authenticated user polls a
+        background delete, other requests delete chunked: their redirect and success message
+        would come before the delete.
+        """
+        strategy = self.cv_delete_strategy
+        if strategy == "background" and not (
+            self.cv_modal and cv_is_modal_request(self.request) and self.request.user.is_authenticated
+        ):
+            return "chunked"
+        return strategy
+
     def cv_form_valid(self, context: dict):
-        self.object.delete()
+        strategy = self.cv_get_delete_strategy()
+        if strategy == "delete":
+            self.object.delete()
+            return
+        using = router.db_for_write(self.object._meta.model)
+        if strategy == "chunked":
+            chunked_delete(self.object, using=using, batch_size=self.cv_delete_batch_size)
+            return
+        # the success url and message are built while the object still exists; the message is
+        # shown by the progress view once the job is done
+        self.cv_delete_job = start_delete_job(
+            self.object,
+            using=using,
+            batch_size=self.cv_delete_batch_size,
+            user=self.request.user,
+            redirect=self.get_success_url(),
+            message=self.cv_get_message() if isinstance(self, MessageMixin) else None,
+            executor=self.cv_delete_executor,
+        )
+
+    def cv_get_message(self, *, error: bool = False) -> str | None:
+        # a queued background delete has not deleted anything yet
+        if not error and getattr(self, "cv_delete_job", None) is not None:
+            return None
+        return super().cv_get_message(error=error)
+
+    def cv_form_valid_redirect(self, context: dict) -> HttpResponse:
+        """
+        A background delete gets 202 + X-CV-Progress, the url modal.js polls until the job is done.
+        """
+        job = getattr(self, "cv_delete_job", None)
+        if job is not None:
+            response = HttpResponse(status=202)
+            response["X-CV-Progress"] = f"{self.cv_get_url(key=self.cv_delete_progress_key)}?job={job.id}"
+            return response
+        return super().cv_form_valid_redirect(context)
 
 
 class DeleteViewPermissionRequired(CrudViewPermissionRequiredMixin, DeleteView):
     cv_permission = "delete"
+
+
+class DeleteProgressView(CrudView, generic.View):
+    """
+    The state of a background delete (DeleteView.cv_delete_strategy = "background") as JSON,
+    for the authenticated user who started it; the job id is the "job" query parameter.
+    The delete view's success message is added once the job is done.
+    """
+
+    cv_key = "delete_progress"
+    cv_path = "delete_progress"
+    cv_pk: bool = False
+    cv_object = False
+    cv_backend_only = True
+
+    # texts and labels
+    cv_action_label_template_code: str | None = "{% load i18n %}{% translate 'Delete progress' %}"
+    cv_action_short_label_template_code: str | None = "{% load i18n %}{% translate 'Delete progress' %}"
+
+    def get(self, request, *args, **kwargs):
+        job = get_job(request.GET.get("job", ""))
+        # a job without an owner is shown to nobody, not to every anonymous client
+        if job is None or job.user is None or job.user != str(request.user.pk):
+            raise Http404("delete job not found")
+        if job.state == "done" and job.message:
+            messages.success(request, job.message)
+            job.message = None
+            save_job(job)
+        return JsonResponse(job.model_dump(exclude={"id", "user", "message"}))
+
+
+class DeleteProgressViewPermissionRequired(CrudViewPermissionRequiredMixin, DeleteProgressView):
+    cv_permission = "delete"
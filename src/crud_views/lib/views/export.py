@@ -0,0 +1,198 @@
+import csv
+import json
+from collections.abc import Iterable, Iterator
+from copy import copy
+from operator import attrgetter
+from typing import ClassVar
+
+from django.core.exceptions import BadRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import QueryDict, StreamingHttpResponse
+from django.utils.encoding import force_str
+from django.views import generic
+from django_tables2.rows import BoundRow
+
+from crud_views.lib.check import Check, CheckExpression
+from crud_views.lib.session import SessionData
+from crud_views.lib.view import CrudView, CrudViewPermissionRequiredMixin
+
+
+class _Echo:
+    """
+    File-like object for csv.writer: write() returns the line instead of buffering it.
+    """
+
+    def write(self, value):
+        return value
+
+
+class ExportColumn:
+    """
+    A column of an export: name (JSON lines key), header (CSV header) and value(record).
+    """
+
+    def __init__(self, name: str, header: str, value):
+        self.name = name
+        self.header = header
+        self.value = value
+
+
+class ExportView(CrudView, generic.View):
+    """
+    Streams the rows of a list view as CSV or JSON lines.
+
+    The list view (cv_list_key) provides the queryset, the filter (filterset_class), the
+    ordering (table sort or card order) and, if it has one, the table whose columns are
+    exported. Without query parameters, the list view's persisted filter query string is used.
+    Rows are read with QuerySet.iterator(), so memory stays constant for any number of rows;
+    Resource rows are read from Resource.cv_iter_items() as they are written.
+    """
+
+    cv_key = "export"
+    cv_path = "export"
+    cv_pk: bool = False
+    cv_object = False
+    cv_backend_only = True
+
+    cv_list_key: str = "list"  # the list view to export
+    cv_export_formats: ClassVar[list[str]] = ["csv", "jsonl"]  # the first one is the default
+    cv_export_format_param: str = "format"
+    cv_export_chunk_size: int = 2000  # rows per database fetch
+    cv_export_fields: list[str] | None = None  # model or Resource fields, for list views without a table
+    cv_export_filename: str | None = None  # default: the ViewSet's name
+
+    # texts and labels
+    cv_action_label_template: str | None = "crud_views/snippets/action/export.html"
+    cv_action_short_label_template: str | None = "crud_views/snippets/action_short/export.html"
+
+    # icons
+    cv_icon_action = "fa-solid fa-file-export"
+
+    CONTENT_TYPES: ClassVar[dict[str, str]] = {
+        "csv": "text/csv; charset=utf-8",
+        "jsonl": "application/jsonl; charset=utf-8",
+    }
+
+    @classmethod
+    def checks(cls) -> Iterable[Check]:
+        yield from super().checks()
+        yield CheckExpression(
+            context=cls,
+            id="E270",
+            expression=bool(cls.cv_export_formats) and set(cls.cv_export_formats) <= set(cls.CONTENT_TYPES),
+            msg=f"cv_export_formats must be a non-empty subset of {list(cls.CONTENT_TYPES)}, "
+            f"got {cls.cv_export_formats!r}",
+        )
+
+    def get(self, request, *args, **kwargs):
+        export_format = request.GET.get(self.cv_export_format_param) or self.cv_export_formats[0]
+        if export_format not in self.cv_export_formats:
+            raise BadRequest(f"unknown export format {export_format!r}")
+        list_view = self.cv_get_list_view()
+        columns, records = self.cv_get_export(list_view)
+        if export_format == "csv":
+            content = self.cv_stream_csv(columns, records)
+        else:
+            content = self.cv_stream_jsonl(columns, records)
+        response = StreamingHttpResponse(content, content_type=self.CONTENT_TYPES[export_format])
+        filename = self.cv_export_filename or self.cv_viewset.name
+        response["Content-Disposition"] = f'attachment; filename="{filename}.{export_format}"'
+        return response
+
+    def cv_get_export_query(self, list_view) -> QueryDict:
+        """
+        The query string the list is exported with: this request's, or the one the list
+        view persisted if this request has none.
+        """
+        query = self.request.GET.copy()
+        query.pop(self.cv_export_format_param, None)
+        if not query and getattr(list_view, "cv_filter_persistence", False):
+            stored = SessionData.from_view(list_view).get(list_view.cv_session_key_querystring)
+            if stored:
+                query = QueryDict(stored, mutable=True)
+        return query
+
+    def cv_get_list_view(self):
+        """
+        The list view to export, set up for this request with the export query string.
+        """
+        list_view = self.cv_viewset.get_view_class(self.cv_list_key)()
+        list_view.setup(self.request, *self.args, **self.kwargs)
+        request = copy(self.request)
+        request.GET = self.cv_get_export_query(list_view)
+        list_view.request = request
+        return list_view
+
+    def cv_get_export_queryset(self, list_view):
+        """
+        The list view's queryset, filtered like the list.
+        """
+        filterset_class = getattr(list_view, "filterset_class", None)
+        if filterset_class is None:
+            return list_view.get_queryset()
+        filterset = list_view.get_filterset(filterset_class)
+        if filterset.is_bound and not filterset.is_valid():
+            return filterset.queryset.none()
+        return filterset.qs
+
+    def cv_get_export(self, list_view) -> tuple[list[ExportColumn], Iterator]:
+        """
+        The columns and the records to export, sorted like the list.
+        """
+        if self.cv_viewset.is_resource:
+            return self.cv_get_resource_export(list_view)
+        queryset = self.cv_get_export_queryset(list_view)
+        table = self.cv_get_export_table(list_view, queryset)
+        if table is None:
+            names = self.cv_export_fields or [f.name for f in queryset.model._meta.concrete_fields]
+            fields = [queryset.model._meta.get_field(name) for name in names]
+            columns = [ExportColumn(f.name, str(f.verbose_name), f.value_from_object) for f in fields]
+            return columns, queryset.iterator(chunk_size=self.cv_export_chunk_size)
+
+        order_by = list_view.request.GET.getlist(table.prefixed_order_by_field)
+        if order_by:
+            table.order_by = order_by
+        records = (BoundRow(record, table=table) for record in table.data.data.iterator(self.cv_export_chunk_size))
+        return self.cv_get_table_columns(table), records
+
+    def cv_get_resource_export(self, list_view) -> tuple[list[ExportColumn], Iterator]:
+        """
+        The columns and the rows of a Resource, read lazily from cv_iter_items() in its order.
+        """
+        records = list_view.model.cv_iter_items(self.request, **self.kwargs)
+        table = self.cv_get_export_table(list_view, [])
+        if table is None:
+            names = self.cv_export_fields or list(list_view.model.__pydantic_fields__)
+            columns = [ExportColumn(name, name, attrgetter(name)) for name in names]
+            return columns, records
+        return self.cv_get_table_columns(table), (BoundRow(record, table=table) for record in records)
+
+    def cv_get_export_table(self, list_view, data):
+        """
+        The list view's table over data; None if the list view has no table.
+        """
+        if not getattr(list_view, "table_class", None):
+            return None
+        return list_view.get_table_class()(data=data, **list_view.get_table_kwargs())
+
+    def cv_get_table_columns(self, table) -> list[ExportColumn]:
+        return [
+            ExportColumn(c.name, force_str(c.header), lambda row, _name=c.name: row.get_cell_value(_name))
+            for c in table.columns.iterall()
+            if not c.column.exclude_from_export
+        ]
+
+    def cv_stream_csv(self, columns: list[ExportColumn], records: Iterable) -> Iterator[str]:
+        writer = csv.writer(_Echo())
+        yield writer.writerow([c.header for c in columns])
+        for record in records:
+            yield writer.writerow([force_str(c.value(record), strings_only=True) for c in columns])
+
+    def cv_stream_jsonl(self, columns: list[ExportColumn], records: Iterable) -> Iterator[str]:
+        for record in records:
+            row = {c.name: force_str(c.value(record), strings_only=True) for c in columns}
+            yield json.dumps(row, cls=DjangoJSONEncoder) + "\n"
+
+
+class ExportViewPermissionRequired(CrudViewPermissionRequiredMixin, ExportView):
+    cv_permission = "view"
@@ -5,12 +5,18 @@ from typing import ClassVar
 from urllib.parse import parse_qs, urlencode
 
 from django.contrib import messages
+from django.core.checks import CheckMessage
+from django.core.checks import Warning as CheckWarning
 from django.core.exceptions import BadRequest
+from django.core.paginator import Paginator
 from django.http import HttpResponse, HttpResponseRedirect, JsonResponse
 from django_filters.views import FilterView
 from django_tables2 import SingleTableMixin
 
 from crud_views.lib.check import Check, CheckTemplateOrCode
+from crud_views.lib.count import CountPaginator, ListCount, count_queryset, count_sql
+from crud_views.lib.keyset import KeysetPaginator
+from crud_views.lib.query import accessor_relations, is_covered
 from crud_views.lib.session import SessionData
 from crud_views.lib.settings import crud_views_settings
 from crud_views.lib.view.base import cv_is_modal_request
@@ -194,7 +200,7 @@ class CardOrderMixin:
         context["cv_order_dir_param"] = self.cv_order_dir_param
         # all current GET params except order/dir/page, for the toolbar's hidden inputs
         preserved = []
-        skip = {self.cv_order_param, self.cv_order_dir_param, "page"}
+        skip = {self.cv_order_param, self.cv_order_dir_param, "page", getattr(self, "cv_keyset_cursor_param", None)}
         for key in self.request.GET:
             if key in skip:
                 continue
@@ -204,7 +210,80 @@ class CardOrderMixin:
         return context
 
 
-class ListViewTableMixin(SingleTableMixin):
+class KeysetPaginationMixin:
+    """
+    Opt-in keyset (seek) pagination for list views, see crud_views.lib.keyset.
+    Pages are addressed by a cursor GET parameter instead of a page number.
+    """
+
+    cv_keyset_pagination: bool = False
+    cv_keyset_cursor_param: str = "cursor"
+
+    def cv_get_keyset_kwargs(self) -> dict:
+        return {
+            "cursor": self.request.GET.get(self.cv_keyset_cursor_param),
+            "cursor_param": self.cv_keyset_cursor_param,
+        }
+
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        if not self.cv_keyset_pagination:
+            return super().get_paginator(queryset, per_page, orphans, allow_empty_first_page, **kwargs)
+        return KeysetPaginator(queryset, per_page, **self.cv_get_keyset_kwargs())
+
+
+class CheckTableRelations(Check):
+    """
+    Warn about table columns that cross a relation the view's queryset does not fetch
+    (select_related / prefetch_related of the ViewSet and view): one query per row.
+    """
+
+    id: str = "W290"
+    msg: str = (
+        "column »{column}« of {table} crosses the relation »{path}« which is not in {lookups} of "
+        "»{context}« — it is fetched once per row"
+    )
+
+    def _queryset_is_custom(self) -> bool:
+        # a get_queryset outside crud_views may shape the queryset itself
+        for klass in self.context.__mro__:
+            if "get_queryset" in vars(klass):
+                return not klass.__module__.startswith("crud_views")
+        return False
+
+    def messages(self) -> Iterable[CheckMessage]:
+        view = self.context
+        table_class = getattr(view, "table_class", None)
+        viewset = getattr(view, "cv_viewset", None)
+        if not isinstance(table_class, type) or viewset is None or viewset.is_resource:
+            return
+        if self._queryset_is_custom():
+            return
+        from crud_views.lib.table.plan import column_accessor, get_table_query_plan
+
+        options = viewset.get_query_options(view)
+        select_related = options["select_related"] or []
+        prefetch_related = options["prefetch_related"] or []
+        if getattr(view, "cv_table_query_plan", None):
+            select_related = [*select_related, *get_table_query_plan(table_class, viewset.model).select_related]
+        for name, column in table_class.base_columns.items():
+            accessor = column_accessor(name, column)
+            if accessor is None:
+                continue
+            select, prefetch = accessor_relations(viewset.model, accessor)
+            missing = []
+            if select and not is_covered(select, [*select_related, *prefetch_related]):
+                missing.append((select, "select_related"))
+            if prefetch and not is_covered(prefetch, prefetch_related):
+                missing.append((prefetch, "prefetch_related"))
+            for path, lookups in missing:
+                yield CheckWarning(
+                    self.msg.format(column=name, table=table_class.__name__, path=path, lookups=lookups, context=view),
+                    hint=f"Add {path!r} to cv_{lookups} of the view or {lookups} of the ViewSet.",
+                    id=self.get_id(),
+                )
+
+
+class ListViewTableMixin(KeysetPaginationMixin, SingleTableMixin):
     """
     Mixin for ListView to render tables with django-tables2
     """
@@ -216,9 +295,95 @@ class ListViewTableMixin(SingleTableMixin):
     table_class: str = None
     paginate_by: int = 10
 
+    # derive the queryset's select_related ("select_related") and also an only() projection
+    # ("only") from the table's column accessors, see crud_views.lib.table.plan
+    cv_table_query_plan: str | None = crud_views_settings.table_query_plan
+
+    # how pages count the rows: "exact", "cached" or "estimate", see crud_views.lib.count
+    cv_count: str = crud_views_settings.list_count
+    cv_count_cache_timeout: int | None = None  # None: CRUD_VIEWS_LIST_COUNT_CACHE_TIMEOUT
+    cv_count_estimate_threshold: int | None = None  # None: CRUD_VIEWS_LIST_COUNT_ESTIMATE_THRESHOLD
+
+    @classmethod
+    def checks(cls) -> Iterable[Check]:
+        yield from super().checks()
+        yield CheckTableRelations(context=cls)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if not self.cv_table_query_plan or not isinstance(self.table_class, type):
+            return queryset
+        from crud_views.lib.table.plan import get_table_query_plan
+
+        plan = get_table_query_plan(self.table_class, queryset.model)
+        if plan.select_related:
+            queryset = queryset.select_related(*plan.select_related)
+        options = self.cv_viewset.get_query_options(self)
+        # declared only() / defer() win over the derived projection
+        if self.cv_table_query_plan == "only" and plan.only and not (options["only"] or options["defer"]):
+            queryset = queryset.only(*plan.only)
+        return queryset
+
     def get_table_kwargs(self):
         return {"view": self}
 
+    def cv_get_count(self, queryset) -> ListCount:
+        """
+        Row count of queryset by cv_count. Counted once per request: the ListView's and the
+        table's paginator count the same rows.
+        """
+        sql = count_sql(queryset)
+        if sql is None:
+            return ListCount(0)
+        counts = self.__dict__.setdefault("_cv_counts", {})
+        key = (queryset.db, sql[0], repr(sql[1]))
+        if key not in counts:
+            counts[key] = count_queryset(
+                queryset,
+                self.cv_count,
+                cache_timeout=self.cv_count_cache_timeout,
+                estimate_threshold=self.cv_count_estimate_threshold,
+            )
+        return counts[key]
+
+    def cv_get_count_kwargs(self) -> dict:
+        return {"counter": self.cv_get_count, "exact": self.cv_count == "exact"}
+
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        if self.cv_keyset_pagination or self.paginator_class is not Paginator:
+            return super().get_paginator(queryset, per_page, orphans, allow_empty_first_page, **kwargs)
+        return CountPaginator(queryset, per_page, orphans, allow_empty_first_page, **self.cv_get_count_kwargs())
+
+    def get_table_pagination(self, table):
+        paginate = super().get_table_pagination(table)
+        if not paginate:
+            return paginate
+        from crud_views.lib.table.paginator import TableCountPaginator, TableKeysetPaginator
+
+        paginate = {} if paginate is True else dict(paginate)
+        if self.cv_keyset_pagination:
+            paginate.pop("orphans", None)
+            paginate.update(paginator_class=TableKeysetPaginator, **self.cv_get_keyset_kwargs())
+        elif paginate.get("paginator_class", Paginator) is Paginator:
+            paginate.update(paginator_class=TableCountPaginator, **self.cv_get_count_kwargs())
+        return paginate
+
+    def paginate_queryset(self, queryset, page_size):
+        # keyset: the table pages itself, a second paginator would only run another query
+        if self.cv_keyset_pagination:
+            return None, None, queryset, False
+        return super().paginate_queryset(queryset, page_size)
+
+    def cv_get_row_actions_bulk(self, object_list, keys: list[str] | None = None) -> dict:
+        """
+        Row actions of a whole page, resolved key by key: {pk: [context per key]}.
+        keys defaults to this view's cv_list_actions, see cv_get_row_actions for a single row.
+        """
+        objects = list(object_list)
+        keys = keys if keys is not None else (self.cv_list_actions or [])
+        columns = [self.cv_get_action_contexts_bulk(key, objects) for key in keys]
+        return {obj.pk: [column[idx] for column in columns] for idx, obj in enumerate(objects)}
+
 
 class ListViewTableFilterMixin(FilterView):
     """
@@ -1,5 +1,5 @@
 import threading
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 from collections.abc import Iterable
 from functools import cached_property
 from typing import Any, ClassVar, Self
@@ -8,10 +8,12 @@ from django.contrib.auth.models import Permission
 from django.contrib.contenttypes.models import ContentType
 from django.db.models import Model, Q, QuerySet
 from django.urls import URLResolver, re_path
+from django.utils.translation import get_language
 from django.utils.translation import gettext as _
 from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 from crud_views.lib.exceptions import ViewSetKeyFoundError, ViewSetNotFoundError, cv_raise
+from crud_views.lib.query import apply_query_options
 from crud_views.lib.resource import Resource
 from crud_views.lib.viewset import path_regs
 
@@ -52,6 +54,8 @@ def context_buttons_default(*args, **kwargs) -> Any:
 
 _REGISTRY = OrderedDict()
 _REGISTRY_LOCK = threading.Lock()
+# model -> ViewSets of the model in registration order, maintained by ViewSet.register
+_MODEL_INDEX: dict[type, list] = defaultdict(list)
 
 
 class ViewSet(BaseModel):
@@ -91,8 +95,16 @@ class ViewSet(BaseModel):
     # {"view": "storage.view_s3object", "delete": "storage.delete_s3object"}.
     # None means: no permissions declared (only non-PermissionRequired views).
     resource_permissions: dict[str, str] | None = None
+    # queryset shaping applied in get_queryset, see crud_views.lib.query;
+    # views add to select_related / prefetch_related and replace only / defer (cv_* attributes)
+    select_related: list[str] | None = None
+    prefetch_related: list[Any] | None = None  # lookups or Prefetch objects
+    only: list[str] | None = None
+    defer: list[str] | None = None
 
     _views: dict[str, type[CrudView]] = PrivateAttr(default_factory=empty_dict)
+    # static part of get_meta per active language
+    _meta_cache: dict[str | None, dict] = PrivateAttr(default_factory=empty_dict)
 
     def __repr__(self):
         return f"ViewSet({self.name})"
@@ -131,6 +143,7 @@ class ViewSet(BaseModel):
                 f"ViewSet name {self.name} is already registered by {_REGISTRY.get(self.name)!r}",
             )
             _REGISTRY[self.name] = self
+            _MODEL_INDEX[self.model].append(self)
 
         # ManageView is model/session tooling — not supported for Resources (spec §5.4)
         if not self.is_resource:
@@ -145,6 +158,16 @@ class ViewSet(BaseModel):
             raise ViewSetNotFoundError(name)
         return _REGISTRY[name]
 
+    @staticmethod
+    def get_viewsets_for_model(model: type) -> list[Self]:
+        """
+        The registered ViewSets of model, in registration order
+        """
+        with _REGISTRY_LOCK:
+            viewsets = list(_MODEL_INDEX.get(model, ()))
+        # a ViewSet removed from the registry is no longer listed
+        return [viewset for viewset in viewsets if _REGISTRY.get(viewset.name) is viewset]
+
     @staticmethod
     def checks_all() -> Iterable[Check]:
         """
@@ -236,6 +259,14 @@ class ViewSet(BaseModel):
     def has_parent(self) -> bool:
         return self.parent is not None
 
+    @property
+    def scopes_queryset(self) -> bool:
+        """
+        get_queryset is overridden, e.g. by a tenant or ownership filter: objects of this ViewSet
+        are only loaded through it, never as a related object of a child's query
+        """
+        return type(self).get_queryset is not ViewSet.get_queryset
+
     def get_parent_model(self):
         if self.parent:
             return self.parent.viewset.model
@@ -294,7 +325,30 @@ class ViewSet(BaseModel):
         if self.ordering:
             queryset = queryset.order_by(self.ordering)
 
-        return queryset
+        return apply_query_options(queryset, **self.get_query_options(view))
+
+    def get_query_options(self, view: CrudView | None = None) -> dict[str, list | None]:
+        """
+        select_related, prefetch_related, only and defer of the ViewSet, combined with the cv_*
+        attributes of view if it is one of this ViewSet's views (not a child view fetching a parent).
+        """
+        options = {
+            "select_related": self.select_related,
+            "prefetch_related": self.prefetch_related,
+            "only": self.only,
+            "defer": self.defer,
+        }
+        if view is None or view.cv_viewset is not self:
+            return options
+        for name in ("select_related", "prefetch_related"):
+            extra = getattr(view, f"cv_{name}")
+            if extra:
+                options[name] = [*(options[name] or []), *extra]
+        for name in ("only", "defer"):
+            value = getattr(view, f"cv_{name}")
+            if value is not None:
+                options[name] = value
+        return options
 
     def register_view_class(self, key: str, view_class: type[CrudView]):
         cv_raise(key not in self._views, f"key {key} already registered at {self}")
@@ -454,19 +508,23 @@ class ViewSet(BaseModel):
     def get_meta(self, context: ViewContext) -> dict:
         """
         Meta data plus X for template context.
+        The names are computed once per active language, only the context is merged per call.
         """
-        meta = self.model._meta
-        data = {
-            "viewset": self,
-            "cv": self,
-            "verbose_name": meta.verbose_name.capitalize(),
-            "verbose_name_plural": meta.verbose_name_plural.capitalize(),
-        }
-        data.update(
-            {
-                "verbose_name_translate": _(data["verbose_name"]),
-                "verbose_name_plural_translate": _(data["verbose_name_plural"]),
+        language = get_language()
+        base = self._meta_cache.get(language)
+        if base is None:
+            meta = self.model._meta
+            base = {
+                "viewset": self,
+                "cv": self,
+                "verbose_name": meta.verbose_name.capitalize(),
+                "verbose_name_plural": meta.verbose_name_plural.capitalize(),
             }
-        )
-        data.update(context.to_dict())
-        return data
+            base.update(
+                {
+                    "verbose_name_translate": _(base["verbose_name"]),
+                    "verbose_name_plural_translate": _(base["verbose_name_plural"]),
+                }
+            )
+            self._meta_cache[language] = base
+        return {**base, **context.to_dict()}
@@ -5,6 +5,8 @@
  *   GET  url  + X-CV-Modal: true  -> 200 modal partial (modal-header + modal-body)
  *   POST form + X-CV-Modal: true  -> 204 + X-CV-Redirect header (success: navigate)
  *                                 -> 422 + re-rendered partial   (validation errors: swap)
+ *                                 -> 202 + X-CV-Progress header  (background delete: poll the
+ *                                    JSON job state, navigate to its redirect when done)
  * Anything else falls back to a full-page navigation — never strand the user in a broken modal.
  *
  * After every injection a "cv:modal:loaded" CustomEvent is dispatched on #cv-modal
@@ -17,6 +19,7 @@ const CVModalConst = Object.freeze({
     content: "cv-modal-content",
     urlAttr: "data-cv-url",
     loadedEvent: "cv:modal:loaded",
+    progressInterval: 1000,
 });
 
 function cvModalElements() {
@@ -64,6 +67,46 @@ function cvModalOpen(url, size) {
         });
 }
 
+function cvModalProgress(url, fallback) {
+    const els = cvModalElements(),
+        body = els.content.querySelector(".modal-body") || els.content;
+    body.innerHTML =
+        '<div class="progress" role="progressbar" aria-valuemin="0" aria-valuemax="100">' +
+        '<div class="progress-bar progress-bar-striped progress-bar-animated"></div></div>' +
+        '<div class="cv-modal-progress-error text-danger mt-2"></div>';
+    const bar = body.querySelector(".progress-bar");
+    bar.style.width = "0%";
+
+    function poll() {
+        fetch(url, {headers: {"X-CV-Modal": "true"}})
+            .then(function (response) {
+                if (!response.ok) {
+                    throw new Error("cvModal: progress " + response.status);
+                }
+                return response.json();
+            })
+            .then(function (job) {
+                const percent = job.total ? Math.round(100 * job.deleted / job.total) : 0;
+                bar.style.width = percent + "%";
+                bar.parentElement.setAttribute("aria-valuenow", String(percent));
+                if (job.state === "done") {
+                    window.location.assign(job.redirect || fallback);
+                } else if (job.state === "failed") {
+                    bar.classList.remove("progress-bar-animated");
+                    bar.classList.add("bg-danger");
+                    body.querySelector(".cv-modal-progress-error").textContent = job.error || "";
+                } else {
+                    setTimeout(poll, CVModalConst.progressInterval);
+                }
+            })
+            .catch(function () {
+                window.location.assign(fallback);
+            });
+    }
+
+    poll();
+}
+
 function cvModalSubmit(form) {
     const els = cvModalElements(),
         url = form.getAttribute("action"),
@@ -79,6 +122,11 @@ function cvModalSubmit(form) {
                 window.location.assign(redirect);
                 return null;
             }
+            const progress = response.headers.get("X-CV-Progress");
+            if (response.status === 202 && progress) {
+                cvModalProgress(progress, fallback);
+                return null;
+            }
             if (response.status === 422) {
                 return response.text();
             }
@@ -112,4 +160,4 @@ $(document).ready(function () {
 // are already implicit window globals in the browser (top-level declarations);
 // this only adds `CVModalConst` and namespaced access for the unit tests.
 window.cv = window.cv || {};
-Object.assign(window.cv, {CVModalConst, cvModalElements, cvModalInject, cvModalOpen, cvModalSubmit});
+Object.assign(window.cv, {CVModalConst, cvModalElements, cvModalInject, cvModalOpen, cvModalProgress, cvModalSubmit});
@@ -1,3 +1,5 @@
+from functools import partial
+
 from django import template
 from django.template.loader import get_template, render_to_string
 from django.utils.safestring import mark_safe
@@ -6,7 +8,7 @@ from django_tables2.templatetags import django_tables2 as _dt2
 from crud_views.lib import assets
 from crud_views.lib.exceptions import ViewSetKeyFoundError, ignore_exception
 from crud_views.lib.settings import crud_views_settings
-from crud_views.lib.view import CrudView
+from crud_views.lib.view import CrudView, ViewContext
 
 register = template.Library()
 
@@ -72,6 +74,8 @@ def cv_get_view(context) -> CrudView:
 
 def cv_get_context(context, key, obj=None) -> dict:
     view: CrudView = cv_get_view(context)
+    # templates pass "" for a missing object; the view's context paths do not validate
+    obj = ViewContext.validate_object(obj)
     context = view.cv_get_context(key, obj=obj, user=context["request"].user, request=context["request"])
     return context
 
@@ -116,6 +120,27 @@ def cv_list_action_form(context, key, obj=None):
     return cv_get_context(context=context, key=key, obj=obj)
 
 
+@register.simple_tag(takes_context=True)
+def cv_row_actions(context, obj=None) -> list[dict]:
+    """
+    Resolved list-action contexts for one row, in cv_list_actions order; render each entry
+    with cv_render_list_action_form and cv_render_list_action.
+    """
+    obj = obj if obj else None  # fix empty string from template
+    view = cv_get_view(context)
+    return view.cv_get_row_actions(obj)
+
+
+@register.inclusion_tag(f"{crud_views_settings.theme_path}/tags/list_action.html")
+def cv_render_list_action(ctx):
+    return ctx
+
+
+@register.inclusion_tag(f"{crud_views_settings.theme_path}/tags/list_action_form.html")
+def cv_render_list_action_form(ctx):
+    return ctx
+
+
 @register.simple_tag(takes_context=True)
 @ignore_exception(ViewSetKeyFoundError, default_value="")
 def cv_context_action(context, key, obj=None):
@@ -262,11 +287,13 @@ def cv_render_filter(context):
 def cv_pagination(context):
     request = context.get("request")
     params = request.GET.copy() if request is not None else {}
+    page_obj = context.get("page_obj")
     if hasattr(params, "pop"):
         params.pop("page", None)
+        params.pop(getattr(page_obj, "cursor_param", None), None)
     base_qs = params.urlencode() if hasattr(params, "urlencode") else ""
     return {
-        "page_obj": context.get("page_obj"),
+        "page_obj": page_obj,
         "paginator": context.get("paginator"),
         "is_paginated": context.get("is_paginated", False),
         "base_qs": base_qs,
@@ -300,50 +327,12 @@ def cv_context_has_permission(view, key) -> bool:
 @register.inclusion_tag(f"{crud_views_settings.theme_path}/tags/card_action.html", takes_context=True)
 def cv_card_action(context, action, obj=None):
     view = cv_get_view(context)
+    return view.cv_get_card_action_contexts(action, [obj])[0]
 
-    if action.child_name:
-        url = view.cv_get_child_url(action.child_name, action.child_key, obj)
-        child_viewset = view.cv_viewset.get_viewset(action.child_name)
-        child_cls = child_viewset.get_view_class(action.child_key)
-        return {
-            "cv_access": True,
-            "cv_action_enabled": child_cls.cv_action_enabled(context["request"].user, obj),
-            "cv_url": url,
-            "cv_label": action.label,
-            "cv_icon_action": child_cls.cv_icon_action,
-            "cv_variant": action.variant,
-            "cv_flex": action.flex,
-            "cv_no_label": action.no_label,
-            "cv_list_action_method": "get",
-        }
 
-    user = context["request"].user
-    cls = view.cv_viewset.get_view_class(action.key)
-    access = cls.cv_has_access(user, obj)
-    action_enabled = cls.cv_action_enabled(user, obj)
-
-    if not access:
-        return {"cv_access": False, "cv_action_enabled": action_enabled}
-
-    url = view.cv_get_url(action.key, obj=obj)
-    view_context = view.cv_get_view_context(object=obj)
-
-    label = action.label or cls.cv_get_action_short_label(context=view_context)
-
-    data = cls.cv_get_dict(
-        context=view_context,
-        cv_oid=view.cv_get_oid(action.key, obj=obj),
-        cv_url=url,
-        cv_access=True,
-        cv_action_enabled=action_enabled,
-    )
-    data.update(
-        cv_label=label,
-        cv_variant=action.variant,
-        cv_flex=action.flex,
-        cv_no_label=action.no_label,
-    )
-    return data
+@register.inclusion_tag(f"{crud_views_settings.theme_path}/tags/card_action.html")
+def cv_render_card_action(ctx):
+    return ctx
 
 
 @register.simple_tag(takes_context=True)
@@ -362,7 +351,13 @@ def cv_card(context, obj):
     template_name = getattr(view, "cv_card_template", "crud_views/tags/card.html")
     t = get_template(template_name)
     request = context["request"]
-    card_context = {"object": obj, "view": view, "request": request}
+    card_context = {
+        "object": obj,
+        "view": view,
+        "request": request,
+        # a callable, so the page's card actions are only resolved if the card template reads them
+        "card_actions": partial(view.cv_get_card_actions, obj, context.get("object_list")),
+    }
     # Pass request= explicitly so Template.render() builds a RequestContext (not a plain Context).
     # Without it, built-in context processors (e.g. csrf) never run, so {% csrf_token %} in any
     # template included from here (e.g. card_action.html's hidden POST form) silently renders empty.
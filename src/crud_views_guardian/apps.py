@@ -7,4 +7,8 @@ class CrudViewsGuardianConfig(AppConfig):
     label = "cvg"
 
     def ready(self):
-        pass
+        from crud_views_guardian.lib.pk_cache import connect_signals, enabled
+
+        # without the pk cache, permission changes have nothing to invalidate
+        if enabled():
+            connect_signals()
@@ -1,13 +1,46 @@
 import logging
+from collections.abc import Iterable
+from functools import cached_property
 
 from django.core.exceptions import PermissionDenied
 from django.http import Http404
-from django.shortcuts import get_object_or_404
+
+from crud_views.lib.check import Check, CheckExpression
+from crud_views.lib.settings import crud_views_settings
+from crud_views.lib.views import ExportView
+from crud_views_guardian.lib.pk_cache import get_objects_for_user_cached
 
 logger = logging.getLogger(__name__)
 
 
-class GuardianObjectPermissionMixin:
+class GuardianCheckerMixin:
+    """
+    One guardian ObjectPermissionChecker per request (view instance).
+
+    The checker caches the permissions it has read per object; cv_guardian_prefetch
+    reads them for many objects with one query for user and one for group permissions.
+    """
+
+    @cached_property
+    def cv_guardian_checker(self):
+        from guardian.core import ObjectPermissionChecker
+
+        return ObjectPermissionChecker(self.request.user)
+
+    def cv_guardian_prefetch(self, objects):
+        """
+        The request's checker, with the permissions of objects not seen before prefetched.
+        """
+        checker = self.cv_guardian_checker
+        prefetched = self.__dict__.setdefault("_cv_guardian_prefetched", set())
+        missing = [obj for obj in objects if (type(obj), obj.pk) not in prefetched]
+        if missing:
+            checker.prefetch_perms(missing)
+            prefetched.update((type(obj), obj.pk) for obj in missing)
+        return checker
+
+
+class GuardianObjectPermissionMixin(GuardianCheckerMixin):
     """
     For single-object views (Detail, Update, Delete, Action).
 
@@ -18,8 +51,8 @@ class GuardianObjectPermissionMixin:
     which checks only guardian's object-level tables — no model-level fallback.
     Set to True to use user.has_perm(perm, obj) which includes model-level fallback.
 
-    Also overrides cv_has_access() so per-row action buttons in list views
-    reflect per-object access correctly.
+    Also overrides cv_has_access() and cv_has_access_bulk() so per-row action
+    buttons in list views reflect per-object access correctly.
 
     Overrides has_permission() to always return True — model-level permission is
     not required; all access control is delegated to get_object().
@@ -42,9 +75,11 @@ class GuardianObjectPermissionMixin:
         # set when obj is passed, so we must call has_perm without obj here).
         if self.cv_guardian_accept_global_perms and user.has_perm(perm):
             return True
-        from guardian.core import ObjectPermissionChecker
+        checker = self.cv_guardian_checker if user == self.request.user else None
+        if checker is None:
+            from guardian.core import ObjectPermissionChecker
 
-        checker = ObjectPermissionChecker(user)
+            checker = ObjectPermissionChecker(user)
         return checker.has_perm(perm.split(".")[1], obj)
 
     def get_object(self):
@@ -71,8 +106,27 @@ class GuardianObjectPermissionMixin:
             return checker.has_perm(perm.split(".")[1], obj)
         return False
 
+    @classmethod
+    def cv_has_access_bulk(cls, user, objs, checker=None):
+        """
+        Per-object access for a page of objects. Without a checker, one is created and
+        prefetched for objs; list and card views pass their request's prefetched checker.
+        """
+        objs = list(objs)
+        perm = cls.cv_viewset.permissions.get(cls.cv_permission)
+        if cls.cv_guardian_accept_global_perms and user.has_perm(perm):
+            return {obj.pk: True for obj in objs}
+        if checker is None:
+            from guardian.core import ObjectPermissionChecker
+
+            checker = ObjectPermissionChecker(user)
+            if objs:
+                checker.prefetch_perms(objs)
+        codename = perm.split(".")[1]
+        return {obj.pk: checker.has_perm(codename, obj) for obj in objs}
+
 
-class GuardianQuerysetMixin:
+class GuardianQuerysetMixin(GuardianCheckerMixin):
     """
     For list views.
 
@@ -90,11 +144,47 @@ class GuardianQuerysetMixin:
     accessible; queryset filtering is the sole gate. This ensures "list" and
     "parent" context action buttons are always visible regardless of whether
     an object is provided.
+
+    cv_guardian_pk_cache = True filters with the user's cached permitted pks
+    (crud_views_guardian.lib.pk_cache) instead of guardian's subquery. It requires
+    CRUD_VIEWS_GUARDIAN_PK_CACHE, which connects the invalidation (check E285).
     """
 
     cv_guardian_accept_global_perms: bool = False
+    cv_guardian_pk_cache: bool = crud_views_settings.guardian_pk_cache
     cv_guardian_anonymous_behavior: str = "redirect"
 
+    @classmethod
+    def checks(cls) -> Iterable[Check]:
+        yield from super().checks()
+        yield CheckExpression(
+            context=cls,
+            id="E285",
+            expression=not cls.cv_guardian_pk_cache or crud_views_settings.guardian_pk_cache,
+            msg="cv_guardian_pk_cache requires CRUD_VIEWS_GUARDIAN_PK_CACHE = True, "
+            "without it permission changes do not invalidate the cache",
+        )
+        yield CheckExpression(
+            context=cls,
+            id="E286",
+            expression=all(issubclass(view, GuardianParentPermissionMixin) for view in cls.cv_get_export_views()),
+            msg="the export view of a guardian list view must be a GuardianExportViewPermissionRequired, "
+            "other export views skip the parent permission check",
+        )
+
+    @classmethod
+    def cv_get_export_views(cls) -> list[type]:
+        """
+        The ExportViews of the ViewSet that export this list view.
+        """
+        if cls.cv_viewset is None or cls.cv_key is None:
+            return []
+        return [
+            view
+            for view in cls.cv_viewset.get_all_views().values()
+            if issubclass(view, ExportView) and view.cv_list_key == cls.cv_key
+        ]
+
     def has_permission(self):
         if not self.request.user.is_authenticated:
             if self.cv_guardian_anonymous_behavior == "404":
@@ -156,11 +246,24 @@ class GuardianQuerysetMixin:
 
         return ctx
 
+    def cv_get_access_bulk(self, cls, objects):
+        """
+        Guardian row and card actions share the request's checker, prefetched once for the page.
+        """
+        if issubclass(cls, GuardianObjectPermissionMixin):
+            checker = self.cv_guardian_prefetch(objects)
+            return cls.cv_has_access_bulk(self.request.user, objects, checker=checker)
+        return super().cv_get_access_bulk(cls, objects)
+
     def get_queryset(self):
         from guardian.shortcuts import get_objects_for_user
 
         qs = super().get_queryset()
         perm = self.cv_viewset.permissions.get(self.cv_permission)
+        if self.cv_guardian_pk_cache:
+            return get_objects_for_user_cached(
+                self.request.user, perm, qs, accept_global_perms=self.cv_guardian_accept_global_perms
+            )
         return get_objects_for_user(
             self.request.user,
             perm,
@@ -210,8 +313,7 @@ class GuardianParentPermissionMixin:
                 perm_key = getattr(self.cv_viewset, "cv_guardian_parent_permission", "view")
 
             if perm_key is not None:
-                parent_pk = kwargs.get(parent_vs.get_pk_name())
-                parent_obj = get_object_or_404(parent_vs.viewset.model, pk=parent_pk)
+                parent_obj = self.cv_get_parent_object()
                 parent_perm = parent_vs.viewset.permissions.get(perm_key)
                 accept_global = getattr(self, "cv_guardian_accept_global_perms", False)
                 if accept_global:
@@ -0,0 +1,165 @@
+"""
+Cached per-object permission pk sets for guardian list views.
+
+``get_objects_for_user`` builds a subquery over the object permission tables on
+every list request. With CRUD_VIEWS_GUARDIAN_PK_CACHE enabled, the pks a user holds
+a permission on are read once per (user, permission, model) and kept in Django's
+cache framework; list querysets are then filtered with ``pk__in``.
+
+Entries are keyed by a token per content type plus a global token. Saving or
+deleting an object permission replaces the content type's token, a change of
+group membership replaces the global one, so stale entries are never read again
+and expire with the cache timeout. ``assign_perm`` / ``remove_perm`` on a queryset
+use bulk operations that send no signals; call ``invalidate(model)`` afterwards.
+Without the setting, the receivers are not connected and invalidate() does nothing.
+
+A set of more than CRUD_VIEWS_GUARDIAN_PK_CACHE_MAX_PKS pks would be a ``pk__in``
+list beyond the parameter limits of some databases (SQLite, Oracle): it is cached
+as too large, and the list is filtered with guardian's subquery.
+"""
+
+import uuid
+from typing import NamedTuple
+
+from django.core.cache import caches
+
+from crud_views.lib.settings import crud_views_settings
+
+_PREFIX = "cv_guardian_pks"
+_GLOBAL = "all"
+_TOO_MANY = "too_many"
+
+
+class PkCacheInfo(NamedTuple):
+    """Process-local counters of the pk cache, see cache_info()."""
+
+    hits: int
+    misses: int
+    invalidations: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+
+def cache_info() -> PkCacheInfo:
+    return PkCacheInfo(**_stats)
+
+
+def cache_clear_stats():
+    for name in _stats:
+        _stats[name] = 0
+
+
+def _ctype_id(model) -> int:
+    from django.contrib.contenttypes.models import ContentType
+
+    return ContentType.objects.get_for_model(model).pk
+
+
+def _cache():
+    return caches[crud_views_settings.guardian_pk_cache_alias]
+
+
+def _token(scope) -> str:
+    key = f"{_PREFIX}:token:{scope}"
+    token = _cache().get(key)
+    if token is None:
+        # a missing (or evicted) token starts a new generation: older entries are never read again
+        token = uuid.uuid4().hex
+        _cache().set(key, token, None)
+    return token
+
+
+def _replace_token(scope):
+    _cache().set(f"{_PREFIX}:token:{scope}", uuid.uuid4().hex, None)
+    _stats["invalidations"] += 1
+
+
+def enabled() -> bool:
+    return crud_views_settings.guardian_pk_cache
+
+
+def invalidate(model=None):
+    """
+    Drop the cached pk sets of model, or of all models.
+    """
+    if not enabled():
+        return
+    _replace_token(_ctype_id(model) if model is not None else _GLOBAL)
+
+
+def get_permitted_pks(user, perm: str, model) -> frozenset | None:
+    """
+    Pks of model objects user holds perm on via an object permission, directly or by group;
+    None if there are more than CRUD_VIEWS_GUARDIAN_PK_CACHE_MAX_PKS.
+    """
+    from guardian.shortcuts import get_objects_for_user
+
+    key = f"{_PREFIX}:{_token(_GLOBAL)}:{_token(_ctype_id(model))}:{user.pk}:{perm}"
+    pks = _cache().get(key)
+    if pks is not None:
+        _stats["hits"] += 1
+        return None if pks == _TOO_MANY else pks
+    _stats["misses"] += 1
+    max_pks = crud_views_settings.guardian_pk_cache_max_pks
+    qs = get_objects_for_user(user, perm, model.objects.all(), accept_global_perms=False, use_groups=True)
+    pks = frozenset(qs.values_list("pk", flat=True)[: max_pks + 1])
+    too_many = len(pks) > max_pks
+    _cache().set(key, _TOO_MANY if too_many else pks, crud_views_settings.guardian_pk_cache_timeout)
+    return None if too_many else pks
+
+
+def get_objects_for_user_cached(user, perm: str, qs, accept_global_perms: bool = False):
+    """
+    Cached equivalent of guardian's get_objects_for_user(user, perm, qs, use_groups=True).
+    """
+    from guardian.shortcuts import get_objects_for_user
+
+    if user.is_superuser or (accept_global_perms and user.has_perm(perm)):
+        return qs
+    pks = get_permitted_pks(user, perm, qs.model)
+    if pks is None:
+        return get_objects_for_user(user, perm, qs, accept_global_perms=False, use_groups=True)
+    return qs.filter(pk__in=pks)
+
+
+def on_object_permission_changed(sender, instance, **kwargs):
+    """post_save / post_delete receiver of the guardian object permission models."""
+    if not enabled():
+        return
+    # generic permission models carry the content type, direct ones a foreign key to the model
+    ctype_id = getattr(instance, "content_type_id", None)
+    if ctype_id is None:
+        ctype_id = _ctype_id(instance._meta.get_field("content_object").related_model)
+    _replace_token(ctype_id)
+
+
+def on_group_membership_changed(sender, action, **kwargs):
+    """m2m_changed receiver for User.groups: group grants of the user change for every model."""
+    if enabled() and action in ("post_add", "post_remove", "post_clear"):
+        invalidate()
+
+
+def connect_signals():
+    """
+    Connect the invalidation receivers; senders are limited to the object permission models
+    so other models keep Django's fast delete.
+    """
+    from django.apps import apps
+    from django.contrib.auth import get_user_model
+    from django.db.models.signals import m2m_changed, post_delete, post_save
+    from guardian.models.models import BaseObjectPermission
+
+    for model in apps.get_models():
+        if issubclass(model, BaseObjectPermission):
+            uid = f"{_PREFIX}_{model._meta.label_lower}"
+            post_save.connect(on_object_permission_changed, sender=model, dispatch_uid=f"{uid}_save")
+            post_delete.connect(on_object_permission_changed, sender=model, dispatch_uid=f"{uid}_delete")
+    m2m_changed.connect(
+        on_group_membership_changed, sender=get_user_model().groups.through, dispatch_uid=f"{_PREFIX}_groups"
+    )
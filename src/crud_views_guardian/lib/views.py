@@ -4,6 +4,7 @@ from crud_views.lib.views import (
     CreateViewPermissionRequired,
     DeleteViewPermissionRequired,
     DetailViewPermissionRequired,
+    ExportViewPermissionRequired,
     ListViewPermissionRequired,
     UpdateViewPermissionRequired,
 )
@@ -104,6 +105,15 @@ class GuardianCardListViewPermissionRequired(
     pass
 
 
+class GuardianExportViewPermissionRequired(
+    GuardianParentPermissionMixin, GuardianQuerysetMixin, ExportViewPermissionRequired
+):
+    """
+    Exports a guardian list view: the parent check of the list runs before the rows are
+    streamed, the rows come from the list view's per-object filtered queryset.
+    """
+
+
 class GuardianCreateViewPermissionRequired(GuardianParentPermissionMixin, CreateViewPermissionRequired):
     """
     For top-level creates: GuardianParentPermissionMixin is a no-op (no parent).
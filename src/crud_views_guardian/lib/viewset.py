@@ -4,6 +4,7 @@ from pydantic import model_validator
 
 from crud_views.lib.settings import crud_views_settings
 from crud_views.lib.viewset import ViewSet
+from crud_views_guardian.lib.pk_cache import invalidate
 
 
 class GuardianViewSet(ViewSet):
@@ -53,12 +54,14 @@ class GuardianViewSet(ViewSet):
         from guardian.shortcuts import assign_perm
 
         assign_perm(self.permissions[perm], user_or_group, obj)
+        invalidate(self.model)
 
     def remove_perm(self, perm: str, user_or_group, obj) -> None:
         """Remove per-object permission using a short key."""
         from guardian.shortcuts import remove_perm
 
         remove_perm(self.permissions[perm], user_or_group, obj)
+        invalidate(self.model)
 
     def get_objects_for_user(self, user, perm: str, qs=None):
         """Return queryset of objects for which user has the given per-object permission."""
@@ -74,6 +74,11 @@ class CrudViewsObjectDetailSettings(BaseModel):
             return v
         return NAMED_ICONS_DEFAULTS.get(self.icons_library, {})
 
+    @cached_property
+    def query_plan(self) -> bool:
+        v = _from_settings("CRUD_VIEWS_OBJECT_DETAIL_QUERY_PLAN")
+        return False if v is _UNSET else v
+
     @cached_property
     def property_text_newline(self) -> str:
         v = _from_settings("CRUD_VIEWS_OBJECT_DETAIL_PROPERTY_TEXT_NEWLINE")
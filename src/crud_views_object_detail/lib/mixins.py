@@ -3,8 +3,9 @@ from __future__ import annotations
 from collections.abc import Iterable
 
 from crud_views.lib.check import Check, CheckAttribute, CheckExpression
+from crud_views_object_detail.lib.conf import crud_views_object_detail_settings
 from crud_views_object_detail.lib.config import PropertyConfig, PropertyGroupConfig, parse_property_display
-from crud_views_object_detail.lib.resolvers import resolve_all
+from crud_views_object_detail.lib.resolvers import GroupPlan, apply_query_lookups, compile_groups
 
 
 class ObjectDetailMixin:
@@ -13,6 +14,11 @@ class ObjectDetailMixin:
     Set ``cv_property_display`` as a list of group dicts (the DSL accepted by
     ``parse_property_display``). Resolved groups land in the template context as
     ``object_detail_groups``.
+
+    The groups of ``cv_property_display`` are parsed and compiled (``GroupPlan``) once per
+    view class and model; a ``property_display`` computed per request is compiled per request.
+    With ``cv_object_detail_query_plan`` (opt-in), the object is loaded with the select_related /
+    prefetch_related lookups the property paths need (``query_lookups``).
     """
 
     template_name = "crud_views/view_detail.html"
@@ -25,6 +31,10 @@ class ObjectDetailMixin:
     #: Falls back to ``CRUD_VIEWS_OBJECT_DETAIL_TEMPLATE_PACK_LAYOUT`` when None.
     cv_object_detail_layout: str | None = None
 
+    #: Load the object with the relations of the property paths.
+    #: Falls back to ``CRUD_VIEWS_OBJECT_DETAIL_QUERY_PLAN`` when None.
+    cv_object_detail_query_plan: bool | None = None
+
     @property
     def property_display(self):
         return self.cv_property_display
@@ -37,15 +47,40 @@ class ObjectDetailMixin:
             return raw
         return parse_property_display(raw)
 
+    def get_property_display_plans(self, model) -> list[GroupPlan]:
+        """The compiled property groups for instances of model."""
+        cls = type(self)
+        raw = self.property_display
+        if raw is None or raw is not cls.cv_property_display:
+            return compile_groups(model, self.get_property_display())
+        # per class (not inherited), keyed by model; raw tells a replaced cv_property_display
+        plans = cls.__dict__.get("_cv_property_display_plans")
+        if plans is None:
+            plans = {}
+            cls._cv_property_display_plans = plans
+        cached = plans.get(model)
+        if cached is None or cached[0] is not raw:
+            cached = plans[model] = (raw, compile_groups(model, self.get_property_display()))
+        return cached[1]
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        query_plan = self.cv_object_detail_query_plan
+        if query_plan is None:
+            query_plan = crud_views_object_detail_settings.query_plan
+        if not query_plan or not self.property_display:
+            return queryset
+        return apply_query_lookups(queryset, self.get_property_display_plans(queryset.model))
+
     def get_object_for_detail(self):
         return self.object
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        groups = self.get_property_display()
-        if groups:
+        if self.property_display:
             instance = self.get_object_for_detail()
-            context["object_detail_groups"] = resolve_all(instance, groups, view=self)
+            plans = self.get_property_display_plans(type(instance))
+            context["object_detail_groups"] = [plan.resolve(instance, view=self) for plan in plans]
         context["object_detail_layout"] = self.cv_object_detail_layout
         return context
 
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
+from functools import cache
 from typing import Any
 
 from django.core.exceptions import FieldDoesNotExist
 from django.db import models
+from django.db.models import Prefetch, QuerySet, prefetch_related_objects
 from django.urls import NoReverseMatch, reverse
+from django.utils.text import capfirst
 
+from crud_views.lib.query import is_covered, lookup_path
 from crud_views_object_detail.lib.config import BadgeConfig, LinkConfig, PropertyConfig, PropertyGroupConfig
 
 _MISSING = object()
@@ -63,31 +69,51 @@ class ResolvedGroup:
     properties: list[ResolvedProperty] = field(default_factory=list)
 
 
-def _get_field_type(field_obj: models.Field) -> str:
-    """Map a Django field instance to a type string."""
-    for field_class, type_name in FIELD_TYPE_MAP.items():
-        if isinstance(field_obj, field_class):
+@cache
+def _get_field_class_type(field_class: type) -> str:
+    for mapped_class, type_name in FIELD_TYPE_MAP.items():
+        if issubclass(field_class, mapped_class):
             return type_name
     return "default"
 
 
-def _resolve_link_url(value: Any, link: LinkConfig | None, is_many: bool) -> str | None:
-    """Resolve a link URL for the property value."""
+def _get_field_type(field_obj: models.Field) -> str:
+    """Map a Django field instance to a type string."""
+    return _get_field_class_type(type(field_obj))
+
+
+def _resolve_link_url(value: Any, link: LinkConfig | None, is_many: bool, cache: dict | None = None) -> str | None:
+    """Resolve a link URL for the property value.
+
+    ``cache`` maps the reverse() arguments to URLs and is shared by the objects of a batch.
+    """
     if link is None or value is None or is_many:
         return None
 
     try:
         if link.args is not None:
-            args = [getattr(value, attr) for attr in link.args]
-            return reverse(link.url, args=args)
+            key = (link.url, tuple(getattr(value, attr) for attr in link.args), ())
         elif link.kwargs is not None:
-            kwargs = {k: getattr(value, attr) for k, attr in link.kwargs.items()}
-            return reverse(link.url, kwargs=kwargs)
+            key = (link.url, (), tuple((k, getattr(value, attr)) for k, attr in link.kwargs.items()))
         elif isinstance(value, models.Model):
-            return reverse(link.url, kwargs={"pk": value.pk})
+            key = (link.url, (), (("pk", value.pk),))
         else:
             return None
-    except (NoReverseMatch, AttributeError):
+    except AttributeError:
+        return None
+
+    if cache is None:
+        return _reverse_link(*key)
+    url = cache.get(key, _MISSING)
+    if url is _MISSING:
+        url = cache[key] = _reverse_link(*key)
+    return url
+
+
+def _reverse_link(url: str, args: tuple, kwargs: tuple) -> str | None:
+    try:
+        return reverse(url, args=args or None, kwargs=dict(kwargs) or None)
+    except NoReverseMatch:
         return None
 
 
@@ -117,40 +143,60 @@ def _resolve_badge_label(value: Any, badge: BadgeConfig) -> str | None:
     return badge.label_map.get(value)
 
 
-def resolve_property(instance: models.Model, config: PropertyConfig, view=None) -> ResolvedProperty:
-    """Resolve a PropertyConfig against a model instance.
+# how a path segment is read from an object (PropertyPlan.accessors)
+ACCESS_VALUE = "value"  # a model field or forward FK/O2O: getattr
+ACCESS_MANY = "many"  # an M2M or reverse FK manager: getattr().all()
+ACCESS_DYNAMIC = "dynamic"  # anything else: a manager, callable or plain attribute, decided per object
 
-    Walks the _meta chain for metadata (label, detail, type)
-    and the instance chain for the runtime value.
+
+@dataclass(frozen=True)
+class PropertyPlan:
+    """The instance-independent part of resolving a PropertyConfig on a model.
+
+    Built once per (model, config) by ``compile``: the label, detail and type from the
+    ``_meta`` chain with the config overrides applied, and an accessor per path segment.
+    ``resolve`` only extracts the value and computes link and badge.
     """
-    segments = config.path.split("__")
-
-    # Walk _meta to gather field metadata
-    label = config.path
-    detail = None
-    field_type = "default"
-    is_many = False
-    current_model = type(instance)
-
-    for _i, segment in enumerate(segments):
-        try:
-            field_obj = current_model._meta.get_field(segment)
-        except FieldDoesNotExist:
-            # Could be a method/property — no further metadata to extract
-            label = segment.replace("_", " ").title()
-            break
-        else:
+
+    config: PropertyConfig
+    segments: tuple[str, ...]
+    accessors: tuple[str, ...]
+    label: Any  # str or lazy string, made a str per resolve (the active language may change)
+    detail: Any
+    type: str
+    is_many: bool
+    # the leading relations of the path a query can fetch: (name, many-valued, related model)
+    relations: tuple[tuple[str, bool, type[models.Model]], ...] = ()
+
+    @classmethod
+    def compile(cls, model: type[models.Model], config: PropertyConfig) -> PropertyPlan:
+        segments = tuple(config.path.split("__"))
+
+        # Walk _meta to gather field metadata
+        label = config.path
+        detail = None
+        field_type = "default"
+        is_many = False
+        accessors = []
+        relations = []
+        fetchable = True
+        current_model = model
+
+        for segment in segments:
+            try:
+                field_obj = current_model._meta.get_field(segment)
+            except FieldDoesNotExist:
+                # Could be a method/property — no further metadata to extract
+                label = segment.replace("_", " ").title()
+                break
+
             # Extract metadata from the field
             verbose = getattr(field_obj, "verbose_name", None)
-            if verbose:
-                v = str(verbose)
-                label = v[0].upper() + v[1:]
-            else:
-                label = segment.replace("_", " ").title()
+            label = capfirst(verbose) if verbose else segment.replace("_", " ").title()
 
             help_text = getattr(field_obj, "help_text", None)
             if help_text:
-                detail = str(help_text)
+                detail = help_text
 
             field_type = _get_field_type(field_obj)
 
@@ -161,47 +207,181 @@ def resolve_property(instance: models.Model, config: PropertyConfig, view=None)
             elif isinstance(field_obj, (models.ManyToManyField, models.ManyToManyRel, models.ManyToOneRel)):
                 is_many = True
                 current_model = field_obj.related_model
+            accessor = _get_accessor(field_obj, segment)
+            accessors.append(accessor)
+
+            fetchable = fetchable and field_obj.is_relation and field_obj.related_model is not None
+            if fetchable and accessor == ACCESS_DYNAMIC:
+                # a reverse O2O is fetched by its query name, which is the accessor by default
+                fetchable = isinstance(field_obj, models.OneToOneRel) and field_obj.get_accessor_name() == segment
+            if fetchable:
+                many = field_obj.many_to_many or field_obj.one_to_many
+                relations.append((segment, many, field_obj.related_model))
+
+        # segments without a field are read dynamically
+        accessors.extend([ACCESS_DYNAMIC] * (len(segments) - len(accessors)))
+
+        # Apply config overrides
+        if config.title:
+            label = config.title
+        if config.detail is not None:
+            detail = config.detail
+        if config.type:
+            field_type = config.type
+
+        return cls(
+            config=config,
+            segments=segments,
+            accessors=tuple(accessors),
+            relations=tuple(relations),
+            label=label,
+            detail=detail,
+            type=field_type,
+            is_many=is_many,
+        )
+
+    def resolve(self, instance: models.Model, view=None, link_cache: dict | None = None) -> ResolvedProperty:
+        config = self.config
+        value = _resolve_value(instance, self.segments, self.is_many, self.accessors)
+
+        if value is _MISSING:
+            view_method = getattr(view, config.path, None) if view is not None else None
+            value = view_method(instance) if callable(view_method) else None
+
+        badge_css = None
+        badge_label = None
+        if config.badge:
+            badge_css = _resolve_badge_css(value, config.badge)
+            badge_label = _resolve_badge_label(value, config.badge)
+
+        # config overrides stay lazy, field metadata is rendered in the active language
+        label = self.label if self.label is config.title else str(self.label)
+        detail = self.detail if self.detail is config.detail else str(self.detail) if self.detail else None
+
+        return ResolvedProperty(
+            path=config.path,
+            label=label,
+            value=value,
+            detail=detail or None,
+            type=self.type,
+            template=config.template,
+            is_many=self.is_many,
+            link_url=_resolve_link_url(value, config.link, self.is_many, link_cache),
+            badge_css=badge_css,
+            badge_label=badge_label,
+        )
+
+
+@dataclass(frozen=True)
+class GroupPlan:
+    """The compiled PropertyPlans of a PropertyGroupConfig on a model."""
+
+    config: PropertyGroupConfig
+    properties: tuple[PropertyPlan, ...]
+
+    @classmethod
+    def compile(cls, model: type[models.Model], config: PropertyGroupConfig) -> GroupPlan:
+        return cls(config=config, properties=tuple(PropertyPlan.compile(model, prop) for prop in config.properties))
+
+    def resolve(self, instance: models.Model, view=None, link_cache: dict | None = None) -> ResolvedGroup:
+        return ResolvedGroup(
+            title=self.config.title,
+            description=self.config.description,
+            icon=self.config.icon,
+            properties=[plan.resolve(instance, view=view, link_cache=link_cache) for plan in self.properties],
+        )
+
+
+def compile_groups(model: type[models.Model], groups: list[PropertyGroupConfig]) -> list[GroupPlan]:
+    """Compile the groups for instances of model."""
+    return [GroupPlan.compile(model, group) for group in groups]
+
+
+def query_lookups(groups: list[GroupPlan]) -> tuple[list[str], list]:
+    """The select_related and prefetch_related lookups that fetch the relations of the groups.
+
+    Forward and reverse one-to-one and foreign key chains are joined with select_related. The
+    first many-valued relation of a path (M2M, reverse FK) is a Prefetch whose queryset joins
+    the foreign key chain after it; a further many-valued relation is prefetched by its path.
+    """
+    select_related = set()
+    prefetch_models = {}
+    prefetch_select = defaultdict(set)
+    prefetch_paths = set()
+    for group in groups:
+        for plan in group.properties:
+            names = [name for name, _many, _model in plan.relations]
+            many = [i for i, (_name, is_many, _model) in enumerate(plan.relations) if is_many]
+            if not many:
+                if names:
+                    select_related.add("__".join(names))
+                continue
+            first = many[0]
+            if first:
+                select_related.add("__".join(names[:first]))
+            path = "__".join(names[: first + 1])
+            prefetch_models[path] = plan.relations[first][2]
+            end = many[1] if len(many) > 1 else len(names)
+            if end > first + 1:
+                prefetch_select[path].add("__".join(names[first + 1 : end]))
+            if len(many) > 1:
+                prefetch_paths.add("__".join(names))
+
+    prefetch_related = [
+        Prefetch(path, queryset=model._default_manager.select_related(*sorted(prefetch_select[path])))
+        if prefetch_select[path]
+        else path
+        for path, model in sorted(prefetch_models.items())
+    ]
+    return sorted(select_related), [*prefetch_related, *sorted(prefetch_paths)]
+
+
+def apply_query_lookups(queryset: QuerySet, groups: list[GroupPlan]) -> QuerySet:
+    """Load queryset with the query_lookups() of the groups.
+
+    The lookups the queryset already has win: a Prefetch must not repeat a lookup with another
+    queryset, and select_related cannot traverse a field that only() / defer() leave out.
+    """
+    select_related, prefetch_related = query_lookups(groups)
+    declared = queryset._prefetch_related_lookups
+    prefetch_related = [lookup for lookup in prefetch_related if not is_covered(lookup_path(lookup), declared)]
+    if select_related and not queryset.query.deferred_loading[0]:
+        queryset = queryset.select_related(*select_related)
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*prefetch_related)
+    return queryset
+
+
+def _get_accessor(field_obj, segment: str) -> str:
+    """The accessor of a path segment that names field_obj."""
+    if isinstance(field_obj, models.OneToOneRel):
+        # raises RelatedObjectDoesNotExist without a related row: read dynamically
+        return ACCESS_DYNAMIC
+    if field_obj.many_to_many or field_obj.one_to_many:
+        if isinstance(field_obj, models.ManyToManyField):
+            return ACCESS_MANY
+        if isinstance(field_obj, models.ForeignObjectRel):
+            # the query name (a segment) is not always the instance attribute
+            return ACCESS_MANY if field_obj.get_accessor_name() == segment else ACCESS_DYNAMIC
+        return ACCESS_DYNAMIC
+    if isinstance(field_obj, models.Field):
+        return ACCESS_VALUE
+    return ACCESS_DYNAMIC
+
 
-    # Apply config overrides
-    if config.title:
-        label = config.title
-    if config.detail is not None:
-        detail = config.detail
-    if config.type:
-        field_type = config.type
-
-    # Resolve the runtime value
-    value = _resolve_value(instance, segments, is_many)
-
-    if value is _MISSING:
-        view_method = getattr(view, config.path, None) if view is not None else None
-        value = view_method(instance) if callable(view_method) else None
-
-    # Resolve link URL
-    link_url = _resolve_link_url(value, config.link, is_many)
-
-    # Resolve badge
-    badge_css = None
-    badge_label = None
-    if config.badge:
-        badge_css = _resolve_badge_css(value, config.badge)
-        badge_label = _resolve_badge_label(value, config.badge)
-
-    return ResolvedProperty(
-        path=config.path,
-        label=label,
-        value=value,
-        detail=detail or None,
-        type=field_type,
-        template=config.template,
-        is_many=is_many,
-        link_url=link_url,
-        badge_css=badge_css,
-        badge_label=badge_label,
-    )
-
-
-def _resolve_value(instance: models.Model, segments: list[str], is_many: bool) -> Any:
+def resolve_property(instance: models.Model, config: PropertyConfig, view=None) -> ResolvedProperty:
+    """Resolve a PropertyConfig against a model instance.
+
+    Walks the _meta chain for metadata (label, detail, type)
+    and the instance chain for the runtime value. Compiles the
+    PropertyPlan on every call; views resolve cached plans.
+    """
+    return PropertyPlan.compile(type(instance), config).resolve(instance, view=view)
+
+
+def _resolve_value(
+    instance: models.Model, segments: Sequence[str], is_many: bool, accessors: Sequence[str] | None = None
+) -> Any:
     """Walk the instance to resolve the runtime value.
 
     Tracks a list of current objects to handle M2M fan-out.
@@ -211,6 +391,7 @@ def _resolve_value(instance: models.Model, segments: list[str], is_many: bool) -
     first_resolved = False
 
     for i, segment in enumerate(segments):
+        accessor = accessors[i] if accessors is not None else ACCESS_DYNAMIC
         next_objects: list[Any] = []
         for obj in current:
             if obj is None:
@@ -225,8 +406,10 @@ def _resolve_value(instance: models.Model, segments: list[str], is_many: bool) -
             if i == 0:
                 first_resolved = True
 
-            # Check if it's a manager (M2M or reverse FK)
-            if hasattr(attr, "all"):
+            if accessor == ACCESS_VALUE:
+                next_objects.append(attr)
+            elif accessor == ACCESS_MANY or hasattr(attr, "all"):
+                # a manager (M2M or reverse FK)
                 next_objects.extend(attr.all())
             elif callable(attr):
                 next_objects.append(attr())
@@ -248,14 +431,50 @@ def _resolve_value(instance: models.Model, segments: list[str], is_many: bool) -
 
 def resolve_group(instance: models.Model, config: PropertyGroupConfig, view=None) -> ResolvedGroup:
     """Resolve all properties in a group."""
-    return ResolvedGroup(
-        title=config.title,
-        description=config.description,
-        icon=config.icon,
-        properties=[resolve_property(instance, prop, view=view) for prop in config.properties],
-    )
+    return GroupPlan.compile(type(instance), config).resolve(instance, view=view)
 
 
 def resolve_all(instance: models.Model, groups: list[PropertyGroupConfig], view=None) -> list[ResolvedGroup]:
     """Resolve all groups for an instance."""
     return [resolve_group(instance, group, view=view) for group in groups]
+
+
+def resolve_many(
+    objects: Iterable[models.Model], groups: list[PropertyGroupConfig] | None = None, view=None
+) -> dict[Any, list[ResolvedGroup]]:
+    """Resolve the groups for a batch of objects, keyed by pk.
+
+    The groups are compiled once per model (``groups=None`` uses the cached plans of view, an
+    ObjectDetailMixin) and the relations of their paths are fetched once for the batch: a QuerySet
+    is loaded with ``apply_query_lookups()``, the relations of a list are prefetched onto its objects. Link URLs are
+    reversed once per target.
+    """
+    if groups is None and not hasattr(view, "get_property_display_plans"):
+        raise ValueError("resolve_many() needs groups or a view with cv_property_display (ObjectDetailMixin)")
+    plans: dict[type[models.Model], list[GroupPlan]] = {}
+
+    def _plans(model: type[models.Model]) -> list[GroupPlan]:
+        if model not in plans:
+            if groups is None:
+                plans[model] = view.get_property_display_plans(model)
+            else:
+                plans[model] = compile_groups(model, groups)
+        return plans[model]
+
+    if isinstance(objects, QuerySet):
+        instances = list(apply_query_lookups(objects, _plans(objects.model)))
+    else:
+        instances = list(objects)
+        by_model = defaultdict(list)
+        for instance in instances:
+            by_model[type(instance)].append(instance)
+        for model, batch in by_model.items():
+            # prefetch_related_objects() follows foreign keys too, one query per relation
+            select_related, prefetch_related = query_lookups(_plans(model))
+            prefetch_related_objects(batch, *select_related, *prefetch_related)
+
+    link_cache = {}
+    return {
+        instance.pk: [plan.resolve(instance, view=view, link_cache=link_cache) for plan in _plans(type(instance))]
+        for instance in instances
+    }
@@ -8,7 +8,7 @@ from crud_views_object_detail.lib.conf import (
     crud_views_object_detail_settings,
 )
 from crud_views_object_detail.lib.config import parse_property_display
-from crud_views_object_detail.lib.resolvers import resolve_all
+from crud_views_object_detail.lib.resolvers import resolve_all, resolve_many
 
 register = template.Library()
 
@@ -17,15 +17,18 @@ register = template.Library()
 def render_object_detail(context, obj, groups=None, property_display=None, layout=None):
     """Render all property groups for an object.
 
-    ``groups`` can be pre-resolved ``ResolvedGroup`` instances (from the mixin)
-    or a raw ``property_display`` list that will be parsed and resolved here.
+    ``groups`` can be pre-resolved ``ResolvedGroup`` instances (from the mixin),
+    the groups of a batch keyed by pk (from ``resolve_object_details``) or a raw
+    ``property_display`` list that will be parsed and resolved here.
 
     ``layout`` optionally overrides the layout pack (e.g. "accordion") for this
     render only; it defaults to ``crud_views_object_detail_settings.template_pack_layout``
     and is threaded down into the pack's own templates so nested ``render_group`` /
     ``render_property`` calls use the same pack.
     """
-    if groups is None and property_display is not None:
+    if isinstance(groups, dict):
+        groups = groups.get(obj.pk)
+    elif groups is None and property_display is not None:
         configs = parse_property_display(property_display)
         view = context.get("view")
         groups = resolve_all(obj, configs, view=view)
@@ -40,6 +43,27 @@ def render_object_detail(context, obj, groups=None, property_display=None, layou
     return mark_safe(tpl.render({"groups": groups or [], "layout": pack}, context.get("request")))
 
 
+@register.simple_tag(takes_context=True)
+def resolve_object_details(context, objects, property_display=None):
+    """Resolve the property groups of a batch of objects, e.g. the cards of a list.
+
+    Returns the groups keyed by pk for ``render_object_detail``::
+
+        {% resolve_object_details object_list property_display as details %}
+        {% for object in object_list %}{% render_object_detail object details %}{% endfor %}
+
+    Without ``property_display`` the ``property_display`` of the view in the context is used,
+    which must be an ``ObjectDetailMixin``.
+    """
+    view = context.get("view")
+    if property_display is None and not hasattr(view, "get_property_display_plans"):
+        raise template.TemplateSyntaxError(
+            "resolve_object_details needs a property_display argument outside of an ObjectDetailMixin view"
+        )
+    configs = parse_property_display(property_display) if property_display is not None else None
+    return resolve_many(objects, configs, view=view)
+
+
 @register.simple_tag(takes_context=True)
 def render_group(context, group, layout=None):
     """Render a single property group using the configured layout pack.
@@ -11,6 +11,15 @@ function textResponse(html, { ok = true, status = 200, headers = {} } = {}) {
     };
 }
 
+function jsonResponse(data, { ok = true, status = 200 } = {}) {
+    return {
+        ok,
+        status,
+        headers: { get: () => null },
+        json: () => Promise.resolve(data),
+    };
+}
+
 function stubFetch(responseOrError) {
     const impl = responseOrError instanceof Error
         ? () => Promise.reject(responseOrError)
@@ -131,6 +140,64 @@ describe("modal.js", () => {
         });
     });
 
+    describe("cvModalProgress", () => {
+        const accepted = () => textResponse("", { status: 202, headers: { "X-CV-Progress": "/books/progress/?job=1" } });
+
+        function deleteForm() {
+            document.getElementById("cv-modal").setAttribute("data-cv-url", "/books/1/delete/");
+            document.getElementById("cv-modal-content").innerHTML =
+                `<div class="modal-header">Delete</div><div class="modal-body"><form action="/books/1/delete/"></form></div>`;
+            return document.querySelector("#cv-modal-content form");
+        }
+
+        function stubFetchSequence(...responses) {
+            const fetchMock = vi.fn();
+            for (const response of responses) {
+                if (response instanceof Error) {
+                    fetchMock.mockRejectedValueOnce(response);
+                } else {
+                    fetchMock.mockResolvedValueOnce(response);
+                }
+            }
+            vi.stubGlobal("fetch", fetchMock);
+            return fetchMock;
+        }
+
+        it("polls the X-CV-Progress url of a 202 and navigates to the job's redirect", async () => {
+            vi.useFakeTimers();
+            try {
+                const fetchMock = stubFetchSequence(
+                    accepted(),
+                    jsonResponse({ state: "running", deleted: 50, total: 200 }),
+                    jsonResponse({ state: "done", deleted: 200, total: 200, redirect: "/books/" }),
+                );
+                window.cv.cvModalSubmit(deleteForm());
+                await vi.waitFor(() => expect(document.querySelector(".progress-bar").style.width).toBe("25%"));
+                expect(document.querySelector(".modal-header").textContent).toBe("Delete");
+                await vi.waitFor(() => expect(nav.assign).toHaveBeenCalledWith("/books/"));
+                expect(fetchMock).toHaveBeenCalledTimes(3);
+                expect(fetchMock.mock.calls[1][0]).toBe("/books/progress/?job=1");
+            } finally {
+                vi.useRealTimers();
+            }
+        });
+
+        it("shows the error of a failed job and stays in the modal", async () => {
+            stubFetchSequence(accepted(), jsonResponse({ state: "failed", deleted: 3, total: 9, error: "<b>boom</b>" }));
+            window.cv.cvModalSubmit(deleteForm());
+            await vi.waitFor(() =>
+                expect(document.querySelector(".cv-modal-progress-error").textContent).toBe("<b>boom</b>"));
+            expect(document.querySelector(".progress-bar").classList.contains("bg-danger")).toBe(true);
+            expect(nav.assign).not.toHaveBeenCalled();
+        });
+
+        it("navigates to the fallback when the progress url fails", async () => {
+            stubFetchSequence(accepted(), jsonResponse({}, { ok: false, status: 404 }));
+            window.cv.cvModalSubmit(deleteForm());
+            await vi.waitFor(() => expect(nav.assign).toHaveBeenCalledWith("/books/1/delete/"));
+        });
+    });
+
     describe("guards", () => {
         it("throws a descriptive error when #cv-modal is missing", () => {
             document.body.innerHTML = "";
@@ -1,5 +1,7 @@
 import uuid
 
+from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
+from django.contrib.contenttypes.models import ContentType
 from django.db import models
 from django.utils.translation import gettext as _
 from django_fsm import FSMField, transition
@@ -67,6 +69,52 @@ class Contract(models.Model):
         return self.title
 
 
+class Royalty(models.Model):
+    # RESTRICT: a publisher's royalties go with its books, but block the delete of another publisher
+    book = models.ForeignKey(Book, on_delete=models.CASCADE, related_name="royalties")
+    publisher = models.ForeignKey(Publisher, on_delete=models.RESTRICT, related_name="royalties")
+    amount = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.book} ({self.amount})"
+
+
+class Tag(models.Model):
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField()
+    content_object = GenericForeignKey()
+    label = models.CharField(max_length=100)
+
+    def __str__(self):
+        return self.label
+
+
+class Library(models.Model):
+    name = models.CharField(max_length=200)
+    tags = GenericRelation(Tag)
+
+    def __str__(self):
+        return self.name
+
+
+class Shelf(models.Model):
+    library = models.ForeignKey(Library, on_delete=models.CASCADE, related_name="shelves")
+    name = models.CharField(max_length=200)
+    tags = GenericRelation(Tag)
+
+    def __str__(self):
+        return self.name
+
+
+class Loan(models.Model):
+    # reached by two cascade paths when the library is deleted: library and library -> shelf
+    library = models.ForeignKey(Library, on_delete=models.CASCADE, related_name="loans")
+    shelf = models.ForeignKey(Shelf, on_delete=models.CASCADE, related_name="loans")
+
+    def __str__(self):
+        return f"Loan {self.pk}"
+
+
 class CampaignState(models.TextChoices):
     NEW = "new", _("New")
     ACTIVE = "active", _("Active")
@@ -8,6 +8,7 @@ from crud_views.lib.table import Table
 from crud_views.lib.views import (
     ActionViewPermissionRequired,
     DetailViewPermissionRequired,
+    ExportViewPermissionRequired,
     ListViewPermissionRequired,
     ListViewTableMixin,
     MessageMixin,
@@ -81,6 +82,10 @@ class S3FileListView(ResourceViewMixin, ListViewTableMixin, ListViewPermissionRe
     cv_list_actions = ["detail", "delete", "touch"]
 
 
+class S3FileExportView(ResourceViewMixin, ExportViewPermissionRequired):
+    cv_viewset = cv_s3file
+
+
 class S3FileDetailView(ResourceViewMixin, DetailViewPermissionRequired):
     cv_viewset = cv_s3file
     template_name = "app/s3file_detail.html"
@@ -181,3 +186,55 @@ class PublisherFileListView(ResourceViewMixin, ListViewTableMixin, ListViewPermi
 class PublisherFileDetailView(ResourceViewMixin, DetailViewPermissionRequired):
     cv_viewset = cv_publisher_file
     template_name = "app/s3file_detail.html"
+
+
+# streamed resource: implements only the cv_iter_items generator
+STREAMED_READS: list[str] = []  # keys read from the source, reset by tests
+
+
+class StreamedFile(Resource):
+    key: str
+    size: int
+
+    class Meta:
+        verbose_name = "streamed file"
+        verbose_name_plural = "streamed files"
+        app_label = "app"
+        pk_field = "key_md5"
+        pk_type = PrimaryKeys.HEX
+
+    @property
+    def key_md5(self) -> str:
+        return hashlib.md5(self.key.encode()).hexdigest()
+
+    def __str__(self) -> str:
+        return self.key
+
+    @classmethod
+    def cv_iter_items(cls, request, **url_kwargs):
+        # a generator: list views get the rows through the default cv_get_items
+        for row in FAKE_BUCKET:
+            STREAMED_READS.append(row["key"])
+            yield cls.model_validate(row)
+
+
+cv_streamed_file = ViewSet(
+    model=StreamedFile,
+    name="streamedfile",
+    resource_permissions={"view": "app.view_s3file"},
+)
+
+
+class StreamedFileListView(ResourceViewMixin, ListViewTableMixin, ListViewPermissionRequired):
+    cv_viewset = cv_streamed_file
+    table_class = S3FileTable
+    cv_list_actions = ["detail"]
+
+
+class StreamedFileDetailView(ResourceViewMixin, DetailViewPermissionRequired):
+    cv_viewset = cv_streamed_file
+    template_name = "app/s3file_detail.html"
+
+
+class StreamedFileExportView(ResourceViewMixin, ExportViewPermissionRequired):
+    cv_viewset = cv_streamed_file
@@ -1,4 +1,4 @@
-from tests.test1.app.resources import cv_publisher_file, cv_s3file
+from tests.test1.app.resources import cv_publisher_file, cv_s3file, cv_streamed_file
 from tests.test1.app.views import (
     cv_author,
     cv_author_custom_detail,
@@ -50,6 +50,7 @@ urlpatterns += cv_author_modal.urlpatterns
 urlpatterns += cv_publisher_modal_protected.urlpatterns
 urlpatterns += cv_s3file.urlpatterns
 urlpatterns += cv_publisher_file.urlpatterns
+urlpatterns += cv_streamed_file.urlpatterns
 urlpatterns += cv_publisher_bc.urlpatterns
 urlpatterns += cv_publisher_bc_nodetail.urlpatterns
 urlpatterns += cv_publisher_bc_card.urlpatterns
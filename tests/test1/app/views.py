@@ -14,8 +14,10 @@ from crud_views.lib.views import (
     CardListViewPermissionRequired,
     CreateViewParentMixin,
     CreateViewPermissionRequired,
+    DeleteProgressViewPermissionRequired,
     DeleteViewPermissionRequired,
     DetailViewPermissionRequired,
+    ExportViewPermissionRequired,
     ListViewPermissionRequired,
     ListViewTableFilterMixin,
     ListViewTableMixin,
@@ -33,6 +35,7 @@ from crud_views_guardian.lib.views import (
     GuardianCreateViewPermissionRequired,
     GuardianDeleteViewPermissionRequired,
     GuardianDetailViewPermissionRequired,
+    GuardianExportViewPermissionRequired,
     GuardianListViewPermissionRequired,
     GuardianUpdateViewPermissionRequired,
 )
@@ -321,6 +324,10 @@ class PublisherCardListView(CardListViewPermissionRequired):
     ]
 
 
+class PublisherExportView(ExportViewPermissionRequired):
+    cv_viewset = cv_publisher
+
+
 # --- Publisher Order Demo (card with ordering, paging, filter) ---
 
 cv_publisher_order = ViewSet(
@@ -403,6 +410,10 @@ class BookDeleteView(CrispyViewMixin, DeleteViewPermissionRequired):
     cv_viewset = cv_book
 
 
+class BookExportView(ExportViewPermissionRequired):
+    cv_viewset = cv_book
+
+
 # --- Contract (second child of publisher, sibling of book) ---
 
 from tests.test1.app.models import Contract  # noqa: E402
@@ -677,6 +688,10 @@ class GuardianBookDeleteView(CrispyViewMixin, GuardianDeleteViewPermissionRequir
     cv_viewset = cv_guardian_book
 
 
+class GuardianBookExportView(GuardianExportViewPermissionRequired):
+    cv_viewset = cv_guardian_book
+
+
 # --- Guardian Publisher Cascade (INT PK, Guardian + cv_show_related_objects=True) ---
 
 cv_guardian_publisher_cascade = GuardianViewSet(
@@ -776,13 +791,17 @@ class PublisherLinkedListView(ListViewTableMixin, ListViewPermissionRequired):
     cv_viewset = cv_publisher_linked
 
 
-class PublisherLinkedDeleteView(CrispyViewMixin, DeleteViewPermissionRequired):
+class PublisherLinkedDeleteView(CrispyViewMixin, MessageMixin, DeleteViewPermissionRequired):
     form_class = CrispyDeleteForm
     cv_viewset = cv_publisher_linked
     cv_show_related_objects = True
     cv_link_related_objects = True
 
 
+class PublisherLinkedDeleteProgressView(DeleteProgressViewPermissionRequired):
+    cv_viewset = cv_publisher_linked
+
+
 # ── Test helpers ──────────────────────────────────────────────────────────────
 
 
@@ -798,6 +817,13 @@ class CustomGuardianManageViewForTest(ManageView):
     pass
 
 
+class ImmediateDeleteExecutorForTest:
+    """Delete job executor running the job in the request: the test database is not shared with threads."""
+
+    def submit(self, fn, *args, **kwargs):
+        fn(*args, **kwargs)
+
+
 # --- Author Modal (UUID PK, cv_modal=True on delete/detail/custom form) ---
 
 cv_author_modal = ViewSet(
@@ -0,0 +1,119 @@
+import pytest
+from django.db import models
+
+from crud_views_object_detail.lib import mixins
+from crud_views_object_detail.lib.config import PropertyGroupConfig, x
+from crud_views_object_detail.lib.mixins import ObjectDetailMixin
+from crud_views_object_detail.lib.resolvers import (
+    ACCESS_DYNAMIC,
+    ACCESS_MANY,
+    ACCESS_VALUE,
+    GroupPlan,
+    PropertyPlan,
+    _get_field_type,
+    resolve_property,
+)
+from tests.test1.od_app.models import Info, Report
+
+DISPLAY = [
+    {
+        "title": "Report",
+        "properties": [
+            "title",
+            x("owner", link="admin:auth_user_change"),
+            "owner__username",
+            "access_users",
+            "info__text",
+            "title_upper",
+        ],
+    }
+]
+
+
+@pytest.fixture
+def report(db):
+    from django.contrib.auth import get_user_model
+    from django.utils import timezone
+
+    user = get_user_model().objects.create_user(username="planner", password="testpass")
+    info = Info.objects.create(text="Plan text", create_dt=timezone.now(), update_dt=timezone.now())
+    report = Report.objects.create(title="Planned", owner=user, info=info)
+    report.access_users.add(user)
+    return report
+
+
+def test_accessors_follow_the_meta_chain():
+    def accessors(path):
+        return PropertyPlan.compile(Report, x(path)).accessors
+
+    assert accessors("title") == (ACCESS_VALUE,)
+    assert accessors("owner__username") == (ACCESS_VALUE, ACCESS_VALUE)
+    assert accessors("access_users__username") == (ACCESS_MANY, ACCESS_VALUE)
+    assert accessors("title_upper") == (ACCESS_DYNAMIC,)
+    # reverse O2O and unknown segments below a field are read per object
+    assert PropertyPlan.compile(Info, x("report__title")).accessors == (ACCESS_DYNAMIC, ACCESS_VALUE)
+    assert accessors("owner__get_full_name") == (ACCESS_VALUE, ACCESS_DYNAMIC)
+
+
+def test_plan_resolves_like_resolve_property(report):
+    (group,) = [PropertyGroupConfig(**g) for g in DISPLAY]
+    plan = GroupPlan.compile(Report, group)
+    resolved = plan.resolve(report)
+    assert resolved.title == "Report"
+    assert resolved.properties == [resolve_property(report, prop) for prop in group.properties]
+    assert [p.label for p in resolved.properties] == [
+        "Report title",
+        "Owner",
+        "Username",
+        "Access users",
+        "Info text",
+        "Title Upper",
+    ]
+    assert resolved.properties[3].value == [report.owner]
+    assert resolved.properties[5].value == "PLANNED"
+
+
+def test_field_type_is_mapped_per_field_class():
+    assert _get_field_type(models.BigAutoField()) == "integer"
+    assert _get_field_type(models.SlugField()) == "char"
+    assert _get_field_type(models.JSONField()) == "default"
+
+
+class PlanView(ObjectDetailMixin):
+    cv_property_display = DISPLAY
+
+
+def test_plans_are_compiled_once_per_view_class(monkeypatch):
+    compiled = []
+    compile_groups = mixins.compile_groups
+
+    def _compile_groups(model, groups):
+        compiled.append(model)
+        return compile_groups(model, groups)
+
+    monkeypatch.setattr(mixins, "compile_groups", _compile_groups)
+    monkeypatch.delattr(PlanView, "_cv_property_display_plans", raising=False)
+
+    plans = PlanView().get_property_display_plans(Report)
+    assert PlanView().get_property_display_plans(Report) is plans
+    assert compiled == [Report]
+
+    # subclasses have their own cache, a replaced cv_property_display is compiled again
+    class SubPlanView(PlanView):
+        pass
+
+    SubPlanView().get_property_display_plans(Report)
+    monkeypatch.setattr(PlanView, "cv_property_display", [{"title": "Other", "properties": ["title"]}])
+    assert PlanView().get_property_display_plans(Report)[0].config.title == "Other"
+    assert compiled == [Report, Report, Report]
+
+
+def test_property_display_per_request_is_not_cached():
+    class DynamicPlanView(ObjectDetailMixin):
+        @property
+        def property_display(self):
+            return [{"title": "Dynamic", "properties": ["title"]}]
+
+    view = DynamicPlanView()
+    assert view.get_property_display_plans(Report) is not view.get_property_display_plans(Report)
+    assert "_cv_property_display_plans" not in DynamicPlanView.__dict__
@@ -0,0 +1,87 @@
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models import Prefetch
+from django.test.utils import CaptureQueriesContext
+
+from crud_views_object_detail.lib.config import PropertyGroupConfig
+from crud_views_object_detail.lib.resolvers import compile_groups, query_lookups
+from tests.lib.helper.user import user_viewset_permission
+from tests.test1.app.models import Book, BookNote, Publisher
+from tests.test1.app.views import BookDetailView, cv_book
+from tests.test1.od_app.models import Info, Report
+
+
+def _lookups(model, *paths):
+    groups = [PropertyGroupConfig(title="T", properties=list(paths))]
+    select_related, prefetch_related = query_lookups(compile_groups(model, groups))
+    prefetch = [
+        (p.prefetch_through, p.queryset.query.select_related) if isinstance(p, Prefetch) else p
+        for p in prefetch_related
+    ]
+    return select_related, prefetch
+
+
+def test_foreign_key_chains_are_joined():
+    assert _lookups(Report, "title", "owner", "owner__username", "info__text") == (["info", "owner"], [])
+    # a reverse one-to-one is joined by its query name
+    assert _lookups(Info, "report__owner__username") == (["report__owner"], [])
+
+
+def test_many_valued_relations_are_prefetched():
+    assert _lookups(Report, "access_users", "access_users__username") == ([], ["access_users"])
+    # the foreign keys after a many-valued relation are joined in the Prefetch queryset
+    assert _lookups(Book, "notes__book__publisher__name", "publisher__name") == (
+        ["publisher"],
+        [("notes", {"book": {"publisher": {}}})],
+    )
+    # a second many-valued relation is prefetched by its path
+    assert _lookups(Publisher, "books__notes__note") == ([], ["books", "books__notes"])
+
+
+def test_methods_and_unmatched_accessors_are_not_fetched():
+    # title_upper is a method, "report" on User is not an instance attribute
+    assert _lookups(Report, "title_upper", "owner__get_full_name") == (["owner"], [])
+    assert _lookups(Report, "access_users__get_full_name") == ([], ["access_users"])
+
+
+@pytest.fixture
+def client_book(client):
+    user = User.objects.create_user(username="user_od_query_plan", password="password")
+    user_viewset_permission(user, cv_book, "view")
+    client.force_login(user)
+    return client
+
+
+def _detail_queries(client, book: Book) -> int:
+    url = f"/publisher/{book.publisher_id}/book/{book.pk}/detail/"
+    client.get(url)  # warm up the per-process permission caches
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(url)
+    assert response.status_code == 200
+    return len(ctx.captured_queries)
+
+
+@pytest.mark.django_db
+def test_detail_is_loaded_with_its_relations(client_book, monkeypatch):
+    # one fetch of the object, shared by the permission check and the handler
+    monkeypatch.setattr(BookDetailView, "cv_memoize_object", True)
+    monkeypatch.setattr(BookDetailView, "cv_object_detail_query_plan", True)
+    monkeypatch.setattr(
+        BookDetailView,
+        "cv_property_display",
+        [{"title": "Book", "properties": ["title", "publisher__name", "notes", "notes__book__publisher__name"]}],
+    )
+    publisher = Publisher.objects.create(name="Planned")
+    few = Book.objects.create(title="Few", publisher=publisher)
+    many = Book.objects.create(title="Many", publisher=publisher)
+    BookNote.objects.create(book=few, note="only")
+    for i in range(6):
+        BookNote.objects.create(book=many, note=f"note {i}")
+
+    planned = _detail_queries(client_book, many)
+    assert _detail_queries(client_book, few) == planned
+
+    # without the plan (the default), the publisher and the notes of each property are queried
+    monkeypatch.setattr(BookDetailView, "cv_object_detail_query_plan", None)
+    assert _detail_queries(client_book, many) == planned + 2
@@ -0,0 +1,135 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.template import Context, Template, TemplateSyntaxError
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from crud_views_object_detail.lib import resolvers
+from crud_views_object_detail.lib.config import parse_property_display, x
+from crud_views_object_detail.lib.mixins import ObjectDetailMixin
+from crud_views_object_detail.lib.resolvers import resolve_all, resolve_many
+from tests.test1.od_app.models import Info, Report
+
+DISPLAY = [
+    {
+        "title": "Report",
+        "properties": [
+            "title",
+            x("owner", link="user-detail"),
+            "owner__username",
+            "access_users__username",
+            "info__text",
+        ],
+    }
+]
+
+
+def _reports(count: int, owner) -> list[Report]:
+    reports = []
+    for i in range(count):
+        info = Info.objects.create(text=f"Info {i}", create_dt=timezone.now(), update_dt=timezone.now())
+        report = Report.objects.create(title=f"Report {i}", owner=owner, info=info)
+        report.access_users.add(owner)
+        reports.append(report)
+    return reports
+
+
+@pytest.fixture
+def owner(db):
+    return get_user_model().objects.create_user(username="batch_owner", password="testpass")
+
+
+def _queries(fn) -> int:
+    with CaptureQueriesContext(connection) as ctx:
+        fn()
+    return len(ctx.captured_queries)
+
+
+def test_resolves_like_resolve_all(owner):
+    reports = _reports(3, owner)
+    groups = parse_property_display(DISPLAY)
+    resolved = resolve_many(Report.objects.order_by("pk"), groups)
+    assert list(resolved) == [report.pk for report in reports]
+    for report in reports:
+        assert resolved[report.pk] == resolve_all(report, groups)
+    assert resolved[reports[0].pk][0].properties[3].value == ["batch_owner"]
+
+
+@pytest.mark.parametrize("as_list", [False, True])
+def test_queries_do_not_grow_with_the_batch(owner, as_list):
+    groups = parse_property_display(DISPLAY)
+    _reports(2, owner)
+
+    def _resolve():
+        queryset = Report.objects.all()
+        resolve_many(list(queryset) if as_list else queryset, groups)
+
+    few = _queries(_resolve)
+    _reports(5, owner)
+    assert _queries(_resolve) == few
+    # a queryset joins the owner and the info, a list prefetches them
+    assert few == (4 if as_list else 2)
+
+
+def test_link_urls_are_reversed_once_per_target(owner, monkeypatch):
+    other = get_user_model().objects.create_user(username="batch_other", password="testpass")
+    reports = _reports(3, owner) + _reports(1, other)
+    reversed_urls = []
+    reverse = resolvers.reverse
+
+    def _reverse(*args, **kwargs):
+        reversed_urls.append(kwargs["kwargs"])
+        return reverse(*args, **kwargs)
+
+    monkeypatch.setattr(resolvers, "reverse", _reverse)
+    resolved = resolve_many(reports, parse_property_display(DISPLAY))
+    assert reversed_urls == [{"pk": owner.pk}, {"pk": other.pk}]
+    assert resolved[reports[0].pk][0].properties[1].link_url == f"/users/{owner.pk}/"
+    assert resolved[reports[3].pk][0].properties[1].link_url == f"/users/{other.pk}/"
+
+
+class BatchView(ObjectDetailMixin):
+    cv_property_display = [{"title": "Card", "properties": ["title", "info__text"]}]
+
+
+def test_template_tag(owner):
+    reports = _reports(2, owner)
+    tpl = Template(
+        "{% load crud_views_object_detail %}"
+        "{% resolve_object_details objects as details %}"
+        "{% for object in objects %}{% render_object_detail object details %}{% endfor %}"
+    )
+    html = tpl.render(Context({"objects": reports, "view": BatchView()}))
+    assert html.count("Card") == 2
+    assert "Report 0" in html and "Info 1" in html
+
+    # an explicit property_display is parsed and resolved for the batch
+    details = Template(
+        "{% load crud_views_object_detail %}{% resolve_object_details objects display as details %}{{ details|length }}"
+    )
+    display = [{"title": "Owner", "properties": ["owner__username"]}]
+    assert details.render(Context({"objects": reports, "display": display})) == "2"
+
+
+def test_deferred_queryset(owner):
+    reports = _reports(2, owner)
+    groups = parse_property_display(DISPLAY)
+    # select_related cannot traverse the owner only() leaves out: the relations are prefetched instead
+    resolved = resolve_many(Report.objects.only("title").order_by("pk"), groups)
+    for report in reports:
+        assert resolved[report.pk] == resolve_all(report, groups)
+    # a relation the queryset prefetches itself is not prefetched again
+    resolved = resolve_many(Report.objects.prefetch_related("access_users").order_by("pk"), groups)
+    assert resolved[reports[1].pk][0].properties[3].value == ["batch_owner"]
+
+
+def test_without_groups_needs_an_object_detail_view(owner):
+    reports = _reports(1, owner)
+    with pytest.raises(ValueError, match="needs groups"):
+        resolve_many(reports)
+    with pytest.raises(TemplateSyntaxError, match="needs a property_display"):
+        Template("{% load crud_views_object_detail %}{% resolve_object_details objects as details %}").render(
+            Context({"objects": reports, "view": object()})
+        )
+    assert list(resolve_many(reports, view=BatchView())) == [reports[0].pk]
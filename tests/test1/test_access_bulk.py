@@ -0,0 +1,73 @@
+"""cv_has_access_bulk / cv_action_enabled_bulk answer a whole page of rows and cards."""
+
+import pytest
+from lxml import html as lxml_html
+
+
+@pytest.mark.django_db
+def test_bulk_defaults_fall_back_to_per_object(client_user_author_view, author_douglas_adams, author_terry_pratchett):
+    from tests.test1.app.views import AuthorDetailView
+
+    response = client_user_author_view.get("/author/")
+    user = response.context["view"].request.user
+    authors = [author_douglas_adams, author_terry_pratchett]
+
+    assert AuthorDetailView.cv_has_access_bulk(user, authors) == {a.pk: True for a in authors}
+    assert AuthorDetailView.cv_action_enabled_bulk(user, authors) == {a.pk: True for a in authors}
+    assert AuthorDetailView.cv_has_access_bulk(user, []) == {}
+
+
+@pytest.mark.django_db
+def test_list_page_uses_bulk_hooks(client_user_author_view, author_douglas_adams, author_terry_pratchett, monkeypatch):
+    from tests.test1.app.views import AuthorDetailView
+
+    calls = []
+
+    def has_access_bulk(cls, user, objs):
+        calls.append(("access", sorted(obj.pk for obj in objs)))
+        return {obj.pk: obj.pk != author_terry_pratchett.pk for obj in objs}
+
+    def action_enabled_bulk(cls, user, objs):
+        calls.append(("enabled", sorted(obj.pk for obj in objs)))
+        return {obj.pk: True for obj in objs}
+
+    def per_object(cls, user, obj=None):
+        raise AssertionError("the page must be answered by the bulk hooks")
+
+    monkeypatch.setattr(AuthorDetailView, "cv_has_access_bulk", classmethod(has_access_bulk))
+    monkeypatch.setattr(AuthorDetailView, "cv_action_enabled_bulk", classmethod(action_enabled_bulk))
+    monkeypatch.setattr(AuthorDetailView, "cv_has_access", classmethod(per_object))
+    monkeypatch.setattr(AuthorDetailView, "cv_action_enabled", classmethod(per_object))
+
+    response = client_user_author_view.get("/author/")
+    assert response.status_code == 200
+
+    pks = sorted([author_douglas_adams.pk, author_terry_pratchett.pk])
+    assert calls == [("access", pks), ("enabled", pks)]
+    tree = lxml_html.fromstring(response.content.decode())
+    assert tree.cssselect(f'a[href="/author/{author_douglas_adams.pk}/detail/"][cv-key="detail"]')
+    assert not tree.cssselect(f'a[href="/author/{author_terry_pratchett.pk}/detail/"][cv-key="detail"]')
+
+
+@pytest.mark.django_db
+def test_card_child_action_uses_action_enabled_bulk(client, cv_publisher, cv_book, publisher_penguin, monkeypatch):
+    from django.contrib.auth.models import User
+
+    from tests.lib.helper.user import user_viewset_permission
+    from tests.test1.app.views import BookListView
+
+    user = User.objects.create_user(username="user_pub_card_enabled_bulk", password="password")
+    user_viewset_permission(user, cv_publisher, "view")
+    client.force_login(user)
+
+    calls = []
+
+    def action_enabled_bulk(cls, user, objs):
+        calls.append([obj.pk for obj in objs])
+        return {obj.pk: False for obj in objs}
+
+    monkeypatch.setattr(BookListView, "cv_action_enabled_bulk", classmethod(action_enabled_bulk))
+    response = client.get("/publisher/card/")
+    assert response.status_code == 200
+    assert calls == [[publisher_penguin.pk]]
+    assert f"/publisher/{publisher_penguin.pk}/book/" not in response.content.decode()
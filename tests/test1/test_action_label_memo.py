@@ -0,0 +1,91 @@
+"""Per-request memoization of object-independent action labels."""
+
+import pytest
+from django.urls import reverse
+from django.utils import translation
+
+from crud_views.lib.view.base import cv_snippet_references_object
+
+
+def test_default_snippets_detected():
+    # short labels never mention the row; the long detail/update/delete labels do
+    assert cv_snippet_references_object("crud_views/snippets/action_short/detail.html", None) is False
+    assert cv_snippet_references_object("crud_views/snippets/action/list.html", None) is False
+    assert cv_snippet_references_object("crud_views/snippets/action/detail.html", None) is True
+    assert cv_snippet_references_object(None, "Delete") is False
+    assert cv_snippet_references_object(None, "Delete {{ object }}") is True
+    # included templates are not inspected -> treated as object-dependent
+    assert cv_snippet_references_object(None, "{% include 'x.html' %}") is True
+
+
+def _list_view(client, cv_author):
+    response = client.get(reverse(cv_author.get_router_name("list")))
+    assert response.status_code == 200
+    view = response.context["view"]
+    view._cv_action_label_cache = {}  # start from a clean memo; rendering the page filled it
+    return view
+
+
+@pytest.mark.django_db
+def test_short_label_rendered_once_per_request(
+    client_user_author_view, cv_author, author_douglas_adams, author_terry_pratchett, monkeypatch
+):
+    from tests.test1.app.views import AuthorDetailView
+
+    view = _list_view(client_user_author_view, cv_author)
+    calls = []
+    render_snippet = AuthorDetailView.render_snippet.__func__
+    monkeypatch.setattr(
+        AuthorDetailView,
+        "render_snippet",
+        classmethod(lambda cls, *a, **kw: calls.append(a) or render_snippet(cls, *a, **kw)),
+    )
+
+    labels = set()
+    for author in (author_douglas_adams, author_terry_pratchett):
+        labels.add(AuthorDetailView.cv_get_action_short_label(view.cv_get_view_context(object=author)))
+
+    assert labels == {"Detail"}
+    assert len(calls) == 1
+
+
+@pytest.mark.django_db
+def test_object_label_rendered_per_object(
+    client_user_author_view, cv_author, author_douglas_adams, author_terry_pratchett
+):
+    from tests.test1.app.views import AuthorDetailView
+
+    view = _list_view(client_user_author_view, cv_author)
+    labels = [
+        AuthorDetailView.cv_get_action_label(view.cv_get_view_context(object=author))
+        for author in (author_douglas_adams, author_terry_pratchett)
+    ]
+    assert str(author_douglas_adams) in labels[0]
+    assert str(author_terry_pratchett) in labels[1]
+
+
+@pytest.mark.django_db
+def test_memo_is_keyed_by_language(client_user_author_view, cv_author, author_douglas_adams):
+    from tests.test1.app.views import AuthorDetailView
+
+    view = _list_view(client_user_author_view, cv_author)
+    context = view.cv_get_view_context(object=author_douglas_adams)
+    with translation.override("en"):
+        AuthorDetailView.cv_get_action_short_label(context)
+    with translation.override("de"):
+        AuthorDetailView.cv_get_action_short_label(context)
+    languages = {key[-1] for key in view._cv_action_label_cache if key[0] is AuthorDetailView}
+    assert {"en", "de"} <= languages
+
+
+@pytest.mark.django_db
+def test_explicit_declaration_overrides_detection(
+    client_user_author_view, cv_author, author_douglas_adams, author_terry_pratchett, monkeypatch
+):
+    from tests.test1.app.views import AuthorDetailView
+
+    view = _list_view(client_user_author_view, cv_author)
+    monkeypatch.setattr(AuthorDetailView, "cv_action_label_object_independent", False)
+    monkeypatch.setattr(AuthorDetailView, "cv_action_short_label_template_code", "{{ verbose_name }}")
+    AuthorDetailView.cv_get_action_short_label(view.cv_get_view_context(object=author_douglas_adams))
+    assert not any(key[0] is AuthorDetailView for key in view._cv_action_label_cache)
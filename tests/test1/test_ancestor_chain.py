@@ -0,0 +1,102 @@
+"""The ancestor chain of a nested view is resolved with one scoped query."""
+
+import pytest
+from django.db import connection
+from django.http import Http404
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from tests.test1.app.models import Book, BookNote, Publisher
+
+
+@pytest.fixture
+def note_view():
+    from tests.test1.app.views import BookNoteBcListView
+
+    def make(publisher, book):
+        view = BookNoteBcListView()
+        request = RequestFactory().get(f"/publisher_bc/{publisher.pk}/book_bc/{book.pk}/booknote_bc/")
+        view.setup(request, publisher_bc_pk=publisher.pk, book_bc_pk=book.pk)
+        return view
+
+    return make
+
+
+@pytest.fixture
+def chain():
+    publisher = Publisher.objects.create(name="Penguin Chain")
+    book = Book.objects.create(title="Hitchhiker Chain", publisher=publisher)
+    BookNote.objects.create(book=book, note="chained")
+    return publisher, book
+
+
+@pytest.mark.django_db
+def test_chain_resolved_in_one_query(chain, note_view):
+    publisher, book = chain
+    view = note_view(publisher, book)
+    with CaptureQueriesContext(connection) as ctx:
+        assert view.cv_get_ancestor_object(1) == publisher
+        assert view.cv_get_ancestor_object(0) == book
+    assert len(ctx.captured_queries) == 1
+    assert "JOIN" in ctx.captured_queries[0]["sql"]
+    # the grandparent is the parent's related object, not a second instance
+    assert view.cv_get_ancestor_object(0).publisher is view.cv_get_ancestor_object(1)
+
+
+@pytest.mark.django_db
+def test_chain_skips_the_prefetches_of_the_parent_viewset(chain, note_view, monkeypatch):
+    from tests.test1.app.views import cv_book_bc
+
+    monkeypatch.setattr(cv_book_bc, "prefetch_related", ["notes"])
+    publisher, book = chain
+    view = note_view(publisher, book)
+    with CaptureQueriesContext(connection) as ctx:
+        assert view.cv_get_ancestor_object(1) == publisher
+    assert len(ctx.captured_queries) == 1
+
+
+@pytest.mark.django_db
+def test_foreign_grandparent_pk_raises_404(chain, note_view):
+    _publisher, book = chain
+    other = Publisher.objects.create(name="Other Chain House")
+    view = note_view(other, book)
+    with pytest.raises(Http404):
+        view.cv_get_ancestor_object(1)
+
+
+@pytest.mark.django_db
+def test_child_list_page_breadcrumb_and_parent_share_chain(client, chain):
+    publisher, book = chain
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(f"/publisher_bc/{publisher.pk}/book_bc/{book.pk}/booknote_bc/")
+    assert response.status_code == 200
+
+    def selects(model):
+        return [q["sql"] for q in ctx.captured_queries if q["sql"].startswith(f'SELECT "{model._meta.db_table}"')]
+
+    assert len(selects(Book)) == 1  # the chain query, joined with the publisher
+    assert selects(Publisher) == []
+
+
+@pytest.mark.django_db
+def test_scoped_grandparent_viewset_is_queried(chain, note_view, monkeypatch):
+    from crud_views.lib.viewset import ViewSet
+    from tests.test1.app.views import cv_publisher_bc
+
+    class ScopedViewSet(ViewSet):
+        def get_queryset(self, view):
+            return super().get_queryset(view).exclude(name="Penguin Chain")
+
+    monkeypatch.setattr(cv_publisher_bc, "__class__", ScopedViewSet)
+    publisher, book = chain
+    view = note_view(publisher, book)
+    # the grandparent is not joined to the book but fetched through its own ViewSet, which excludes it
+    with pytest.raises(Http404):
+        view.cv_get_ancestor_object(0)
+
+    other = Publisher.objects.create(name="Scoped Chain House")
+    book = Book.objects.create(title="Scoped Chain", publisher=other)
+    view = note_view(other, book)
+    with CaptureQueriesContext(connection) as ctx:
+        assert view.cv_get_ancestor_object(1) == other
+    assert len(ctx.captured_queries) == 2
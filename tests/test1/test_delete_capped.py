@@ -0,0 +1,134 @@
+"""Count-only, capped related objects on the delete confirmation page."""
+
+import pytest
+from django.contrib.admin.utils import NestedObjects
+from django.contrib.auth.models import Permission, User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from crud_views.lib.cascade import CappedCollector, TruncatedRelated
+from tests.lib.helper.user import user_viewset_permission
+from tests.test1.app.models import Book, BookNote, Contract, Library, Loan, Publisher, Shelf, Tag
+from tests.test1.app.views import PublisherLinkedDeleteView, cv_publisher_linked
+
+
+def _publisher(name: str, books: int) -> Publisher:
+    publisher = Publisher.objects.create(name=name)
+    for i in range(books):
+        book = Book.objects.create(title=f"{name} book {i:02}", publisher=publisher)
+        BookNote.objects.create(book=book, note=f"{name} note {i:02}")
+    return publisher
+
+
+def _labels(nodes: list) -> list:
+    """The display tree as nested lists of labels."""
+    result = []
+    for node in nodes:
+        result.append(str(node["obj"]) if node["obj"] is not None else None)
+        if node["children"]:
+            result.append(_labels(node["children"]))
+    return result
+
+
+@pytest.fixture
+def client_linked(client):
+    user = User.objects.create_user(username="user_delete_capped", password="password")
+    user_viewset_permission(user, cv_publisher_linked, "delete")
+    for codename in ("view_publisher", "view_book", "view_booknote"):
+        user.user_permissions.add(Permission.objects.get(codename=codename))
+    client.force_login(user)
+    return client
+
+
+@pytest.mark.django_db
+def test_summary_is_counted(client_linked, monkeypatch):
+    publisher = _publisher("Counted", 10)
+    url = f"/publisher_linked/{publisher.pk}/delete/"
+    full = client_linked.get(url).context["related_summary"]
+
+    monkeypatch.setattr(PublisherLinkedDeleteView, "cv_related_objects_limit", 3)
+    response = client_linked.get(url)
+    assert response.context["related_summary"] == full == {"book": 10, "book note": 10}
+    assert _labels(response.context["related_objects"]) == [
+        "Counted",
+        [
+            "Counted book 00",
+            ["Counted note 00"],
+            "Counted book 01",
+            ["Counted note 01"],
+            "Counted book 02",
+            ["Counted note 02"],
+            "… and 7 more books",
+        ],
+    ]
+    assert "… and 7 more books" in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_queries_do_not_grow_with_the_cascade(client_linked, monkeypatch):
+    monkeypatch.setattr(PublisherLinkedDeleteView, "cv_related_objects_limit", 3)
+    queries = []
+    for name, books in [("Small", 5), ("Large", 60)]:
+        url = f"/publisher_linked/{_publisher(name, books).pk}/delete/"
+        client_linked.get(url)  # warm up the per-process permission caches
+        with CaptureQueriesContext(connection) as ctx:
+            response = client_linked.get(url)
+        assert response.context["related_summary"]["book"] == books
+        book_queries = [q["sql"] for q in ctx.captured_queries if 'FROM "app_book"' in q["sql"]]
+        assert all("COUNT(" in sql or "LIMIT 3" in sql for sql in book_queries)
+        queries.append(len(ctx.captured_queries))
+    assert queries[0] == queries[1]
+
+
+@pytest.mark.django_db
+def test_permission_filter_runs_on_the_capped_tree(client, monkeypatch):
+    monkeypatch.setattr(PublisherLinkedDeleteView, "cv_related_objects_limit", 2)
+    user = User.objects.create_user(username="user_delete_capped_restricted", password="password")
+    user_viewset_permission(user, cv_publisher_linked, "delete")
+    user.user_permissions.add(Permission.objects.get(codename="view_publisher"))
+    client.force_login(user)
+
+    publisher = _publisher("Restricted", 4)
+    response = client.get(f"/publisher_linked/{publisher.pk}/delete/")
+    assert _labels(response.context["related_objects"]) == [
+        "Restricted",
+        [None, [None], None, [None], "… and 2 more books"],
+    ]
+
+
+@pytest.mark.django_db
+def test_protected_objects_are_capped():
+    publisher = _publisher("Protected", 1)
+    for i in range(5):
+        Contract.objects.create(publisher=publisher, title=f"Contract {i}")
+    collector = CappedCollector(using="default", limit=2)
+    collector.collect(publisher)
+    assert [str(p) for p in collector.protected] == ["Contract 0", "Contract 1", "… and 3 more contracts"]
+    assert isinstance(collector.protected[-1], TruncatedRelated)
+    assert dict(collector.summary) == {"book": 1, "book note": 1}
+
+
+@pytest.mark.django_db
+def test_generic_relations_and_shared_rows_match_nested_objects():
+    library = Library.objects.create(name="Library")
+    Tag.objects.create(content_object=library, label="library tag")
+    for i in range(3):
+        shelf = Shelf.objects.create(library=library, name=f"Shelf {i}")
+        Tag.objects.create(content_object=shelf, label=f"shelf tag {i}")
+        # a loan is reached through the library and through its shelf
+        Loan.objects.create(library=library, shelf=shelf)
+    # the tags of another library's shelf are not deleted
+    other = Shelf.objects.create(library=Library.objects.create(name="Other"), name="Other shelf")
+    Tag.objects.create(content_object=other, label="other tag")
+
+    nested = NestedObjects(using="default")
+    nested.collect([library])
+    uncapped = {model._meta.verbose_name: len(objs) for model, objs in nested.data.items() if model is not Library}
+
+    collector = CappedCollector(using="default", limit=2)
+    collector.collect(library)
+    assert dict(collector.summary) == uncapped == {"shelf": 3, "tag": 4, "loan": 3}
+    # the generic-related rows are listed, too: two tags within the limit, the library's truncated
+    children = collector.nested()[1]
+    assert "shelf tag 0" in [str(obj) for obj in children[1]]
+    assert "… and 1 more tag" in [str(obj) for obj in children]
@@ -0,0 +1,212 @@
+"""Chunked and background cascade deletes of DeleteView."""
+
+import uuid
+
+import pytest
+from django.contrib.auth.models import AnonymousUser, User
+from django.contrib.messages import get_messages
+from django.db.models import ProtectedError, RestrictedError
+
+from crud_views.lib.cascade import chunked_delete, delete_plan
+from crud_views.lib.delete_job import get_job, start_delete_job
+from crud_views.lib.views import DeleteView, delete
+from tests.lib.helper.user import user_viewset_permission
+from tests.test1.app.models import Book, BookNote, Contract, Publisher, Royalty
+from tests.test1.app.views import PublisherLinkedDeleteProgressView, PublisherLinkedDeleteView, cv_publisher_linked
+
+EXECUTOR = "tests.test1.app.views.ImmediateDeleteExecutorForTest"
+MODAL_HEADERS = {"X-CV-Modal": "true"}
+
+
+def _publisher(name: str, books: int) -> Publisher:
+    publisher = Publisher.objects.create(name=name)
+    for i in range(books):
+        book = Book.objects.create(title=f"{name} book {i}", publisher=publisher)
+        BookNote.objects.create(book=book, note=f"{name} note {i}")
+    return publisher
+
+
+def _messages(response) -> list[str]:
+    return [str(m) for m in get_messages(response.wsgi_request)]
+
+
+@pytest.mark.django_db
+def test_job_owner_is_stored_as_str():
+    class UuidUser:
+        pk = uuid.UUID("12345678-1234-5678-1234-567812345678")
+
+    job = start_delete_job(_publisher("Uuid", 0), using="default", batch_size=1, user=UuidUser())
+    assert get_job(job.id).user == "12345678-1234-5678-1234-567812345678"
+
+
+@pytest.fixture
+def client_delete(client):
+    user = User.objects.create_user(username="user_delete_chunked", password="password")
+    user_viewset_permission(user, cv_publisher_linked, "delete")
+    client.force_login(user)
+    return client
+
+
+@pytest.mark.django_db
+def test_cascade_is_deleted_leaves_first_in_batches():
+    publisher = _publisher("Chunked", 7)
+    other = _publisher("Other", 2)
+    assert [qs.model for qs in delete_plan(publisher, "default")] == [BookNote, Book]
+
+    calls = []
+    deleted = chunked_delete(publisher, using="default", batch_size=3, progress=lambda *a: calls.append(a))
+    assert deleted == 15
+    # notes and books in batches of 3, 3 and 1, the publisher last
+    assert calls == [(3, 15), (6, 15), (7, 15), (10, 15), (13, 15), (14, 15), (15, 15)]
+    assert not Publisher.objects.filter(pk=publisher.pk).exists()
+    assert Book.objects.filter(publisher=other).count() == BookNote.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_protected_rows_stop_the_delete_up_front():
+    publisher = _publisher("Protected", 2)
+    Contract.objects.create(publisher=publisher, title="Contract")
+    with pytest.raises(ProtectedError):
+        chunked_delete(publisher, using="default", batch_size=1)
+    assert BookNote.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_restricted_rows_deleted_by_the_cascade_allow_the_delete():
+    publisher = _publisher("Diamond", 3)
+    for book in publisher.books.all():
+        Royalty.objects.create(book=book, publisher=publisher)
+    # the royalties are reached through the books (CASCADE) and the publisher (RESTRICT)
+    assert {qs.model for qs in delete_plan(publisher, "default")} == {BookNote, Royalty, Book}
+    assert chunked_delete(publisher, using="default", batch_size=2) == 10
+    assert not Royalty.objects.exists()
+    assert not Book.objects.exists()
+
+
+@pytest.mark.django_db
+def test_restricted_rows_outside_the_cascade_stop_the_delete():
+    publisher = _publisher("Restricted", 2)
+    other = _publisher("Other", 1)
+    Royalty.objects.create(book=publisher.books.first(), publisher=publisher)
+    Royalty.objects.create(book=other.books.get(), publisher=publisher)
+    with pytest.raises(RestrictedError, match="RESTRICT"):
+        chunked_delete(publisher, using="default", batch_size=1)
+    assert BookNote.objects.count() == 3
+    assert Royalty.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_chunked_strategy(client_delete, monkeypatch):
+    monkeypatch.setattr(PublisherLinkedDeleteView, "cv_delete_strategy", "chunked")
+    monkeypatch.setattr(PublisherLinkedDeleteView, "cv_delete_batch_size", 2)
+    publisher = _publisher("Chunked", 5)
+    response = client_delete.post(f"/publisher_linked/{publisher.pk}/delete/", {"confirm": True})
+    assert response.status_code == 302
+    assert not Publisher.objects.exists()
+    assert not BookNote.objects.exists()
+
+
+@pytest.mark.django_db
+def test_background_strategy_in_modal(client_delete, monkeypatch, django_capture_on_commit_callbacks):
+    monkeypatch.setattr(PublisherLinkedDeleteView, "cv_delete_strategy", "background")
+    monkeypatch.setattr(PublisherLinkedDeleteView, "cv_delete_executor", EXECUTOR)
+    monkeypatch.setattr(PublisherLinkedDeleteView, "cv_modal", True)
+    publisher = _publisher("Background", 3)
+
+    with django_capture_on_commit_callbacks(execute=False) as callbacks:
+        response = client_delete.post(
+            f"/publisher_linked/{publisher.pk}/delete/", {"confirm": True}, headers=MODAL_HEADERS
+        )
+    assert response.status_code == 202
+    progress_url = response["X-CV-Progress"]
+    assert progress_url.startswith("/publisher_linked/delete_progress/?job=")
+    assert client_delete.get(progress_url).json()["state"] == "pending"
+    # the success message waits for the job
+    assert _messages(client_delete.get(progress_url)) == []
+
+    # the job is submitted when the request's transaction is committed
+    assert len(callbacks) == 1
+    callbacks[0]()
+    response = client_delete.get(progress_url)
+    assert response.json() == {
+        "state": "done",
+        "deleted": 7,
+        "total": 7,
+        "redirect": "/publisher_linked/",
+        "error": None,
+    }
+    assert _messages(response) == ["Deleted Publisher <strong>Background</strong>"]
+    # it is added once, the page the modal navigates to shows it
+    assert get_job(progress_url.split("job=")[1]).message is None
+    assert not Publisher.objects.exists()
+
+    # jobs are only shown to the user who started them
+    other = User.objects.create_user(username="user_delete_chunked_other", password="password")
+    user_viewset_permission(other, cv_publisher_linked, "delete")
+    client_delete.force_login(other)
+    assert client_delete.get(progress_url).status_code == 404
+    assert client_delete.get("/publisher_linked/delete_progress/?job=unknown").status_code == 404
+
+
+@pytest.mark.django_db
+def test_background_failure_is_recorded(client_delete, monkeypatch, django_capture_on_commit_callbacks):
+    monkeypatch.setattr(PublisherLinkedDeleteView, "cv_delete_strategy", "background")
+    monkeypatch.setattr(PublisherLinkedDeleteView, "cv_delete_executor", EXECUTOR)
+    jobs = []
+
+    def _start_delete_job(*args, **kwargs):
+        jobs.append(start_delete_job(*args, **kwargs))
+        return jobs[-1]
+
+    monkeypatch.setattr(delete, "start_delete_job", _start_delete_job)
+    monkeypatch.setattr(PublisherLinkedDeleteView, "cv_modal", True)
+    publisher = _publisher("Failing", 1)
+    Contract.objects.create(publisher=publisher, title="Contract")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client_delete.post(
+            f"/publisher_linked/{publisher.pk}/delete/", {"confirm": True}, headers=MODAL_HEADERS
+        )
+    assert response.status_code == 202
+    job = get_job(jobs[0].id)
+    assert job.state == "failed"
+    assert job.message == "Deleted Publisher <strong>Failing</strong>"
+    assert _messages(client_delete.get(f"/publisher_linked/delete_progress/?job={job.id}")) == []
+    assert "PROTECT" in job.error
+    assert Publisher.objects.filter(pk=publisher.pk).exists()
+    assert BookNote.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_background_strategy_without_modal_deletes_chunked(client_delete, monkeypatch):
+    monkeypatch.setattr(PublisherLinkedDeleteView, "cv_delete_strategy", "background")
+    monkeypatch.setattr(delete, "start_delete_job", pytest.fail)
+    publisher = _publisher("Redirected", 2)
+    response = client_delete.post(f"/publisher_linked/{publisher.pk}/delete/", {"confirm": True})
+    # the redirect to the list comes after the delete
+    assert response.status_code == 302
+    assert not Publisher.objects.exists()
+    assert not BookNote.objects.exists()
+
+
+@pytest.mark.django_db
+def test_anonymous_jobs_are_not_shown(client, monkeypatch):
+    monkeypatch.setattr(PublisherLinkedDeleteProgressView, "has_permission", lambda self: True)
+    job = start_delete_job(_publisher("Anonymous", 1), using="default", batch_size=1, user=AnonymousUser())
+    assert job.user is None
+    assert client.get(f"/publisher_linked/delete_progress/?job={job.id}").status_code == 404
+
+
+def test_checks(monkeypatch):
+    def check_ids(view_cls) -> list:
+        return [m.id for c in view_cls.checks() for m in c.messages()]
+
+    class BogusStrategyDeleteView(DeleteView):
+        cv_delete_strategy = "truncate"
+
+    assert "viewset.E280" in check_ids(BogusStrategyDeleteView)
+
+    monkeypatch.setattr(PublisherLinkedDeleteView, "cv_delete_strategy", "background")
+    assert "viewset.E281" not in check_ids(PublisherLinkedDeleteView)
+    monkeypatch.setattr(PublisherLinkedDeleteView, "cv_delete_progress_key", "missing")
+    assert "viewset.E281" in check_ids(PublisherLinkedDeleteView)
@@ -0,0 +1,93 @@
+"""Links of the related objects on the delete confirmation page."""
+
+import pytest
+from django.contrib.auth.models import Permission, User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from lxml import html
+
+from crud_views.lib.views import DeleteView
+from crud_views.lib.viewset import _REGISTRY, ViewSet
+from tests.lib.helper.user import user_viewset_permission
+from tests.test1.app.models import Book, BookNote, Publisher
+from tests.test1.app.views import cv_book, cv_book_bc, cv_publisher_linked
+
+
+def test_viewsets_by_model():
+    viewsets = ViewSet.get_viewsets_for_model(Book)
+    assert viewsets.index(cv_book) < viewsets.index(cv_book_bc)
+    assert ViewSet.get_viewsets_for_model(Permission) == []
+
+    name = "book_index_probe"
+    probe = ViewSet(model=Book, name=name)
+    try:
+        assert ViewSet.get_viewsets_for_model(Book)[-1] is probe
+    finally:
+        _REGISTRY.pop(name, None)
+    assert probe not in ViewSet.get_viewsets_for_model(Book)
+
+
+@pytest.fixture
+def client_linked(client):
+    user = User.objects.create_user(username="user_related_links", password="password")
+    user_viewset_permission(user, cv_publisher_linked, "delete")
+    for codename in ("view_publisher", "view_book", "view_booknote"):
+        user.user_permissions.add(Permission.objects.get(codename=codename))
+    client.force_login(user)
+    return client
+
+
+def _links(client, publisher: Publisher) -> tuple[dict[str, str], int]:
+    url = f"/publisher_linked/{publisher.pk}/delete/"
+    client.get(url)  # warm up the per-process permission caches
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(url)
+    assert response.status_code == 200
+    doc = html.fromstring(response.content)
+    return {a.text_content().strip(): a.get("href") for a in doc.cssselect("ul a")}, len(ctx.captured_queries)
+
+
+def _books(publisher: Publisher, count: int):
+    for i in range(count):
+        book = Book.objects.create(title=f"{publisher.name} book {i}", publisher=publisher)
+        BookNote.objects.create(book=book, note=f"{publisher.name} note {i}")
+
+
+@pytest.mark.django_db
+def test_links_follow_the_parent(client_linked, publisher_penguin):
+    _books(publisher_penguin, 2)
+    links, _queries = _links(client_linked, publisher_penguin)
+    book = Book.objects.get(title="Penguin book 1")
+    # the first ViewSet of Book with a detail view, its parent pk read from the foreign key
+    assert links["Penguin book 1"] == f"/publisher/{publisher_penguin.pk}/book/{book.pk}/detail/"
+    assert links["Penguin"] == f"/publisher/{publisher_penguin.pk}/detail/"
+
+
+@pytest.mark.django_db
+def test_viewset_is_resolved_once_per_model(client_linked, monkeypatch):
+    models = []
+    resolve = DeleteView.cv_get_related_viewset
+
+    def cv_get_related_viewset(self, model):
+        models.append(model)
+        return resolve(self, model)
+
+    monkeypatch.setattr(DeleteView, "cv_get_related_viewset", cv_get_related_viewset)
+    publisher = Publisher.objects.create(name="Many")
+    _books(publisher, 10)
+    links, _queries = _links(client_linked, publisher)
+    assert len([t for t in links if t.startswith("Many book")]) == 10
+    # once per model and request, _links makes two requests
+    assert sorted(m.__name__ for m in models) == ["Book", "Book", "BookNote", "BookNote", "Publisher", "Publisher"]
+
+
+@pytest.mark.django_db
+def test_links_cost_no_query_per_object(client_linked):
+    small = Publisher.objects.create(name="Small")
+    large = Publisher.objects.create(name="Large")
+    _books(small, 2)
+    _books(large, 20)
+    _small_links, small_queries = _links(client_linked, small)
+    large_links, large_queries = _links(client_linked, large)
+    assert len([t for t in large_links if t.startswith("Large book")]) == 20
+    assert large_queries == small_queries
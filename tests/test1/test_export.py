@@ -0,0 +1,132 @@
+"""Streaming CSV / JSON lines export of list views."""
+
+import csv
+import io
+import json
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.http import StreamingHttpResponse
+from django.test.utils import CaptureQueriesContext
+
+from tests.lib.helper.user import user_viewset_permission
+from tests.test1.app.models import Book, Publisher
+from tests.test1.app.resources import STREAMED_READS, S3FileExportView, S3FileListView
+from tests.test1.app.views import BookExportView, PublisherExportView, PublisherListView, cv_book, cv_publisher
+
+
+def _content(response) -> str:
+    assert response.status_code == 200
+    assert isinstance(response, StreamingHttpResponse)
+    return b"".join(response.streaming_content).decode()
+
+
+def _csv(response) -> list[list[str]]:
+    return list(csv.reader(io.StringIO(_content(response))))
+
+
+@pytest.fixture
+def client_publisher(client):
+    for name in ["Alpha", "Bravo", "Charlie, Ltd.", "Delta"]:
+        Publisher.objects.create(name=name)
+    user = User.objects.create_user(username="user_export", password="password")
+    user_viewset_permission(user, cv_publisher, "view")
+    client.force_login(user)
+    return client
+
+
+@pytest.mark.django_db
+def test_csv_has_the_table_columns(client_publisher):
+    response = client_publisher.get("/publisher/export/")
+    assert response["Content-Type"].startswith("text/csv")
+    assert response["Content-Disposition"] == 'attachment; filename="publisher.csv"'
+    rows = _csv(response)
+    # the action column is not exported
+    assert rows[0] == ["ID", "Name"]
+    assert [r[1] for r in rows[1:]] == ["Alpha", "Bravo", "Charlie, Ltd.", "Delta"]
+
+
+@pytest.mark.django_db
+def test_jsonl_is_filtered_and_sorted_like_the_list(client_publisher):
+    response = client_publisher.get("/publisher/export/?format=jsonl&name=a&sort=-name")
+    assert response["Content-Type"].startswith("application/jsonl")
+    lines = [json.loads(line) for line in _content(response).splitlines()]
+    assert [line["name"] for line in lines] == ["Delta", "Charlie, Ltd.", "Bravo", "Alpha"]
+    assert set(lines[0]) == {"id", "name"}
+
+    response = client_publisher.get("/publisher/export/?format=jsonl&name=r")
+    assert [json.loads(line)["name"] for line in _content(response).splitlines()] == ["Bravo", "Charlie, Ltd."]
+
+
+@pytest.mark.django_db
+def test_persisted_filter_is_used(client_publisher):
+    client_publisher.get("/publisher/?name=del")
+    assert [r[1] for r in _csv(client_publisher.get("/publisher/export/"))[1:]] == ["Delta"]
+    # an explicit query string wins
+    assert len(_csv(client_publisher.get("/publisher/export/?name=a"))) == 5
+
+
+@pytest.mark.django_db
+def test_invalid_format(client_publisher):
+    assert client_publisher.get("/publisher/export/?format=xml").status_code == 400
+
+
+@pytest.mark.django_db
+def test_rows_are_fetched_in_chunks(client, publisher_penguin, monkeypatch):
+    monkeypatch.setattr(BookExportView, "cv_export_chunk_size", 2)
+    for i in range(5):
+        Book.objects.create(title=f"Export {i}", publisher=publisher_penguin)
+    Book.objects.create(title="Other", publisher=Publisher.objects.create(name="Other"))
+    user = User.objects.create_user(username="user_export_book", password="password")
+    user_viewset_permission(user, cv_book, "view")
+    client.force_login(user)
+
+    with CaptureQueriesContext(connection) as ctx:
+        rows = _csv(client.get(f"/publisher/{publisher_penguin.pk}/book/export/"))
+    assert [r[1] for r in rows[1:]] == [f"Export {i}" for i in range(5)]  # the parent's books only
+    book_queries = [q["sql"] for q in ctx.captured_queries if '"app_book"' in q["sql"]]
+    assert len(book_queries) == 1
+    assert "COUNT(" not in book_queries[0]
+    assert "LIMIT" not in book_queries[0]
+
+
+@pytest.mark.django_db
+def test_model_fields_without_table(client_publisher, monkeypatch):
+    monkeypatch.setattr(PublisherListView, "table_class", None)
+    monkeypatch.setattr(PublisherExportView, "cv_export_fields", ["name"])
+    rows = _csv(client_publisher.get("/publisher/export/?name=alpha"))
+    assert rows == [["name"], ["Alpha"]]
+
+
+@pytest.mark.django_db
+def test_permission_required(client):
+    user = User.objects.create_user(username="user_export_none", password="password")
+    client.force_login(user)
+    assert client.get("/publisher/export/").status_code == 403
+
+
+@pytest.mark.django_db
+def test_resource_rows_are_streamed(client_user_s3file_view):
+    STREAMED_READS.clear()
+    response = client_user_s3file_view.get("/streamedfile/export/?format=jsonl")
+    assert response.status_code == 200
+    content = iter(response.streaming_content)
+    first = json.loads(next(content))
+    assert first == {"key": "reports/2026/q1.pdf", "size": 111}
+    assert STREAMED_READS == ["reports/2026/q1.pdf"]  # the first row is sent before the source is done
+    assert len(list(content)) == 2
+    assert len(STREAMED_READS) == 3
+
+    # the list view gets the rows of the generator through the default cv_get_items
+    response = client_user_s3file_view.get("/streamedfile/")
+    assert response.status_code == 200
+    assert "images/logo.png" in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_resource_fields_without_table(client_user_s3file_view, monkeypatch):
+    monkeypatch.setattr(S3FileListView, "table_class", None)
+    assert _csv(client_user_s3file_view.get("/s3file/export/"))[:2] == [["key", "size"], ["reports/2026/q1.pdf", "111"]]
+    monkeypatch.setattr(S3FileExportView, "cv_export_fields", ["size"])
+    assert _csv(client_user_s3file_view.get("/s3file/export/")) == [["size"], ["111"], ["222"], ["333"]]
@@ -184,6 +184,47 @@ def test_child_detail_denied_without_parent_view_perm(
     assert response.status_code == 403
 
 
+@pytest.mark.django_db
+def test_child_export_denied_without_parent_perm(client_guardian, user_guardian, publisher_a, book_under_publisher_a):
+    """Child export runs the parent check of the list, also for a user with model-level perms."""
+    from django.contrib.auth.models import Permission
+
+    user_guardian.user_permissions.add(Permission.objects.get(codename="view_book"))
+    response = client_guardian.get(f"/guardian_publisher/{publisher_a.pk}/guardian_book/export/")
+    assert response.status_code == 403
+
+
+@pytest.mark.django_db
+def test_child_export_streams_permitted_rows(
+    client_guardian, user_guardian, cv_guardian_publisher, cv_guardian_book, publisher_a, book_under_publisher_a
+):
+    from tests.test1.app.models import Book
+
+    Book.objects.create(title="Not Permitted", publisher=publisher_a)
+    user_guardian_object_perm(user_guardian, cv_guardian_publisher, "view", publisher_a)
+    user_guardian_object_perm(user_guardian, cv_guardian_book, "view", book_under_publisher_a)
+    response = client_guardian.get(f"/guardian_publisher/{publisher_a.pk}/guardian_book/export/?format=jsonl")
+    assert response.status_code == 200
+    content = b"".join(response.streaming_content).decode()
+    assert "Hitchhiker" in content
+    assert "Not Permitted" not in content
+
+
+def test_list_export_view_must_run_the_parent_check(monkeypatch):
+    from crud_views.lib.views import ExportViewPermissionRequired
+    from tests.test1.app.views import GuardianBookExportView, GuardianBookListView
+
+    def check_ids() -> list:
+        return [m.id for c in GuardianBookListView.checks() for m in c.messages()]
+
+    assert GuardianBookListView.cv_get_export_views() == [GuardianBookExportView]
+    assert "viewset.E286" not in check_ids()
+    monkeypatch.setattr(
+        GuardianBookListView, "cv_get_export_views", classmethod(lambda cls: [ExportViewPermissionRequired])
+    )
+    assert "viewset.E286" in check_ids()
+
+
 # ── cv_has_access ─────────────────────────────────────────────────────────────
 
 
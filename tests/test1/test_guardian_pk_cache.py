@@ -0,0 +1,150 @@
+"""Optional cache of the pks a user holds a guardian object permission on."""
+
+import pytest
+from django.core.cache import caches
+
+from crud_views.lib.settings import crud_views_settings
+from crud_views_guardian.lib import pk_cache
+from tests.lib.helper.guardian import user_guardian_object_perm
+
+
+@pytest.fixture
+def guardian_pk_cache(monkeypatch):
+    from tests.test1.app.views import GuardianAuthorListView
+
+    caches["default"].clear()
+    pk_cache.cache_clear_stats()
+    monkeypatch.setattr(crud_views_settings, "guardian_pk_cache", True)
+    # the app connects the receivers at startup with the setting
+    pk_cache.connect_signals()
+    monkeypatch.setattr(GuardianAuthorListView, "cv_guardian_pk_cache", True)
+    yield
+    caches["default"].clear()
+
+
+def _names(client) -> str:
+    response = client.get("/guardian_author/")
+    assert response.status_code == 200
+    return response.content.decode()
+
+
+@pytest.mark.django_db
+def test_list_reads_cached_pks(
+    guardian_pk_cache, client_guardian, user_guardian, cv_guardian_author, author_douglas_adams, author_b
+):
+    user_guardian_object_perm(user_guardian, cv_guardian_author, "view", author_douglas_adams)
+
+    content = _names(client_guardian)
+    assert "Douglas" in content
+    assert "Pratchett" not in content
+    assert pk_cache.cache_info().misses == 1
+
+    _names(client_guardian)
+    info = pk_cache.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    assert info.hit_rate == 0.5
+
+
+@pytest.mark.django_db
+def test_viewset_assign_and_remove_invalidate(
+    guardian_pk_cache, client_guardian, user_guardian, cv_guardian_author, author_douglas_adams, author_b
+):
+    assert "Douglas" not in _names(client_guardian)
+
+    cv_guardian_author.assign_perm("view", user_guardian, author_douglas_adams)
+    assert "Douglas" in _names(client_guardian)
+
+    cv_guardian_author.remove_perm("view", user_guardian, author_douglas_adams)
+    assert "Douglas" not in _names(client_guardian)
+    assert pk_cache.cache_info().misses == 3
+
+
+@pytest.mark.django_db
+def test_guardian_shortcuts_invalidate_via_signals(
+    guardian_pk_cache, client_guardian, user_guardian, cv_guardian_author, author_douglas_adams
+):
+    from guardian.shortcuts import assign_perm, remove_perm
+
+    perm = cv_guardian_author.permissions["view"]
+    assert "Douglas" not in _names(client_guardian)
+
+    assign_perm(perm, user_guardian, author_douglas_adams)
+    assert "Douglas" in _names(client_guardian)
+
+    remove_perm(perm, user_guardian, author_douglas_adams)
+    assert "Douglas" not in _names(client_guardian)
+
+
+@pytest.mark.django_db
+def test_group_membership_invalidates(
+    guardian_pk_cache, client_guardian, user_guardian, cv_guardian_author, author_douglas_adams
+):
+    from django.contrib.auth.models import Group
+    from guardian.shortcuts import assign_perm
+
+    group = Group.objects.create(name="pk_cache_readers")
+    assign_perm(cv_guardian_author.permissions["view"], group, author_douglas_adams)
+    assert "Douglas" not in _names(client_guardian)
+
+    user_guardian.groups.add(group)
+    assert "Douglas" in _names(client_guardian)
+
+    user_guardian.groups.remove(group)
+    assert "Douglas" not in _names(client_guardian)
+
+
+@pytest.mark.django_db
+def test_accept_global_perms_skips_cache(
+    guardian_pk_cache, client_guardian, user_guardian, cv_guardian_author, author_douglas_adams, monkeypatch
+):
+    from tests.lib.helper.user import user_viewset_permission
+    from tests.test1.app.views import GuardianAuthorListView
+
+    monkeypatch.setattr(GuardianAuthorListView, "cv_guardian_accept_global_perms", True)
+    user_viewset_permission(user_guardian, cv_guardian_author, "view")
+
+    assert "Douglas" in _names(client_guardian)
+    assert pk_cache.cache_info().misses == 0
+
+
+@pytest.mark.django_db
+def test_large_pk_sets_fall_back_to_the_subquery(
+    guardian_pk_cache, client_guardian, user_guardian, cv_guardian_author, author_douglas_adams, author_b, monkeypatch
+):
+    monkeypatch.setattr(crud_views_settings, "guardian_pk_cache_max_pks", 1)
+    user_guardian_object_perm(user_guardian, cv_guardian_author, "view", author_douglas_adams)
+    user_guardian_object_perm(user_guardian, cv_guardian_author, "view", author_b)
+
+    for _ in range(2):
+        content = _names(client_guardian)
+        assert "Douglas" in content and "Pratchett" in content
+    # the set is cached as too large, not loaded again
+    info = pk_cache.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    assert pk_cache.get_permitted_pks(user_guardian, cv_guardian_author.permissions["view"], type(author_b)) is None
+
+
+@pytest.mark.django_db
+def test_disabled_cache_does_not_invalidate(user_guardian, cv_guardian_author, author_douglas_adams, monkeypatch):
+    pk_cache.cache_clear_stats()
+
+    def _fail(model):
+        raise AssertionError("content type looked up without the pk cache")
+
+    monkeypatch.setattr(pk_cache, "_ctype_id", _fail)
+    cv_guardian_author.assign_perm("view", user_guardian, author_douglas_adams)
+    cv_guardian_author.remove_perm("view", user_guardian, author_douglas_adams)
+    assert pk_cache.cache_info().invalidations == 0
+
+
+def test_view_cache_requires_the_setting(monkeypatch):
+    from tests.test1.app.views import GuardianAuthorListView
+
+    def check_ids() -> list:
+        return [m.id for c in GuardianAuthorListView.checks() for m in c.messages()]
+
+    assert "viewset.E285" not in check_ids()
+    monkeypatch.setattr(GuardianAuthorListView, "cv_guardian_pk_cache", True)
+    assert "viewset.E285" in check_ids()
+    monkeypatch.setattr(crud_views_settings, "guardian_pk_cache", True)
+    assert "viewset.E285" not in check_ids()
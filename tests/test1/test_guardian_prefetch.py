@@ -0,0 +1,69 @@
+"""Guardian list and card pages answer all row permissions from one prefetched checker."""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from lxml import html
+
+from tests.lib.helper.guardian import user_guardian_object_perm
+
+
+def _authors(count):
+    from tests.test1.app.models import Author
+
+    return [Author.objects.create(first_name=f"First{idx}", last_name=f"Last{idx}") for idx in range(count)]
+
+
+def _query_count(client, url) -> int:
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(url)
+    assert response.status_code == 200
+    return len(ctx.captured_queries)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url", ["/guardian_author/", "/guardian_author/card/"])
+def test_permission_queries_do_not_grow_with_rows(client_guardian, user_guardian, cv_guardian_author, url):
+    authors = _authors(6)
+    for author in authors[:2]:
+        user_guardian_object_perm(user_guardian, cv_guardian_author, "view", author)
+    _query_count(client_guardian, url)  # warm up content type and session caches
+    few = _query_count(client_guardian, url)
+
+    for author in authors[2:]:
+        user_guardian_object_perm(user_guardian, cv_guardian_author, "view", author)
+    many = _query_count(client_guardian, url)
+
+    assert many == few
+
+
+@pytest.mark.django_db
+def test_prefetched_access_matches_object_perms(client_guardian, user_guardian, cv_guardian_author):
+    douglas, terry = _authors(2)
+    for author in (douglas, terry):
+        user_guardian_object_perm(user_guardian, cv_guardian_author, "view", author)
+    user_guardian_object_perm(user_guardian, cv_guardian_author, "change", terry)
+
+    response = client_guardian.get("/guardian_author/")
+    doc = html.fromstring(response.content)
+    assert not doc.cssselect(f'a[href="/guardian_author/{douglas.pk}/update/"]')
+    assert doc.cssselect(f'a[href="/guardian_author/{terry.pk}/update/"]')
+    assert doc.cssselect(f'a[href="/guardian_author/{douglas.pk}/detail/"][cv-key="detail"]')
+
+
+@pytest.mark.django_db
+def test_has_access_bulk_without_checker(user_guardian, cv_guardian_author):
+    from tests.test1.app.views import GuardianAuthorUpdateView
+
+    douglas, terry = _authors(2)
+    user_guardian_object_perm(user_guardian, cv_guardian_author, "change", terry)
+
+    with CaptureQueriesContext(connection) as ctx:
+        access = GuardianAuthorUpdateView.cv_has_access_bulk(user_guardian, [douglas, terry])
+    assert access == {douglas.pk: False, terry.pk: True}
+    queries = len(ctx.captured_queries)
+
+    more = _authors(3)
+    with CaptureQueriesContext(connection) as ctx:
+        GuardianAuthorUpdateView.cv_has_access_bulk(user_guardian, [douglas, terry, *more])
+    assert len(ctx.captured_queries) == queries
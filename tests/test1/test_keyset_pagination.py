@@ -0,0 +1,204 @@
+"""Keyset (seek) pagination of table and card list views."""
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from lxml import html
+
+from crud_views.lib.keyset import KeysetPaginator, decode_cursor, encode_cursor, keyset_keys, seek
+from tests.lib.helper.user import user_viewset_permission
+from tests.test1.app.models import Author, Book, Publisher
+from tests.test1.app.views import BookListView, PublisherOrderCardListView, cv_book, cv_publisher_order
+
+
+def _signatures(queryset) -> list[str]:
+    return [k.signature for k in keyset_keys(queryset)]
+
+
+def test_keys_complete_the_ordering_with_the_pk():
+    assert _signatures(Book.objects.all()) == ["title", "id"]
+    assert _signatures(Book.objects.order_by("-title")) == ["-title", "-id"]
+    assert _signatures(Book.objects.order_by("title", "pk")) == ["title", "id"]
+
+
+def test_keys_of_a_relation_follow_its_ordering():
+    # Publisher.Meta.ordering = ["name"]
+    assert _signatures(Book.objects.order_by("-publisher")) == ["-publisher__name", "-id"]
+    assert _signatures(Book.objects.order_by("publisher__pk")) == ["publisher__id", "id"]
+
+
+def test_random_ordering_is_rejected():
+    with pytest.raises(ImproperlyConfigured):
+        keyset_keys(Book.objects.order_by("?"))
+
+
+@pytest.mark.django_db
+def test_cursor_must_match_the_ordering(publisher_penguin):
+    Book.objects.create(title="Cursor", publisher=publisher_penguin)
+    keys = keyset_keys(Book.objects.all())
+    record = seek(Book.objects.all(), keys, None).get()
+    cursor = encode_cursor(keys, record, backwards=True)
+
+    assert decode_cursor(keys, cursor) == (["Cursor", record.pk], True)
+    assert decode_cursor(keyset_keys(Book.objects.order_by("-title")), cursor) is None
+    assert decode_cursor(keys, "not-a-cursor") is None
+
+
+def _walk(queryset, per_page: int) -> tuple[list, list]:
+    """All records following the next cursors, then back following the previous cursors."""
+    forward, backward = [], []
+    page = KeysetPaginator(queryset, per_page).page()
+    forward.extend(page)
+    while page.has_next():
+        page = KeysetPaginator(queryset, per_page, cursor=page.next_cursor).page()
+        forward.extend(page)
+    backward[:0] = page
+    while page.has_previous():
+        page = KeysetPaginator(queryset, per_page, cursor=page.previous_cursor).page()
+        backward[:0] = page
+    return forward, backward
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("ordering", ["pseudonym", "-pseudonym", "last_name"])
+def test_walk_with_nulls_and_ties(ordering):
+    for i, pseudonym in enumerate(["b", None, "a", None, "b", "c", None]):
+        Author.objects.create(first_name=f"F{i}", last_name=f"L{i % 2}", pseudonym=pseudonym)
+    queryset = Author.objects.order_by(ordering)
+    expected = list(seek(queryset, keyset_keys(queryset), None))
+
+    forward, backward = _walk(queryset, per_page=2)
+    assert forward == expected
+    assert backward == expected
+
+
+@pytest.fixture
+def keyset_books(publisher_penguin, monkeypatch):
+    monkeypatch.setattr(BookListView, "cv_keyset_pagination", True)
+    monkeypatch.setattr(BookListView, "paginate_by", 4)
+    # the cursor links are rendered by the crud_views table template
+    monkeypatch.setattr(
+        BookListView,
+        "get_table_kwargs",
+        lambda self: {"view": self, "template_name": "crud_views/table/bootstrap5.html"},
+    )
+    for i in range(10):
+        Book.objects.create(title=f"Keyset {i // 2}", publisher=publisher_penguin)  # pairs of equal titles
+    return f"/publisher/{publisher_penguin.pk}/book/"
+
+
+@pytest.fixture
+def client_book(client):
+    user = User.objects.create_user(username="user_keyset", password="password")
+    user_viewset_permission(user, cv_book, "view")
+    client.force_login(user)
+    return client
+
+
+def _link(doc, css: str) -> str | None:
+    links = doc.cssselect(css)
+    return links[0].get("href") if links else None
+
+
+def _table_page(client, url: str) -> tuple[list[str], str | None, str | None]:
+    response = client.get(url)
+    assert response.status_code == 200
+    doc = html.fromstring(response.content)
+    titles = [td.text_content().strip() for td in doc.cssselect("table tbody tr td:nth-child(2)")]
+    return titles, _link(doc, ".pagination .next a"), _link(doc, ".pagination .previous a")
+
+
+@pytest.mark.django_db
+def test_table_pages_by_cursor(client_book, keyset_books):
+    expected = list(Book.objects.order_by("title", "id").values_list("title", flat=True))
+    titles, next_link, previous_link = _table_page(client_book, keyset_books)
+    assert previous_link is None
+    pages = [titles]
+    while next_link:
+        assert "page=" not in next_link
+        titles, next_link, previous_link = _table_page(client_book, keyset_books + next_link)
+        pages.append(titles)
+    assert [len(p) for p in pages] == [4, 4, 2]
+    assert [t for page in pages for t in page] == expected
+
+    titles, _next, _previous = _table_page(client_book, keyset_books + previous_link)
+    assert titles == pages[1]
+
+
+@pytest.mark.django_db
+def test_table_sort_is_the_key(client_book, keyset_books):
+    _titles, next_link, _previous = _table_page(client_book, keyset_books + "?sort=-title")
+    titles, _next, _previous = _table_page(client_book, keyset_books + next_link)
+    assert titles == ["Keyset 2", "Keyset 2", "Keyset 1", "Keyset 1"]
+
+    # a cursor of another sort selects the first page
+    titles, _next, previous_link = _table_page(client_book, keyset_books + next_link.replace("-title", "title"))
+    assert titles == ["Keyset 0", "Keyset 0", "Keyset 1", "Keyset 1"]
+    assert previous_link is None
+
+
+@pytest.mark.django_db
+def test_table_runs_no_count(client_book, keyset_books):
+    client_book.get(keyset_books)  # warm up the per-process permission caches
+    with CaptureQueriesContext(connection) as ctx:
+        client_book.get(keyset_books)
+    book_queries = [q["sql"] for q in ctx.captured_queries if '"app_book"' in q["sql"]]
+    assert len(book_queries) == 1
+    assert "COUNT(" not in book_queries[0]
+    assert "OFFSET" not in book_queries[0]
+
+
+@pytest.fixture
+def client_publisher_order(client, monkeypatch):
+    monkeypatch.setattr(PublisherOrderCardListView, "cv_keyset_pagination", True)
+    for name in ["Charlie", "Alpha", "Bravo", "Delta", "Echo"]:
+        Publisher.objects.create(name=name)
+    user = User.objects.create_user(username="user_keyset_card", password="password")
+    user_viewset_permission(user, cv_publisher_order, "view")
+    client.force_login(user)
+    return client
+
+
+def _card_page(client, url: str) -> tuple[list[str], list[str]]:
+    response = client.get(url)
+    assert response.status_code == 200
+    doc = html.fromstring(response.content)
+    titles = [c.text_content().strip() for c in doc.cssselect(".card.mb-3 .card-title")]
+    return titles, [a.get("href") for a in doc.cssselect(".pagination a.page-link")]
+
+
+@pytest.mark.django_db
+def test_cards_page_by_cursor_in_card_order(client_publisher_order):
+    url = "/publisher_order/card/"
+    titles, links = _card_page(client_publisher_order, url + "?order=name&dir=asc")
+    assert titles == ["Alpha", "Bravo"]
+    assert len(links) == 1 and "order=name" in links[0]
+
+    titles, links = _card_page(client_publisher_order, url + links[0])
+    assert titles == ["Charlie", "Delta"]
+    titles, links = _card_page(client_publisher_order, url + links[1])
+    assert titles == ["Echo"]
+    titles, links = _card_page(client_publisher_order, url + links[0])
+    assert titles == ["Charlie", "Delta"]
+
+
+@pytest.mark.django_db
+def test_cards_keep_the_filter(client_publisher_order):
+    url = "/publisher_order/card/"
+    titles, links = _card_page(client_publisher_order, url + "?name=a&order=name&dir=asc")
+    assert titles == ["Alpha", "Bravo"]  # Alpha, Bravo, Charlie, Delta match
+    page_2 = url + links[0]
+    titles, links = _card_page(client_publisher_order, page_2)
+    assert titles == ["Charlie", "Delta"]
+    assert all("name=a" in link for link in links)
+
+    # the toolbar re-submits the order without the cursor
+    doc = html.fromstring(client_publisher_order.get(page_2).content)
+    assert "cursor" not in [i.get("name") for i in doc.cssselect("input[type=hidden]")]
+
+    # filter persistence restores the query string, cursor included
+    response = client_publisher_order.get(url)
+    assert response.status_code == 302
+    assert response.url == page_2
@@ -0,0 +1,125 @@
+"""Count strategies of paginated table list views."""
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.paginator import EmptyPage
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from lxml import html
+
+import crud_views.lib.count as count_module
+from crud_views.lib.count import CountPaginator, ListCount, count_queryset
+from crud_views.lib.settings import crud_views_settings
+from tests.lib.helper.user import user_viewset_permission
+from tests.test1.app.models import Book, Publisher
+from tests.test1.app.views import BookListView, PublisherListView, cv_book, cv_publisher
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _counts(client, url: str) -> int:
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(url)
+    assert response.status_code == 200
+    return len([q for q in ctx.captured_queries if q["sql"].startswith("SELECT COUNT(*)")])
+
+
+@pytest.fixture
+def client_book(client, publisher_penguin, monkeypatch):
+    monkeypatch.setattr(BookListView, "paginate_by", 2)
+    for i in range(5):
+        Book.objects.create(title=f"Count {i}", publisher=publisher_penguin)
+    user = User.objects.create_user(username="user_count", password="password")
+    user_viewset_permission(user, cv_book, "view")
+    client.force_login(user)
+    client.get(f"/publisher/{publisher_penguin.pk}/book/")  # warm up the per-process permission caches
+    return client
+
+
+@pytest.mark.django_db
+def test_exact_count_runs_once_per_page(client_book, publisher_penguin):
+    url = f"/publisher/{publisher_penguin.pk}/book/"
+    assert _counts(client_book, url) == 1
+    assert _counts(client_book, url + "?page=2") == 1
+
+
+@pytest.mark.django_db
+def test_cached_count_is_shared_between_requests(client_book, publisher_penguin, monkeypatch):
+    monkeypatch.setattr(BookListView, "cv_count", "cached")
+    url = f"/publisher/{publisher_penguin.pk}/book/"
+    assert _counts(client_book, url) == 1
+    assert _counts(client_book, url + "?page=2&sort=-title") == 0
+
+    other = Publisher.objects.create(name="Other House")
+    assert _counts(client_book, f"/publisher/{other.pk}/book/") == 1  # another parent, another count
+
+
+@pytest.mark.django_db
+def test_cached_count_is_keyed_by_the_filter(client, monkeypatch):
+    monkeypatch.setattr(PublisherListView, "cv_count", "cached")
+    for name in ["Alpha", "Beta", "Gamma"]:
+        Publisher.objects.create(name=name)
+    user = User.objects.create_user(username="user_count_filter", password="password")
+    user_viewset_permission(user, cv_publisher, "view")
+    client.force_login(user)
+    client.get("/publisher/?name=")
+
+    assert _counts(client, "/publisher/?name=a") == 1
+    assert _counts(client, "/publisher/?name=a") == 0
+    assert _counts(client, "/publisher/?name=b") == 1
+
+
+@pytest.mark.django_db
+def test_estimate_falls_back_to_exact_below_the_threshold(publisher_penguin, monkeypatch):
+    Book.objects.create(title="Estimate", publisher=publisher_penguin)
+    assert count_queryset(Book.objects.all(), "estimate") == ListCount(1)  # no planner estimate on SQLite
+
+    monkeypatch.setattr(count_module, "planner_estimate", lambda queryset: 500)
+    assert count_queryset(Book.objects.all(), "estimate", estimate_threshold=1000) == ListCount(1)
+    assert count_queryset(Book.objects.all(), "estimate", estimate_threshold=100) == ListCount(500, estimated=True)
+
+
+@pytest.mark.django_db
+def test_estimate_is_shown_as_about(client_book, publisher_penguin, monkeypatch):
+    monkeypatch.setattr(BookListView, "cv_count", "estimate")
+    monkeypatch.setattr(BookListView, "cv_count_estimate_threshold", 0)
+    monkeypatch.setattr(count_module, "planner_estimate", lambda queryset: 8)
+    monkeypatch.setattr(
+        BookListView,
+        "get_table_kwargs",
+        lambda self: {"view": self, "template_name": "crud_views/table/bootstrap5.html"},
+    )
+    url = f"/publisher/{publisher_penguin.pk}/book/"
+    assert _counts(client_book, url) == 0
+
+    doc = html.fromstring(client_book.get(url).content)
+    assert "about 8" in [s.text_content().strip() for s in doc.cssselect(".pagination .page-link")]
+
+    # the estimate is 4 pages, there are 3: the 4th is empty, not an error
+    doc = html.fromstring(client_book.get(url + "?page=4").content)
+    assert doc.cssselect("table tbody tr td:nth-child(2)") == []
+
+
+@pytest.mark.django_db
+def test_paginator_beyond_the_count(publisher_penguin):
+    for i in range(3):
+        Book.objects.create(title=f"Beyond {i}", publisher=publisher_penguin)
+    stale = lambda queryset: ListCount(1)  # noqa: E731
+
+    with pytest.raises(EmptyPage):
+        CountPaginator(Book.objects.all(), 1, counter=stale).page(3)
+    page = CountPaginator(Book.objects.all(), 1, counter=stale, exact=False).page(3)
+    assert [b.title for b in page] == ["Beyond 2"]
+    with pytest.raises(EmptyPage):
+        CountPaginator(Book.objects.all(), 1, counter=stale, exact=False).page(0)
+
+
+def test_invalid_setting_is_reported(monkeypatch):
+    monkeypatch.setattr(crud_views_settings, "list_count", "approximate")
+    assert [m for m in crud_views_settings.check_messages if m.id == "crud_views.E105"]
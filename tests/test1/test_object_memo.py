@@ -0,0 +1,43 @@
+"""cv_memoize_object shares the object of the permission check with the request handler."""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from crud_views.lib.view import CrudView
+from tests.test1.app.models import Author
+
+
+def _author_selects(client, method, url, **kwargs) -> int:
+    with CaptureQueriesContext(connection) as ctx:
+        response = getattr(client, method)(url, **kwargs)
+    assert response.status_code in (200, 302)
+    table = Author._meta.db_table
+    return len([q for q in ctx.captured_queries if q["sql"].startswith(f'SELECT "{table}"')])
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("memoize, expected", [(False, 2), (True, 1)])
+def test_detail_fetches_object(client_user_author_view, author_douglas_adams, monkeypatch, memoize, expected):
+    monkeypatch.setattr(CrudView, "cv_memoize_object", memoize)
+    url = f"/author/{author_douglas_adams.pk}/detail/"
+    assert _author_selects(client_user_author_view, "get", url) == expected
+
+
+@pytest.mark.django_db
+def test_update_post_fetches_object_once(client_user_author_change, author_douglas_adams, monkeypatch):
+    monkeypatch.setattr(CrudView, "cv_memoize_object", True)
+    url = f"/author/{author_douglas_adams.pk}/update/"
+    data = {"first_name": "Douglas Noel", "last_name": "Adams"}
+    assert _author_selects(client_user_author_change, "post", url, data=data) == 1
+    author_douglas_adams.refresh_from_db()
+    assert author_douglas_adams.first_name == "Douglas Noel"
+
+
+@pytest.mark.django_db
+def test_explicit_queryset_is_not_memoized(client_user_author_view, author_douglas_adams, monkeypatch):
+    monkeypatch.setattr(CrudView, "cv_memoize_object", True)
+    response = client_user_author_view.get(f"/author/{author_douglas_adams.pk}/detail/")
+    view = response.context["view"]
+    assert view.get_object() is view.get_object()
+    assert view.get_object(Author.objects.all()) is not view.get_object()
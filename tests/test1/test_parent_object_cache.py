@@ -0,0 +1,87 @@
+"""Parent lookups of a request share one fetch per ancestor level."""
+
+import pytest
+from django.db import connection
+from django.http import Http404
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from tests.lib.helper.user import user_viewset_permission
+from tests.test1.app.models import Book, BookNote, Publisher
+
+
+def make_view(view_class, url, obj=None, **url_kwargs):
+    view = view_class()
+    view.setup(RequestFactory().get(url), **url_kwargs)
+    if obj is not None:
+        view.object = obj
+    return view
+
+
+@pytest.fixture
+def chain():
+    publisher = Publisher.objects.create(name="Penguin Cache")
+    book = Book.objects.create(title="Hitchhiker Cache", publisher=publisher)
+    note = BookNote.objects.create(book=book, note="cached")
+    return publisher, book, note
+
+
+def _note_detail_view(publisher, book, note):
+    from tests.test1.app.views import BookNoteBcDetailView
+
+    return make_view(
+        BookNoteBcDetailView,
+        f"/publisher_bc/{publisher.pk}/book_bc/{book.pk}/booknote_bc/{note.pk}/detail",
+        note,
+        publisher_bc_pk=publisher.pk,
+        book_bc_pk=book.pk,
+        pk=note.pk,
+    )
+
+
+@pytest.mark.django_db
+def test_parent_object_fetched_once(chain, django_assert_num_queries):
+    publisher, book, note = chain
+    view = _note_detail_view(publisher, book, note)
+    with django_assert_num_queries(1):
+        assert view.cv_get_parent_object() == book
+    with django_assert_num_queries(0):
+        assert view.cv_get_parent_object() is view.cv_get_parent_object()
+
+
+@pytest.mark.django_db
+def test_breadcrumb_reuses_parent_object(chain, django_assert_num_queries):
+    publisher, book, note = chain
+    view = _note_detail_view(publisher, book, note)
+    parent = view.cv_get_parent_object()
+    with django_assert_num_queries(0):  # the parent lookup resolved the whole chain
+        view.cv_breadcrumb()
+    assert view.cv_get_ancestor_object(1) == publisher
+    assert view.cv_get_ancestor_object(0) is parent
+
+
+@pytest.mark.django_db
+def test_tampered_parent_chain_raises_404(chain):
+    _publisher, book, note = chain
+    other = Publisher.objects.create(name="Other Cache House")
+    view = _note_detail_view(other, book, note)
+    with pytest.raises(Http404):
+        view.cv_get_parent_object()
+
+
+@pytest.mark.django_db
+def test_child_list_page_fetches_parent_once(client, cv_publisher, cv_book, publisher_penguin):
+    from django.contrib.auth.models import User
+
+    user = User.objects.create_user(username="user_parent_cache", password="password")
+    user_viewset_permission(user, cv_publisher, "view")
+    user_viewset_permission(user, cv_book, "view")
+    client.force_login(user)
+    Book.objects.create(title="Cached Book", publisher=publisher_penguin)
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(f"/publisher/{publisher_penguin.pk}/book/")
+    assert response.status_code == 200
+    table = Publisher._meta.db_table
+    parent_queries = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith(f'SELECT "{table}"')]
+    assert len(parent_queries) == 1
@@ -0,0 +1,163 @@
+"""Declarative select_related / prefetch_related / only / defer on ViewSets and views."""
+
+import re
+
+import django_tables2 as tables
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models import Prefetch
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve
+
+from crud_views.lib.query import accessor_relations, is_covered
+from crud_views.lib.table import Table
+from crud_views.lib.views.mixins import CheckTableRelations
+from tests.lib.helper.user import user_viewset_permission
+from tests.test1.app.models import Book, BookNote, Publisher
+from tests.test1.app.views import BookListView, BookNoteBcListView, PublisherListView, cv_book, cv_book_bc
+
+
+class BookNoteTable(Table):
+    note = tables.Column()
+    book = tables.Column()
+    publisher = tables.Column(accessor="book__publisher__name")
+
+
+class PublisherBooksTable(Table):
+    name = tables.Column()
+    books = tables.Column(accessor="books__count")
+
+
+class BookPublisherTable(Table):
+    title = tables.Column()
+    publisher = tables.Column()
+
+
+class BookPublisherListView(BookListView):  # not registered: cv_viewset is inherited
+    table_class = BookPublisherTable
+    cv_list_actions = []
+
+
+def _book_list_view(publisher):
+    view = BookListView()
+    view.setup(RequestFactory().get(f"/publisher/{publisher.pk}/book/"), publisher_pk=publisher.pk)
+    return view
+
+
+def test_accessor_relations():
+    assert accessor_relations(BookNote, "note") == (None, None)
+    assert accessor_relations(BookNote, "book") == ("book", None)
+    assert accessor_relations(BookNote, "book__publisher__name") == ("book__publisher", None)
+    assert accessor_relations(BookNote, "book.publisher.name") == ("book__publisher", None)
+    assert accessor_relations(Publisher, "books__count") == (None, "books")
+    assert accessor_relations(BookNote, "book__publisher__books") == ("book__publisher", "book__publisher__books")
+    assert accessor_relations(Book, "get_absolute_url") == (None, None)
+
+
+def test_is_covered():
+    assert is_covered("book", ["book__publisher"])
+    assert is_covered("book__publisher", ["book__publisher"])
+    assert not is_covered("book__publisher", ["book"])
+    assert not is_covered("book", ["bookmark"])
+    assert is_covered("books", [Prefetch("books", queryset=Book.objects.all())])
+
+
+@pytest.mark.django_db
+def test_viewset_and_view_options(publisher_penguin, monkeypatch):
+    monkeypatch.setattr(cv_book, "select_related", ["publisher"])
+    monkeypatch.setattr(cv_book, "only", ["title"])
+    monkeypatch.setattr(BookListView, "cv_prefetch_related", ["notes"])
+
+    queryset = _book_list_view(publisher_penguin).get_queryset()
+    assert queryset.query.select_related == {"publisher": {}}
+    assert queryset._prefetch_related_lookups == ("notes",)
+    assert queryset.query.deferred_loading == ({"title"}, False)
+
+    monkeypatch.setattr(BookListView, "cv_select_related", ["publisher__contracts"])
+    monkeypatch.setattr(BookListView, "cv_only", ["id", "title", "publisher"])
+    options = cv_book.get_query_options(_book_list_view(publisher_penguin))
+    assert options["select_related"] == ["publisher", "publisher__contracts"]
+    assert options["only"] == ["id", "title", "publisher"]
+
+
+@pytest.mark.django_db
+def test_child_view_options_do_not_shape_parent_fetch(monkeypatch):
+    publisher = Publisher.objects.create(name="Shaped House")
+    book = Book.objects.create(title="Shaped Book", publisher=publisher)
+    monkeypatch.setattr(BookNoteBcListView, "cv_only", ["note"])
+    monkeypatch.setattr(cv_book_bc, "only", ["title"])  # would exclude the chain's foreign key
+
+    view = BookNoteBcListView()
+    view.setup(RequestFactory().get("/"), publisher_bc_pk=publisher.pk, book_bc_pk=book.pk)
+    assert cv_book_bc.get_query_options(view)["only"] == ["title"]
+    assert view.cv_get_ancestor_object(0) == book
+    assert view.cv_get_ancestor_object(1) == publisher
+
+
+@pytest.mark.django_db
+def test_select_related_removes_per_row_queries(publisher_penguin, monkeypatch):
+    for i in range(5):
+        Book.objects.create(title=f"Book {i}", publisher=publisher_penguin)
+    user = User.objects.create_user(username="user_query_options", password="password")
+    user_viewset_permission(user, cv_book, "view")
+
+    def count_publisher_queries() -> int:
+        url = f"/publisher/{publisher_penguin.pk}/book/"
+        request = RequestFactory().get(url)
+        request.user = user
+        request.resolver_match = resolve(url)
+        with CaptureQueriesContext(connection) as ctx:
+            BookPublisherListView.as_view()(request, publisher_pk=publisher_penguin.pk).render()
+        table = Publisher._meta.db_table
+        return len([q for q in ctx.captured_queries if q["sql"].startswith(f'SELECT "{table}"')])
+
+    without = count_publisher_queries()
+    monkeypatch.setattr(BookPublisherListView, "cv_select_related", ["publisher"])
+    assert count_publisher_queries() == without - 5
+
+
+def _w290(view):
+    return [m for m in CheckTableRelations(context=view).messages() if m.id == "viewset.W290"]
+
+
+def test_check_warns_for_uncovered_relation(monkeypatch):
+    messages = _w290(BookPublisherListView)
+    assert len(messages) == 1
+    assert "»publisher«" in messages[0].msg
+
+    monkeypatch.setattr(BookPublisherListView, "cv_select_related", ["publisher"])
+    assert _w290(BookPublisherListView) == []
+
+
+def test_check_chained_relations(monkeypatch):
+    monkeypatch.setattr(BookNoteBcListView, "table_class", BookNoteTable, raising=False)
+    paths = {re.search(r"relation »([^«]+)«", m.msg).group(1) for m in _w290(BookNoteBcListView)}
+    assert paths == {"book", "book__publisher"}
+    monkeypatch.setattr(BookNoteBcListView, "cv_select_related", ["book__publisher"])
+    assert _w290(BookNoteBcListView) == []
+
+
+def test_check_many_valued_relation(monkeypatch):
+    monkeypatch.setattr(PublisherListView, "table_class", PublisherBooksTable)
+    messages = _w290(PublisherListView)
+    assert len(messages) == 1
+    assert "not in prefetch_related" in messages[0].msg
+    monkeypatch.setattr(PublisherListView, "cv_prefetch_related", ["books"])
+    assert _w290(PublisherListView) == []
+
+
+def test_check_skips_custom_get_queryset():
+    class CustomQuerysetView(BookPublisherListView):
+        def get_queryset(self):
+            return super().get_queryset().select_related("publisher")
+
+    assert _w290(CustomQuerysetView) == []
+
+
+def test_registered_views_have_no_relation_warnings():
+    from crud_views.lib.viewset import ViewSet
+
+    w290 = [m for c in ViewSet.checks_all() for m in c.messages() if getattr(m, "id", None) == "viewset.W290"]
+    assert w290 == [], [w.msg for w in w290]
@@ -101,6 +101,31 @@ def test_cv_get_item_raises_http404():
         Item.cv_get_item(None, "does-not-exist")
 
 
+def test_cv_iter_items_defaults_to_cv_get_items():
+    assert [i.key for i in Item.cv_iter_items(None)] == ["a", "b"]
+
+
+def test_cv_get_items_from_cv_iter_items():
+    read = []
+
+    class Streamed(Resource):
+        key: str
+
+        class Meta:
+            pk_field = "key"
+
+        @classmethod
+        def cv_iter_items(cls, request, **url_kwargs):
+            for key in ["a", "b", "c"]:
+                read.append(key)
+                yield cls(key=key)
+
+    assert [i.key for i in Streamed.cv_get_items(None)] == ["a", "b", "c"]
+    read.clear()
+    assert Streamed.cv_get_item(None, "b").key == "b"
+    assert read == ["a", "b"]  # the scan stops at the match
+
+
 def test_pydantic_validation_still_works():
     with pytest.raises(ValidationError):
         Item(key="a", size="not-an-int")
@@ -0,0 +1,69 @@
+"""The action column resolves each key once per page and feeds forms and buttons from it."""
+
+import pytest
+from lxml import html as lxml_html
+
+from crud_views.lib.view import CrudView
+from tests.lib.helper.user import user_viewset_permission
+
+
+@pytest.fixture
+def client_author_view_change(client, cv_author):
+    from django.contrib.auth.models import User
+
+    user = User.objects.create_user(username="user_author_row_actions", password="password")
+    user_viewset_permission(user, cv_author, "view")
+    user_viewset_permission(user, cv_author, "change")
+    client.force_login(user)
+    return client
+
+
+@pytest.mark.django_db
+def test_action_column_resolves_each_action_once(
+    client_user_author_view, author_douglas_adams, author_terry_pratchett, monkeypatch
+):
+    from tests.test1.app.views import AuthorListView
+
+    calls = []
+    cv_get_action_contexts_bulk = CrudView.cv_get_action_contexts_bulk
+
+    def counting(self, key, objects):
+        objects = list(objects)
+        calls.append((key, sorted(obj.pk for obj in objects)))
+        return cv_get_action_contexts_bulk(self, key, objects)
+
+    monkeypatch.setattr(CrudView, "cv_get_action_contexts_bulk", counting)
+    response = client_user_author_view.get("/author/")
+    assert response.status_code == 200
+
+    # one call per key, covering all rows of the page
+    pks = sorted([author_douglas_adams.pk, author_terry_pratchett.pk])
+    assert calls == [(key, pks) for key in AuthorListView.cv_list_actions]
+
+
+@pytest.mark.django_db
+def test_action_column_renders_forms_and_buttons(client_author_view_change, author_douglas_adams, monkeypatch):
+    from tests.test1.app.views import AuthorListView
+
+    # "up" is a POST action: needs both a hidden form and a button targeting it
+    monkeypatch.setattr(AuthorListView, "cv_list_actions", ["detail", "up"])
+    monkeypatch.setattr(AuthorListView, "cv_context_actions", [])
+    response = client_author_view_change.get("/author/")
+    assert response.status_code == 200
+    tree = lxml_html.fromstring(response.content.decode())
+
+    forms = tree.cssselect(f'form[action="/author/{author_douglas_adams.pk}/up/"]')
+    assert len(forms) == 1
+    assert forms[0].cssselect('input[name="csrfmiddlewaretoken"]')
+    button = tree.cssselect(f'a[data-cv-target="{forms[0].get("id")}"]')
+    assert len(button) == 1
+    assert tree.cssselect(f'a[href="/author/{author_douglas_adams.pk}/detail/"][cv-key="detail"]')
+
+
+@pytest.mark.django_db
+def test_cv_get_row_actions_defaults_to_list_actions(client_user_author_view, author_douglas_adams):
+    response = client_user_author_view.get("/author/")
+    view = response.context["view"]
+    actions = view.cv_get_row_actions(author_douglas_adams)
+    assert [a["cv_key"] for a in actions] == view.cv_list_actions
+    assert [a["cv_key"] for a in view.cv_get_row_actions(author_douglas_adams, keys=["detail"])] == ["detail"]
@@ -0,0 +1,115 @@
+"""cv_get_row_actions_bulk resolves a page's row and card actions with the same result as the per-row path."""
+
+import pytest
+
+from crud_views.lib.views import CardListView
+from tests.lib.helper.user import user_viewset_permission
+
+
+def _per_row(view, obj, keys):
+    return [view.cv_get_context(key=key, obj=obj, user=view.request.user, request=view.request) for key in keys]
+
+
+@pytest.mark.django_db
+def test_list_bulk_matches_cv_get_context(client_user_author_view, author_douglas_adams, author_terry_pratchett):
+    response = client_user_author_view.get("/author/")
+    view = response.context["view"]
+    authors = [author_douglas_adams, author_terry_pratchett]
+
+    bulk = view.cv_get_row_actions_bulk(authors)
+    assert list(bulk) == [a.pk for a in authors]
+    for author in authors:
+        assert bulk[author.pk] == _per_row(view, author, view.cv_list_actions)
+
+
+@pytest.mark.django_db
+def test_list_bulk_object_dependent_labels(client_user_author_view, author_douglas_adams, author_terry_pratchett):
+    from tests.test1.app.views import AuthorDetailView
+
+    response = client_user_author_view.get("/author/")
+    view = response.context["view"]
+    authors = [author_douglas_adams, author_terry_pratchett]
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(AuthorDetailView, "cv_action_short_label_template", None)
+        mp.setattr(AuthorDetailView, "cv_action_short_label_template_code", "{{ object.last_name }}")
+        bulk = view.cv_get_row_actions_bulk(authors, keys=["detail"])
+        assert [bulk[a.pk][0]["cv_action_short_label"] for a in authors] == ["Adams", "Pratchett"]
+        for author in authors:
+            assert bulk[author.pk] == _per_row(view, author, ["detail"])
+
+
+@pytest.mark.django_db
+def test_list_bulk_overridden_cv_get_dict(client_user_author_view, author_douglas_adams, author_terry_pratchett):
+    from tests.test1.app.views import AuthorDetailView
+
+    response = client_user_author_view.get("/author/")
+    view = response.context["view"]
+    authors = [author_douglas_adams, author_terry_pratchett]
+    cv_get_dict = AuthorDetailView.cv_get_dict.__func__
+
+    def cv_get_dict_with_name(cls, context, **extra):
+        return {**cv_get_dict(cls, context, **extra), "name": context.object.last_name}
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(AuthorDetailView, "cv_get_dict", classmethod(cv_get_dict_with_name))
+        assert not AuthorDetailView.cv_is_dict_object_independent()
+        bulk = view.cv_get_row_actions_bulk(authors, keys=["detail"])
+        assert [bulk[a.pk][0]["name"] for a in authors] == ["Adams", "Pratchett"]
+        for author in authors:
+            assert bulk[author.pk] == _per_row(view, author, ["detail"])
+
+
+@pytest.mark.django_db
+def test_list_bulk_unregistered_key_and_empty_page(client_user_author_view, author_douglas_adams):
+    response = client_user_author_view.get("/author/")
+    view = response.context["view"]
+
+    assert view.cv_get_row_actions_bulk([author_douglas_adams], keys=["nope"]) == {author_douglas_adams.pk: [{}]}
+    assert view.cv_get_row_actions_bulk([]) == {}
+
+
+@pytest.fixture
+def client_user_publisher_card(client, cv_publisher, cv_book):
+    from django.contrib.auth.models import User
+
+    user = User.objects.create_user(username="user_pub_card_bulk", password="password")
+    user_viewset_permission(user, cv_publisher, "view")
+    user_viewset_permission(user, cv_book, "view")
+    client.force_login(user)
+    return client
+
+
+@pytest.mark.django_db
+def test_card_page_resolves_actions_once(
+    client_user_author_view, author_douglas_adams, author_terry_pratchett, monkeypatch
+):
+    calls = []
+    cv_get_row_actions_bulk = CardListView.cv_get_row_actions_bulk
+
+    def counting(self, object_list):
+        objects = list(object_list)
+        calls.append(sorted(obj.pk for obj in objects))
+        return cv_get_row_actions_bulk(self, objects)
+
+    monkeypatch.setattr(CardListView, "cv_get_row_actions_bulk", counting)
+    response = client_user_author_view.get("/author/card/")
+    assert response.status_code == 200
+    assert calls == [sorted([author_douglas_adams.pk, author_terry_pratchett.pk])]
+    assert f'href="/author/{author_douglas_adams.pk}/detail/"' in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_card_bulk_matches_single_card(client_user_publisher_card, publisher_penguin, publisher_harpercollins):
+    response = client_user_publisher_card.get("/publisher/card/")
+    view = response.context["view"]
+    publishers = [publisher_penguin, publisher_harpercollins]
+
+    bulk = view.cv_get_row_actions_bulk(publishers)
+    for publisher in publishers:
+        single = [view.cv_get_card_action_contexts(action, [publisher])[0] for action in view.cv_card_actions]
+        assert bulk[publisher.pk] == single
+        detail, books = bulk[publisher.pk]
+        assert detail["cv_label"] == "Details"
+        assert detail["cv_url"] == f"/publisher/{publisher.pk}/detail/"
+        assert books["cv_url"] == f"/publisher/{publisher.pk}/book/"
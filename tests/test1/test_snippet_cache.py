@@ -0,0 +1,30 @@
+from crud_views.lib.settings import crud_views_settings
+from crud_views.lib.view import CrudView
+from crud_views.lib.view.base import cv_get_snippet_template
+
+
+def test_snippet_cache_is_bounded_by_setting():
+    assert cv_get_snippet_template.cache_info().maxsize == crud_views_settings.snippet_cache_size
+
+
+def test_render_snippet_compiles_template_code_once():
+    code = "{{ verbose_name }} #snippet-cache-once"
+    before = cv_get_snippet_template.cache_info()
+
+    first = CrudView.render_snippet({"verbose_name": "Author"}, template_code=code)
+    second = CrudView.render_snippet({"verbose_name": "Book"}, template_code=code)
+
+    after = cv_get_snippet_template.cache_info()
+    # the compiled template is shared, the data is not
+    assert first == "Author #snippet-cache-once"
+    assert second == "Book #snippet-cache-once"
+    assert after.misses == before.misses + 1
+    assert after.hits == before.hits + 1
+    assert cv_get_snippet_template(code) is cv_get_snippet_template(code)
+
+
+def test_render_snippet_template_name_bypasses_cache():
+    before = cv_get_snippet_template.cache_info()
+    CrudView.render_snippet({"verbose_name": "Author"}, template="crud_views/snippets/action/detail.html")
+    after = cv_get_snippet_template.cache_info()
+    assert (after.hits, after.misses) == (before.hits, before.misses)
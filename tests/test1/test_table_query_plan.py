@@ -0,0 +1,157 @@
+"""select_related and only() derived from the columns of a table."""
+
+import django_tables2 as tables
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve
+
+from crud_views.lib.settings import crud_views_settings
+from crud_views.lib.table import LinkChildColumn, LinkDetailColumn, Table
+from crud_views.lib.table.plan import get_table_query_plan
+from crud_views.lib.views.mixins import CheckTableRelations
+from tests.lib.helper.user import user_viewset_permission
+from tests.test1.app.models import Book, BookNote, Publisher
+from tests.test1.app.views import BookListView, BookTable, cv_book
+
+
+class NoteTable(Table):
+    id = LinkDetailColumn()
+    note = tables.Column()
+    publisher = tables.Column(accessor="book__publisher__name")
+
+
+class NoteBookTable(NoteTable):
+    book = tables.Column()  # str() of the book: loaded in full
+
+
+class PublisherChildTable(Table):
+    name = tables.Column()
+    books = LinkChildColumn(name="book")
+
+
+class TemplateTable(Table):
+    note = tables.TemplateColumn("{{ record.book.title }}")
+
+
+class RenderTable(Table):
+    note = tables.Column()
+
+    def render_note(self, record):
+        return record.book.title
+
+
+class PropertyTable(Table):
+    note = tables.Column(accessor="get_absolute_url")
+
+
+class LinkifyTable(Table):
+    note = tables.Column(linkify=lambda record: f"/{record.pk}/")
+
+
+class BookPublisherTable(Table):
+    id = LinkDetailColumn()
+    title = tables.Column()
+    publisher = tables.Column()
+
+
+class BookPlanListView(BookListView):  # not registered: cv_viewset is inherited
+    table_class = BookTable
+    cv_table_query_plan = "only"
+
+
+class BookPublisherPlanListView(BookListView):
+    table_class = BookPublisherTable
+    cv_table_query_plan = "select_related"
+
+
+def test_plan_of_columns():
+    plan = get_table_query_plan(NoteTable, BookNote)
+    assert plan.select_related == ("book__publisher",)
+    assert plan.only == ("book__publisher__name", "id", "note")
+    assert get_table_query_plan(NoteTable, BookNote) is plan
+
+
+def test_whole_relation_is_not_restricted():
+    plan = get_table_query_plan(NoteBookTable, BookNote)
+    assert plan.select_related == ("book__publisher", "book")
+    assert plan.only == ("book", "id", "note")
+
+
+def test_child_link_column_reads_the_pk_only():
+    plan = get_table_query_plan(PublisherChildTable, Publisher)
+    assert plan.select_related == ()
+    assert plan.only == ("id", "name")
+
+
+@pytest.mark.parametrize("table_class", [TemplateTable, RenderTable, PropertyTable, LinkifyTable])
+def test_opaque_columns_disable_only(table_class):
+    assert get_table_query_plan(table_class, BookNote).only is None
+
+
+@pytest.fixture
+def book_page(publisher_penguin):
+    for i in range(5):
+        Book.objects.create(title=f"Plan Book {i}", publisher=publisher_penguin)
+    user = User.objects.create_user(username="user_table_plan", password="password")
+    user_viewset_permission(user, cv_book, "view")
+    url = f"/publisher/{publisher_penguin.pk}/book/"
+
+    def render(view_class) -> list[str]:
+        request = RequestFactory().get(url)
+        request.user = user
+        request.resolver_match = resolve(url)
+        with CaptureQueriesContext(connection) as ctx:
+            response = view_class.as_view()(request, publisher_pk=publisher_penguin.pk).render()
+        assert response.status_code == 200
+        return [q["sql"] for q in ctx.captured_queries]
+
+    render(BookListView)  # warm up the per-process permission caches
+    return render
+
+
+def _selects(queries, model) -> list[str]:
+    return [q for q in queries if q.startswith(f'SELECT "{model._meta.db_table}"')]
+
+
+def _columns(query: str) -> str:
+    return query.split(" FROM ")[0]
+
+
+@pytest.mark.django_db
+def test_only_projects_rendered_fields(book_page, monkeypatch):
+    with_plan = book_page(BookPlanListView)
+    monkeypatch.setattr(BookPlanListView, "cv_table_query_plan", None)
+    without = book_page(BookPlanListView)
+
+    assert len(with_plan) == len(without)  # no deferred field is loaded per row
+    assert '"app_book"."publisher_id"' not in _columns(_selects(with_plan, Book)[-1])
+    assert '"app_book"."publisher_id"' in _columns(_selects(without, Book)[-1])
+
+
+@pytest.mark.django_db
+def test_declared_only_wins(book_page, monkeypatch):
+    monkeypatch.setattr(BookPlanListView, "cv_only", ["id", "title", "publisher"])
+    assert '"app_book"."publisher_id"' in _columns(_selects(book_page(BookPlanListView), Book)[-1])
+
+
+@pytest.mark.django_db
+def test_select_related_plan(book_page, monkeypatch):
+    queries = book_page(BookPublisherPlanListView)
+    assert 'INNER JOIN "app_publisher"' in _selects(queries, Book)[-1]
+    with_plan = len(_selects(queries, Publisher))
+    monkeypatch.setattr(BookPublisherPlanListView, "cv_table_query_plan", None)
+    assert len(_selects(book_page(BookPublisherPlanListView), Publisher)) == with_plan + 5
+
+
+def test_check_counts_derived_joins(monkeypatch):
+    assert list(CheckTableRelations(context=BookPublisherPlanListView).messages()) == []
+    monkeypatch.setattr(BookPublisherPlanListView, "cv_table_query_plan", None)
+    assert len(list(CheckTableRelations(context=BookPublisherPlanListView).messages())) == 1
+
+
+def test_invalid_setting_is_reported(monkeypatch):
+    monkeypatch.setattr(crud_views_settings, "table_query_plan", "all")
+    assert [m for m in crud_views_settings.check_messages if m.id == "crud_views.E104"]
@@ -0,0 +1,100 @@
+"""Compiled URL builders produce the same URLs as reverse()."""
+
+import re
+
+import pytest
+from django.test import override_settings
+from django.urls import NoReverseMatch, include, path, reverse, set_script_prefix
+
+from crud_views.lib import url_builder
+from crud_views.lib.exceptions import CrudViewError
+from crud_views.lib.settings import crud_views_settings
+from crud_views.lib.url_builder import cv_reverse, get_url_builder
+
+PK = "3f2b6c1e-9a4d-4e1f-8b7a-2c5d9e0f1a2b"
+
+
+def _urlpatterns():
+    from tests.test1.app.views import cv_author
+
+    return [
+        path("ns/", include((cv_author.urlpatterns, "nsapp"), namespace="nsapp")),
+        path("<int:tenant>/", include((cv_author.urlpatterns, "tenant"), namespace="tenant")),
+    ]
+
+
+class NamespacedUrls:
+    @property
+    def urlpatterns(self):
+        return _urlpatterns()
+
+
+@pytest.fixture
+def parity(monkeypatch):
+    monkeypatch.setattr(crud_views_settings, "url_builder", "parity")
+
+
+@pytest.fixture
+def script_prefix():
+    set_script_prefix("/sub/")
+    yield
+    set_script_prefix("/")
+
+
+@pytest.mark.django_db
+def test_builder_matches_reverse(author_douglas_adams):
+    kwargs = {"pk": author_douglas_adams.pk}
+    assert get_url_builder("author-detail") is not None
+    assert cv_reverse("author-detail", kwargs) == reverse("author-detail", kwargs=kwargs)
+    assert cv_reverse("author-list", {}) == reverse("author-list")
+
+
+def test_builder_compiled_once():
+    assert get_url_builder("author-list") is get_url_builder("author-list")
+
+
+def test_script_prefix(script_prefix, parity):
+    assert cv_reverse("author-detail", {"pk": PK}) == f"/sub/author/{PK}/detail/"
+
+
+def test_namespace_and_include_prefix(parity):
+    with override_settings(ROOT_URLCONF=NamespacedUrls()):
+        assert cv_reverse("nsapp:author-detail", {"pk": PK}) == f"/ns/author/{PK}/detail/"
+        # converters in an include() prefix are left to reverse()
+        assert get_url_builder("tenant:author-detail") is None
+        assert cv_reverse("tenant:author-detail", {"tenant": 3, "pk": PK}) == f"/3/author/{PK}/detail/"
+
+
+def test_url_conf_change_recompiles():
+    before = get_url_builder("author-list")
+    with override_settings(ROOT_URLCONF=NamespacedUrls()):
+        assert get_url_builder("author-list") is None  # only namespaced names in this URLconf
+    assert get_url_builder("author-list") == before
+
+
+def test_mismatching_kwargs_fall_back_to_reverse():
+    with pytest.raises(NoReverseMatch):
+        cv_reverse("author-detail", {"pk": "not-a-uuid"})
+    with pytest.raises(NoReverseMatch):
+        cv_reverse("author-detail", {})
+
+
+def test_parity_mode_raises_on_difference(parity, monkeypatch):
+    builder = get_url_builder("author-list")._replace(result="other/", regex=re.compile(".*"))
+    monkeypatch.setattr(url_builder, "get_url_builder", lambda name: builder)
+    with pytest.raises(CrudViewError):
+        cv_reverse("author-list", {})
+
+
+@pytest.mark.django_db
+def test_pages_in_parity_mode(parity, client_user_author_view, author_douglas_adams, author_b):
+    response = client_user_author_view.get("/author/")
+    assert response.status_code == 200
+    assert f"/author/{author_douglas_adams.pk}/detail/" in response.content.decode()
+    response = client_user_author_view.get(f"/author/{author_douglas_adams.pk}/detail/")
+    assert response.status_code == 200
+
+
+def test_invalid_mode_is_reported(monkeypatch):
+    monkeypatch.setattr(crud_views_settings, "url_builder", "fast")
+    assert [m for m in crud_views_settings.check_messages if m.id == "crud_views.E103"]
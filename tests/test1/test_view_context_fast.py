@@ -0,0 +1,63 @@
+"""Internal per-row paths build an unvalidated ViewContext."""
+
+import pytest
+from django.test import RequestFactory
+from django.urls import resolve
+
+from crud_views.lib.view import ViewContext
+
+
+@pytest.fixture
+def list_view(user_author_view):
+    from tests.test1.app.views import AuthorListView
+
+    view = AuthorListView()
+    request = RequestFactory().get("/author/")
+    request.user = user_author_view
+    request.resolver_match = resolve("/author/")
+    view.setup(request)
+    return view
+
+
+@pytest.mark.django_db
+def test_fast_context_matches_validated(list_view, author_douglas_adams):
+    fast = list_view.cv_get_fast_view_context(author_douglas_adams)
+    validated = list_view.cv_get_view_context(object=author_douglas_adams)
+    # the public type: hooks may dump, copy or type-check the context
+    assert type(fast) is ViewContext
+    assert fast == validated
+    assert fast.model_dump() == validated.model_dump()
+    assert fast.model_copy(update={"object": None}).object is None
+    assert fast.to_dict() == validated.to_dict()
+    assert list_view.cv_get_fast_view_context().object is None
+
+
+@pytest.mark.django_db
+def test_cv_get_context_uses_fast_context(list_view, author_douglas_adams, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("validated ViewContext built on the row path")
+
+    monkeypatch.setattr(ViewContext, "__init__", fail)
+    ctx = list_view.cv_get_context("detail", obj=author_douglas_adams, user=list_view.request.user)
+    assert ctx["cv_access"] is True
+
+
+@pytest.mark.django_db
+def test_overridden_view_context_is_kept(list_view, author_douglas_adams, monkeypatch):
+    class CustomContext(ViewContext):
+        pass
+
+    monkeypatch.setattr(type(list_view), "cv_get_view_context", lambda self, **kw: CustomContext(view=self, **kw))
+    assert isinstance(list_view.cv_get_fast_view_context(author_douglas_adams), CustomContext)
+
+
+@pytest.mark.django_db
+def test_template_tag_normalizes_empty_object(client_user_author_view, author_douglas_adams):
+    # list rows call {% cv_list_action key record %}; "" must still mean "no object"
+    from crud_views.templatetags.crud_views import cv_get_context
+
+    response = client_user_author_view.get("/author/")
+    context = {"view": response.context["view"], "request": response.wsgi_request}
+    assert cv_get_context(context, "create", "") == cv_get_context(context, "create", None)
+    with pytest.raises(ValueError):
+        cv_get_context(context, "detail", object())
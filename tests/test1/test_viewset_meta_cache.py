@@ -0,0 +1,48 @@
+"""ViewSet.get_meta computes its names once per active language."""
+
+import pytest
+from django.utils import translation
+
+import crud_views.lib.viewset as viewset_module
+from crud_views.lib.view.context import ViewContext
+
+
+@pytest.fixture
+def gettext_calls(monkeypatch):
+    calls = []
+    gettext = viewset_module._
+
+    def counting(message):
+        calls.append(message)
+        return gettext(message)
+
+    monkeypatch.setattr(viewset_module, "_", counting)
+    return calls
+
+
+@pytest.fixture
+def cv_meta_author(cv_author):
+    cv_author._meta_cache.clear()
+    yield cv_author
+    cv_author._meta_cache.clear()
+
+
+@pytest.mark.django_db
+def test_names_translated_once_per_language(cv_meta_author, gettext_calls, author_douglas_adams):
+    for obj in (None, author_douglas_adams, None):
+        data = cv_meta_author.get_meta(ViewContext.model_construct(view=None, object=obj))
+        assert data["object"] is obj
+        assert data["verbose_name"] == "Author"
+    assert len(gettext_calls) == 2
+
+    with translation.override("de"):
+        cv_meta_author.get_meta(ViewContext.model_construct(view=None))
+        cv_meta_author.get_meta(ViewContext.model_construct(view=None))
+    assert len(gettext_calls) == 4
+
+
+@pytest.mark.django_db
+def test_callers_do_not_share_the_returned_dict(cv_meta_author):
+    data = cv_meta_author.get_meta(ViewContext.model_construct(view=None))
+    data["verbose_name"] = "changed"
+    assert cv_meta_author.get_meta(ViewContext.model_construct(view=None))["verbose_name"] == "Author"